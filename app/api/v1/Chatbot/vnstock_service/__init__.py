@@ -1,6 +0,0 @@
-from .get_data import Vnstockk
-from .finance_info import FinanceInfo
-from .company_info import CompanyInfo
-from .service import VNStockService
-
-__all__ = ['Vnstockk', 'FinanceInfo', 'CompanyInfo', 'VNStockService']
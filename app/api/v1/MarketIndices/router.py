@@ -6,13 +6,15 @@ import asyncio
 import time
 
 # Fix relative import
-from .services import Market_indices
+from app.core.services import market_indices_service
+from app.core.log import get_logger
 from .schemas import MarketIndexResponse
 
 router = APIRouter(tags=["Market Indices"])
+log = get_logger(__name__)
 
-# Sử dụng một instance duy nhất cho toàn bộ ứng dụng
-market_indices_instance = Market_indices()
+# Service dùng chung với API v1/v2 (tạo ở request đầu tiên, cache chỉ số chỉ có một bản)
+market_indices_instance = market_indices_service
 
 @router.get("/indices/{index_code}", response_model=MarketIndexResponse)
 async def get_market_indices(index_code: str = "VNINDEX", top: int = 90):
@@ -22,9 +24,9 @@ async def get_market_indices(index_code: str = "VNINDEX", top: int = 90):
     try:
         # Sử dụng instance toàn cục thay vì tạo mới
         start_time = time.time()
-        market_indices_data = market_indices_instance.get_market_indices(index_code, top)
+        market_indices_data = await asyncio.to_thread(market_indices_instance.get_market_indices, index_code, top)
         elapsed = time.time() - start_time
-        print(f"Retrieved {index_code} data in {elapsed:.2f} seconds")
+        log.debug("market_indices.request", api="v1", index=index_code, seconds=round(elapsed, 3))
         
         # Nếu mảng dữ liệu trống, đánh dấu đây là dữ liệu không khả dụng (N/A)
         is_na = len(market_indices_data) == 0
@@ -41,7 +43,7 @@ async def get_market_indices(index_code: str = "VNINDEX", top: int = 90):
             }
         )
     except Exception as e:
-        print(f"Error in get_market_indices API: {e}")
+        log.exception("market_indices.request_failed", api="v1", index=index_code)
         # Return N/A flag when error
         return JSONResponse(
             status_code=200,
@@ -55,7 +57,7 @@ async def get_market_indices(index_code: str = "VNINDEX", top: int = 90):
 
 # Hàm async để tải một chỉ số
 async def fetch_index_data(index_code: str, top: int = 90):
-    return index_code, market_indices_instance.get_market_indices(index_code, top)
+    return index_code, await asyncio.to_thread(market_indices_instance.get_market_indices, index_code, top)
 
 @router.get("/indices", response_model=MarketIndexResponse)
 async def get_default_indices(top: int = 90):
@@ -63,7 +65,6 @@ async def get_default_indices(top: int = 90):
     Get default market indices (VNINDEX, HNXINDEX, UPCOMINDEX, VN30, HNX30)
     """
     try:
-        print("Starting to fetch all indices data...")
         total_start_time = time.time()
         
         vnindex_future = asyncio.create_task(fetch_index_data("VNINDEX", top))
@@ -83,7 +84,7 @@ async def get_default_indices(top: int = 90):
             results_status[index_code] = len(data) == 0
         
         total_elapsed = time.time() - total_start_time
-        print(f"Fetched all indices data in {total_elapsed:.2f} seconds")
+        log.debug("market_indices.request_all", api="v1", seconds=round(total_elapsed, 3))
         
         return JSONResponse(
             content={
@@ -103,7 +104,7 @@ async def get_default_indices(top: int = 90):
             }
         )
     except Exception as e:
-        print(f"Error in get_default_indices API: {e}")
+        log.exception("market_indices.request_all_failed", api="v1")
         # Tất cả các chỉ số đều không khả dụng khi có lỗi
         return JSONResponse(
             status_code=200,
@@ -1,7 +1,18 @@
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
-from .services import MarketIndicesAdjustDayService
+import asyncio
 from .schemas import MarketIndicesResponse
+from app.core.services import adjust_day_service
+
+# Khoảng ngày và interval của API v1 (giữ nguyên hợp đồng cũ): v2 chọn interval theo max_points
+# và lùi về phiên trước cho 1D, v1 thì không
+V1_RANGES = {
+    "1D": (1, '1m'),
+    "3M": (90, '1H'),
+    "6M": (180, '1H'),
+    "1Y": (365, '1D'),
+    "2Y": (730, '1D'),
+}
 
 router = APIRouter(
     prefix="/adjust-day",
@@ -21,8 +32,13 @@ async def get_adjusted_market_indices(symbol: str, time: str) -> Dict[str, Any]:
     - Market indices data with price-date pairs
     """
     try:
-        service = MarketIndicesAdjustDayService()
-        data = service.get_adjusted_data(symbol=symbol, time=time)
+        days, interval = V1_RANGES.get(time, (None, None))
+        # v1 luôn trả ngày dạng YYYY-MM-DD (kể cả dữ liệu trong ngày), như trước khi dùng chung service
+        data = [
+            {"price": item["price"], "date": item["date"][:10]}
+            for item in await asyncio.to_thread(adjust_day_service.get_adjusted_data, symbol, time,
+                                                None, "lttb", interval, days)
+        ]
         
         if not data:
             return {
@@ -1,10 +1,10 @@
 from fastapi import APIRouter, HTTPException, Query
-from .services import news
+from app.core.services import news_service
 from .schemas import NewsResponse, NewsItem, TopNewsResponse
 from typing import List
+import asyncio
 
 router = APIRouter()
-news_service = news()
 
 @router.get("/top/latest", response_model=TopNewsResponse)
 async def get_top_stocks_news():
@@ -12,7 +12,7 @@ async def get_top_stocks_news():
     Get the latest 10 news from the top 5 stocks by market capitalization
     """
     try:
-        news_data = news_service.get_top_stocks_news(limit=10)
+        news_data = await asyncio.to_thread(news_service.get_top_stocks_news, limit=10)
         if not news_data:
             return TopNewsResponse(news=[])
         
@@ -35,7 +35,7 @@ async def get_stock_news(symbol: str):
     Get news for a specific stock by its symbol
     """
     try:
-        news_data = news_service.get_news(symbol)
+        news_data = await asyncio.to_thread(news_service.get_news, symbol)
         if not news_data:
             return NewsResponse(symbol=symbol, news=[])
         
@@ -1,99 +0,0 @@
-import os
-import google.generativeai as genai
-from dotenv import load_dotenv
-
-def configure_api():
-    """Configure and authenticate the API"""
-    load_dotenv()
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("API Key is not set. Please check the .env file.")
-    genai.configure(api_key=api_key)
-
-def create_analysis_prompt(balance_sheet, income_statement, profitability_analysis):
-    """Create the prompt for financial analysis"""
-    return f""" 
-Bạn là một chuyên gia phân tích tài chính chuyên về phân tích cơ bản cổ phiếu. Hãy đánh giá rủi ro và triển vọng đầu tư của mã cổ phiếu dựa trên các chỉ số tài chính và thông tin sausau.
-Giữ văn phong chuyên nghiệp và báo cáo dưới 300 từ.
-
-Cho các dữ liệu báo cáo tài chính sau:  
-Bảng cân đối kế toán (Balance Sheet):
-{balance_sheet}  
-Báo cáo thu nhập (Income Statement):
-{income_statement}  
-Phân tích khả năng sinh lời (Profitability Analysis):
-{profitability_analysis} 
-Hãy lấy các chỉ số tài chính từ các dữ liệu trên và đánh giá rủi ro và triển vọng đầu tư của mã cổ phiếu. kkhi đưa ra so sánh hoặc đánh giá nên trích dẫn số liệu cụ thể.
-Nhận xét với văn phong và từ ngữ nên được tham khảo sau đây, khi đưa ra so sánh hoặc đánh giá nên trích dẫn số liệu cụ thể lấy từ dữ liệu đã chocho:
-Yêu cầu phân tích:
-
-- PHÂN TÍCH TÀI CHÍNH:
-Một đoạn văn dưới 200 từ, phân tích các chỉ số tài chính quan trọng sau:
-Doanh thu và Lợi nhuận ròng: Xu hướng tăng trưởng qua các năm.
-Biên lợi nhuận gộp (Gross Margin), biên lợi nhuận ròng (Net Profit Margin): So sánh với trung bình ngành.
-Tỷ lệ giá trên thu nhập (P/E): Tỷ lệ này đo lường mối quan hệ giữa giá cổ phiếu và thu nhập của công ty. P/E càng cao thì cổ phiếu càng được định giá cao.
-Tỷ lệ giá trên giá trị sổ sách (P/B): Tỷ lệ này đo lường mối quan hệ giữa giá cổ phiếu và giá trị sổ sách của công ty. P/B càng thấp thì cổ phiếu càng được định giá thấp.
-Tỷ lệ lợi nhuận trên vốn chủ sở hữu (ROE): Tỷ lệ này đo lường khả năng sinh lời của công ty trên vốn chủ sở hữu. ROE càng cao thì công ty càng có khả năng tạo ra lợi nhuận.
-Tỷ lệ lợi nhuận trên tài sản (ROA): Tỷ lệ này đo lường khả năng sinh lời của công ty trên tổng tài sản. ROA càng cao thì công ty càng có khả năng tạo ra lợi nhuận từ tài sản của mình.
-Tỷ lệ nợ trên vốn chủ sở hữu (D/E): Tỷ lệ này đo lường mức độ đòn bẩy tài chính của công ty. D/E càng cao thì công ty càng phụ thuộc vào nợ vay.
-EBITDA: EBITDA là chỉ số đo lường lợi nhuận trước thuế, lãi vay, khấu hao và chi phí khấu hao.
-Hãy đưa ra nhận xét ngắn gọn về tình hình tài chính.
-
-- PHÂN TÍCH RỦI RO:
-Đoạn văn dưới 200 từ đánh giá được rủi ro tài chính (nợ vay, thanh khoản, dòng tiền).
-
-- ĐÁNH GIÁ TRIỂN VỌNG ĐẦU TƯ:
-Đoạn văn ngắn đánh giá ttiềm năng tăng trưởng lợi nhuận và biên lợi nhuận.
-
-Định dạng đầu ra mong muốn: Đoạn văn nhận xét súc tích, logic (khoảng bé hơn 300 từ)
-Có kết luận rõ ràng về tiềm năng đầu tư của mã cổ phiếu.
-- TUYỆT ĐỐI PHẢI TIẾT KIỆM SỐ TRANG SỬ DỤNG. HÃY GHI CÁC NỘI DUNG GẦN VỚI NHAU NHẤT CÓ THỂ, TRÁNH TÌNH TRẠNG VIẾT NỘI DUNG VÀO FILE MÀ MỖI CÁC NỘI DUNG DÙNG 1 TRẠNG. TIẾT KIỆM NHẤT CÓ THỂ NHÉ.
-- KHÔNG ĐƯỢC XUỐNG DÒNG 2 LẦN TRONG MỌI TÌNH HUỐNG.
-"""
-
-def generate_financial_analysis(balance_sheet=None, income_statement=None, profitability_analysis=None, custom_prompt=None):
-    """Generate financial analysis from the API"""
-    # Configure API if not already done
-    try:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            configure_api()
-    except:
-        configure_api()
-        
-    generation_config = {
-        "temperature": 0,
-        "top_p": 0.95,
-        "top_k": 64,
-        "max_output_tokens": 8192,
-        "response_mime_type": "text/plain",
-    }
-
-    safety_settings = [
-        {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-        {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-        {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-        {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-    ]
-
-    model = genai.GenerativeModel(
-        model_name="gemini-2.0-flash-exp",
-        safety_settings=safety_settings,
-        generation_config=generation_config,
-        system_instruction="Chatbot này sẽ hoạt động như một broker chứng khoán chuyên nghiệp..."
-    )
-
-    try:
-        # Use custom prompt if provided, otherwise generate from financial data
-        if custom_prompt:
-            prompt = custom_prompt
-        elif balance_sheet and income_statement and profitability_analysis:
-            prompt = create_analysis_prompt(balance_sheet, income_statement, profitability_analysis)
-        else:
-            prompt = "Provide a general financial market analysis and investment recommendations."
-            
-        response = model.generate_content(prompt)
-        return response.text
-    except Exception as e:
-        print(f"API error: {str(e)}")
-        return f"Error generating analysis: {str(e)}"
@@ -1,11 +1,35 @@
-from fastapi import APIRouter
-from fastapi.responses import FileResponse
-from . import services
+from fastapi import APIRouter, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
 from .schemas import AnalysisResponse
+# v1 dùng chung bộ tạo báo cáo của v2 (kể cả report worker), nên nội dung PDF là báo cáo v2:
+# tên công ty lấy từ overview (short_name) và bảng dự phóng theo analyze_stock_data_2025_2026_p1.
+# Đây là thay đổi so với báo cáo v1 cũ; route được đánh dấu deprecated và trả header Deprecation/Link.
+from app.api.v2.report.router import get_pdf, get_pdf_job
 
 router = APIRouter()
 
-@router.get("/pdf/{symbol}")
-def get_pdf(symbol: str):
-    file_path = services.generate_pdf_report(symbol)
-    return FileResponse(file_path, media_type="application/pdf", filename=f"Financial_Report_{symbol}.pdf")
+V1_PDF_DESCRIPTION = (
+    "Deprecated: trả về báo cáo PDF của v2 (tên công ty và bảng dự phóng khác báo cáo v1 cũ). "
+    "Dùng /api/v2/pdf/{symbol}."
+)
+
+def _mark_deprecated(result, successor: str):
+    response = result if isinstance(result, Response) else JSONResponse(jsonable_encoder(result))
+    response.headers["Deprecation"] = "true"
+    response.headers["Link"] = f'<{successor}>; rel="successor-version"'
+    return response
+
+async def get_pdf_v1(symbol: str, request: Request):
+    result = await get_pdf(symbol, request)
+    return _mark_deprecated(result, request.url_for("get_pdf", symbol=symbol).path)
+
+async def get_pdf_job_v1(job_id: str, request: Request):
+    result = await get_pdf_job(job_id, request)
+    return _mark_deprecated(result, request.url_for("get_pdf_job", job_id=job_id).path)
+
+router.add_api_route("/pdf/{symbol}", get_pdf_v1, methods=["GET"], name="get_pdf_v1",
+                     deprecated=True, description=V1_PDF_DESCRIPTION)
+# Khi USE_REPORT_WORKER=true, get_pdf có thể trả 202 kèm status_url trỏ tới route này
+router.add_api_route("/pdf/jobs/{job_id}", get_pdf_job_v1, methods=["GET"], name="get_pdf_job_v1",
+                     deprecated=True, description=V1_PDF_DESCRIPTION)
@@ -1,974 +0,0 @@
-import datetime
-import os
-import pandas as pd
-import numpy as np
-from .module_report.data_processing import read_data, clean_column_names, standardize_columns, merge_balance_sheets, get_values
-from .module_report.finance_calc import (calculate_total_current_assets, calculate_ppe, calculate_total_assets, 
-                                        calculate_ebitda, calculate_financial_ratios, calculate_total_operating_expense,
-                                        calculate_net_income_before_taxes, calculate_net_income_before_extraordinary_items,
-                                        get_market_data, current_price, predict_price, doanhthu_thuan_p2, loinhuan_gop_p2,
-                                        chiphi_p2, loinhuankinhdoanh_p2)
-from .module_report.generate_pdf import PDFReport, generate_page4_pdf, generate_page5_pdf, generate_page6_pdf
-from .module_report.api_gemini import generate_financial_analysis, create_analysis_prompt
-from .module_report.chart_generator import generate_financial_charts
-from vnstock import Vnstock
-
-def get_company_industry(symbol):
-    try:
-        stock = Vnstock().stock(symbol=symbol, source='VCI')
-        symbols_by_industry = stock.listing.symbols_by_industries()
-        company_info = symbols_by_industry[symbols_by_industry['symbol'].str.upper() == symbol.upper()]
-        if not company_info.empty and 'icb_name4' in company_info.columns:
-            icb_name4_value = company_info['icb_name4'].values[0]
-            return icb_name4_value
-        return "Không xác định"
-    except Exception as e:
-        print(f"Lỗi khi lấy thông tin ngành nghề: {str(e)}")
-        return "Không xác định"
-def get_company_name(symbol):
-    try:
-        company = Vnstock().stock(symbol=symbol, source='TCBS').company
-        profile = company.profile()
-        if profile.empty or 'company_name' not in profile.columns:
-            return f"{symbol}"  # Trả về symbol nếu không lấy được tên
-        return profile['company_name'].values[0]
-    except Exception as e:
-        print(f"Lỗi khi lấy tên công ty cho {symbol}: {str(e)}")
-        return f"{symbol}"
-
-# Thêm hàm để tạo dữ liệu dự phóng
-def create_projection_data(symbol):
-    """Tạo dữ liệu dự phóng cho báo cáo"""
-    try:
-        # Khởi tạo cấu trúc dữ liệu trống với các giá trị N/A
-        projection_data = {
-            'revenue': ['N/A', 'N/A', 'N/A', 'N/A', 'N/A'],
-            'gross_profit': ['N/A', 'N/A', 'N/A', 'N/A', 'N/A'],
-            'gross_margin': ['N/A', 'N/A', 'N/A', 'N/A', 'N/A'],
-            'financial_expense': ['N/A', 'N/A', 'N/A', 'N/A', 'N/A'],
-            'selling_expense': ['N/A', 'N/A', 'N/A', 'N/A', 'N/A'],
-            'admin_expense': ['N/A', 'N/A', 'N/A', 'N/A', 'N/A'],
-            'operating_profit': ['N/A', 'N/A', 'N/A', 'N/A', 'N/A'],
-            'profit_before_tax': ['N/A', 'N/A', 'N/A', 'N/A', 'N/A'],
-            'profit_after_tax': ['N/A', 'N/A', 'N/A', 'N/A', 'N/A']
-        }
-        
-        # Lấy dữ liệu doanh thu thuần từ API
-        try:
-            doanh_thu, yoy = doanhthu_thuan_p2(symbol)
-            
-            # In thông tin debug
-            print(f"DEBUG - Dữ liệu từ doanhthu_thuan_p2: doanh_thu={doanh_thu}, yoy={yoy}, types: {type(doanh_thu)}, {type(yoy)}")
-            
-            # Chuyển đổi doanh thu từ đồng sang tỷ đồng - giá trị trả về từ API là đơn vị đồng
-            doanh_thu_ty = doanh_thu / 1_000_000_000 if isinstance(doanh_thu, (int, float, np.int64, np.float64)) else None
-            
-            # Định dạng dữ liệu doanh thu thuần
-            doanh_thu_str = f"{doanh_thu_ty:,.2f}" if doanh_thu_ty is not None else 'N/A'
-            yoy_str = f"+{yoy*100:.1f}%" if isinstance(yoy, (int, float)) and yoy > 0 else f"{yoy*100:.1f}%" if isinstance(yoy, (int, float)) else 'N/A'
-            
-            # Cập nhật dữ liệu doanh thu thuần
-            projection_data['revenue'] = [doanh_thu_str, yoy_str, 'N/A', 'N/A', 'N/A']
-            
-            print(f"Đã lấy dữ liệu doanh thu thuần cho {symbol}: {doanh_thu_str} tỷ đồng ({yoy_str})")
-            
-            # Lấy dữ liệu lợi nhuận gộp
-            try:
-                bienloinhuangop, loinhuangop, yoy_loinhuangop = loinhuan_gop_p2(symbol)
-                
-                # In thông tin debug
-                print(f"DEBUG - Dữ liệu từ loinhuan_gop_p2: bienloinhuangop={bienloinhuangop}, loinhuangop={loinhuangop}, yoy_loinhuangop={yoy_loinhuangop}")
-                
-                # Chuyển đổi lợi nhuận gộp từ đồng sang tỷ đồng
-                loinhuangop_ty = loinhuangop / 1_000_000_000 if isinstance(loinhuangop, (int, float, np.int64, np.float64)) else None
-                
-                # Định dạng dữ liệu lợi nhuận gộp
-                loinhuangop_str = f"{loinhuangop_ty:,.2f}" if loinhuangop_ty is not None else 'N/A'
-                yoy_loinhuangop_str = f"+{yoy_loinhuangop*100:.1f}%" if isinstance(yoy_loinhuangop, (int, float)) and yoy_loinhuangop > 0 else f"{yoy_loinhuangop*100:.1f}%" if isinstance(yoy_loinhuangop, (int, float)) else 'N/A'
-                
-                # Cập nhật dữ liệu lợi nhuận gộp
-                projection_data['gross_profit'] = [loinhuangop_str, yoy_loinhuangop_str, 'N/A', 'N/A', 'N/A']
-                
-                # Định dạng dữ liệu biên lợi nhuận gộp
-                bienloinhuangop_str = f"{bienloinhuangop * 100:.2f}%" if isinstance(bienloinhuangop, (int, float, np.int64, np.float64)) else 'N/A'
-                
-                # Cập nhật dữ liệu biên lợi nhuận gộp
-                projection_data['gross_margin'] = [bienloinhuangop_str, 'N/A', 'N/A', 'N/A', 'N/A']
-                
-                print(f"Đã lấy dữ liệu lợi nhuận gộp cho {symbol}: {loinhuangop_str} tỷ đồng ({yoy_loinhuangop_str})")
-                print(f"Đã lấy dữ liệu biên lợi nhuận gộp cho {symbol}: {bienloinhuangop_str}")
-            except Exception as e:
-                print(f"Lỗi khi lấy dữ liệu lợi nhuận gộp: {str(e)}")
-                
-            # Lấy dữ liệu chi phí
-            try:
-                laigop, chiphitaichinh, yoy_chiphitaichinh, chiphibanhang, yoy_laigop, yoy_chiphibanhang, chiphiql, yoy_chiphiql = chiphi_p2(symbol)
-                
-                # In thông tin debug
-                print(f"DEBUG - Dữ liệu từ chiphi_p2: chiphitaichinh={chiphitaichinh}, chiphibanhang={chiphibanhang}, chiphiql={chiphiql}")
-                
-                # Chuyển đổi chi phí từ đồng sang tỷ đồng
-                chiphitaichinh_ty = -chiphitaichinh / 1_000_000_000 if isinstance(chiphitaichinh, (int, float, np.int64, np.float64)) else None
-                chiphibanhang_ty = -chiphibanhang / 1_000_000_000 if isinstance(chiphibanhang, (int, float, np.int64, np.float64)) else None
-                chiphiql_ty = -chiphiql / 1_000_000_000 if isinstance(chiphiql, (int, float, np.int64, np.float64)) else None
-                
-                # Định dạng dữ liệu chi phí tài chính
-                chiphitaichinh_str = f"{chiphitaichinh_ty:,.2f}" if chiphitaichinh_ty is not None else 'N/A'
-                yoy_chiphitaichinh_str = f"+{yoy_chiphitaichinh*100:.1f}%" if isinstance(yoy_chiphitaichinh, (int, float)) and yoy_chiphitaichinh > 0 else f"{yoy_chiphitaichinh*100:.1f}%" if isinstance(yoy_chiphitaichinh, (int, float)) else 'N/A'
-                
-                # Cập nhật dữ liệu chi phí tài chính
-                projection_data['financial_expense'] = [chiphitaichinh_str, yoy_chiphitaichinh_str, 'N/A', 'N/A', 'N/A']
-                
-                # Định dạng dữ liệu chi phí bán hàng
-                chiphibanhang_str = f"{chiphibanhang_ty:,.2f}" if chiphibanhang_ty is not None else 'N/A'
-                yoy_chiphibanhang_str = f"+{yoy_chiphibanhang*100:.1f}%" if isinstance(yoy_chiphibanhang, (int, float)) and yoy_chiphibanhang > 0 else f"{yoy_chiphibanhang*100:.1f}%" if isinstance(yoy_chiphibanhang, (int, float)) else 'N/A'
-                
-                # Cập nhật dữ liệu chi phí bán hàng
-                projection_data['selling_expense'] = [chiphibanhang_str, yoy_chiphibanhang_str, 'N/A', 'N/A', 'N/A']
-                
-                # Định dạng dữ liệu chi phí quản lý
-                chiphiql_str = f"{chiphiql_ty:,.2f}" if chiphiql_ty is not None else 'N/A'
-                yoy_chiphiql_str = f"+{yoy_chiphiql*100:.1f}%" if isinstance(yoy_chiphiql, (int, float)) and yoy_chiphiql > 0 else f"{yoy_chiphiql*100:.1f}%" if isinstance(yoy_chiphiql, (int, float)) else 'N/A'
-                
-                # Cập nhật dữ liệu chi phí quản lý
-                projection_data['admin_expense'] = [chiphiql_str, yoy_chiphiql_str, 'N/A', 'N/A', 'N/A']
-                
-                print(f"Đã lấy dữ liệu chi phí cho {symbol}")
-            except Exception as e:
-                print(f"Lỗi khi lấy dữ liệu chi phí: {str(e)}")
-                
-            # Lấy dữ liệu lợi nhuận từ HĐKD, LNTT và LNST
-            try:
-                loinhuanhdkd, loinhuantruothue, loinhuansautrue, yoy_loinhuanhdkd, yoy_loinhuantruothue, yoy_loinhuansautrue = loinhuankinhdoanh_p2(symbol)
-                
-                # In thông tin debug
-                print(f"DEBUG - Dữ liệu từ loinhuankinhdoanh_p2: loinhuanhdkd={loinhuanhdkd}, loinhuantruothue={loinhuantruothue}, loinhuansautrue={loinhuansautrue}")
-                
-                # Chuyển đổi lợi nhuận từ đồng sang tỷ đồng
-                loinhuanhdkd_ty = loinhuanhdkd / 1_000_000_000 if isinstance(loinhuanhdkd, (int, float, np.int64, np.float64)) else None
-                loinhuantruothue_ty = loinhuantruothue / 1_000_000_000 if isinstance(loinhuantruothue, (int, float, np.int64, np.float64)) else None
-                loinhuansautrue_ty = loinhuansautrue / 1_000_000_000 if isinstance(loinhuansautrue, (int, float, np.int64, np.float64)) else None
-                
-                # Định dạng dữ liệu lợi nhuận từ HĐKD
-                loinhuanhdkd_str = f"{loinhuanhdkd_ty:,.2f}" if loinhuanhdkd_ty is not None else 'N/A'
-                yoy_loinhuanhdkd_str = f"+{yoy_loinhuanhdkd*100:.1f}%" if isinstance(yoy_loinhuanhdkd, (int, float)) and yoy_loinhuanhdkd > 0 else f"{yoy_loinhuanhdkd*100:.1f}%" if isinstance(yoy_loinhuanhdkd, (int, float)) else 'N/A'
-                
-                # Cập nhật dữ liệu lợi nhuận từ HĐKD
-                projection_data['operating_profit'] = [loinhuanhdkd_str, yoy_loinhuanhdkd_str, 'N/A', 'N/A', 'N/A']
-                
-                # Định dạng dữ liệu lợi nhuận trước thuế
-                loinhuantruothue_str = f"{loinhuantruothue_ty:,.2f}" if loinhuantruothue_ty is not None else 'N/A'
-                yoy_loinhuantruothue_str = f"+{yoy_loinhuantruothue*100:.1f}%" if isinstance(yoy_loinhuantruothue, (int, float)) and yoy_loinhuantruothue > 0 else f"{yoy_loinhuantruothue*100:.1f}%" if isinstance(yoy_loinhuantruothue, (int, float)) else 'N/A'
-                
-                # Cập nhật dữ liệu lợi nhuận trước thuế
-                projection_data['profit_before_tax'] = [loinhuantruothue_str, yoy_loinhuantruothue_str, 'N/A', 'N/A', 'N/A']
-                
-                # Định dạng dữ liệu lợi nhuận sau thuế
-                loinhuansautrue_str = f"{loinhuansautrue_ty:,.2f}" if loinhuansautrue_ty is not None else 'N/A'
-                yoy_loinhuansautrue_str = f"+{yoy_loinhuansautrue*100:.1f}%" if isinstance(yoy_loinhuansautrue, (int, float)) and yoy_loinhuansautrue > 0 else f"{yoy_loinhuansautrue*100:.1f}%" if isinstance(yoy_loinhuansautrue, (int, float)) else 'N/A'
-                
-                # Cập nhật dữ liệu lợi nhuận sau thuế
-                projection_data['profit_after_tax'] = [loinhuansautrue_str, yoy_loinhuansautrue_str, 'N/A', 'N/A', 'N/A']
-                
-                print(f"Đã lấy dữ liệu lợi nhuận cho {symbol}")
-            except Exception as e:
-                print(f"Lỗi khi lấy dữ liệu lợi nhuận: {str(e)}")
-        except Exception as e:
-            print(f"Lỗi khi lấy dữ liệu doanh thu thuần: {str(e)}")
-        
-        return projection_data
-    except Exception as e:
-        print(f"Lỗi khi tạo dữ liệu dự phóng: {str(e)}")
-        return None
-
-def generate_pdf_report(symbol: str):
-    try:
-        # Fix the file paths for financial data - ensure proper formatting with os.path.join
-        data_dir = os.path.join("e:\\", "Chatbotfinance", "Main", "backend", "data")
-        # Alternative using raw string:
-        # data_dir = r"e:\Chatbotfinance\Main\backend\data"
-        
-        file_paths = [
-            os.path.join(data_dir, f"2020-Vietnam.xlsx"), 
-            os.path.join(data_dir, f"2021-Vietnam.xlsx"), 
-            os.path.join(data_dir, f"2022-Vietnam.xlsx"), 
-            os.path.join(data_dir, f"2023-Vietnam.xlsx"),
-            os.path.join(data_dir, f"2024-Vietnam.xlsx")
-        ]
-        
-        # Check if files exist before proceeding
-        for file_path in file_paths:
-            if not os.path.exists(file_path):
-                print(f"Warning: File {file_path} does not exist")
-        
-        # Read all data from Excel files
-        df_list = read_data(file_paths)
-        
-        # Clean column names
-        clean_column_names(df_list)
-        
-        # Merge balance sheets for the specified symbol
-        dfs = [standardize_columns(df) for df in df_list]
-        merged_df = merge_balance_sheets(dfs, symbol)
-        if merged_df.empty:
-            raise ValueError(f"No data found for symbol: {symbol}")
-            
-        # Remove Current Ratio columns if they exist
-        if not merged_df.empty:
-            merged_df = merged_df.loc[:, ~merged_df.columns.str.contains("CURRENT RATIO", case=False)]
-        
-        # Transpose dataframe for easier data access
-        transposed_df = merged_df.T
-        transposed_df.columns = [f"{year}" for year in range(2020, 2025)]
-        transposed_df.reset_index(inplace=True)
-        transposed_df.rename(columns={"index": "Chỉ tiêu"}, inplace=True)
-        transposed_df = transposed_df.fillna(0)
-        
-        # Extract company information
-        company_name = str(merged_df.iloc[1]['TÊN']) if 'TÊN' in merged_df.columns else f"{symbol} Company"
-        exchange = str(merged_df.iloc[0]['SÀN']) if 'SÀN' in merged_df.columns else "Unknown"
-        
-        # Get financial data for calculations
-        years = transposed_df.columns[1:]
-        
-        # Calculate balance sheet metrics
-        cash_equivalents = get_values(transposed_df, "CĐKT. TIỀN VÀ TƯƠNG ĐƯƠNG TIỀN")
-        short_term_investments = get_values(transposed_df, "CĐKT. ĐẦU TƯ TÀI CHÍNH NGẮN HẠN")
-        short_term_receivables = get_values(transposed_df, "CĐKT. CÁC KHOẢN PHẢI THU NGẮN HẠN")
-        inventory = get_values(transposed_df, "CĐKT. HÀNG TỒN KHO, RÒNG")
-        other_current_assets = get_values(transposed_df, "CĐKT. TÀI SẢN NGẮN HẠN KHÁC")
-        
-        # Calculate PPE components
-        tangible_assets = get_values(transposed_df, "CĐKT. GTCL TSCĐ HỮU HÌNH")
-        finance_leased_assets = get_values(transposed_df, "CĐKT. GTCL TÀI SẢN THUÊ TÀI CHÍNH")
-        intangible_assets = get_values(transposed_df, "CĐKT. GTCL TÀI SẢN CỐ ĐỊNH VÔ HÌNH")
-        construction_in_progress = get_values(transposed_df, "CĐKT. XÂY DỰNG CƠ BẢN DỞ DANG (TRƯỚC 2015)")
-        
-        # Calculate assets and liabilities
-        total_current_assets = get_values(transposed_df, "CĐKT. TÀI SẢN NGẮN HẠN")
-        total_non_current_assets = get_values(transposed_df, "CĐKT. TÀI SẢN DÀI HẠN")
-        total_assets = total_current_assets + total_non_current_assets
-        total_current_liabilities = get_values(transposed_df, "CĐKT. NỢ NGẮN HẠN")
-        total_long_term_debt = get_values(transposed_df, "CĐKT. NỢ DÀI HẠN")
-        total_liabilities = get_values(transposed_df, "CĐKT. NỢ PHẢI TRẢ")
-        total_equity = get_values(transposed_df, "CĐKT. VỐN CHỦ SỞ HỮU")
-        
-        # Calculate EBITDA components
-        net_income = get_values(transposed_df, "KQKD. LỢI NHUẬN SAU THUẾ THU NHẬP DOANH NGHIỆP")
-        interest_expense = get_values(transposed_df, "KQKD. CHI PHÍ LÃI VAY")
-        taxes = get_values(transposed_df, "KQKD. CHI PHÍ THUẾ TNDN HIỆN HÀNH")
-        depreciation_amortization = get_values(transposed_df, "KQKD. KHẤU HAO TÀI SẢN CỐ ĐỊNH")
-        
-        # Calculate income statement items
-        revenue = get_values(transposed_df, "KQKD. DOANH THU THUẦN")
-        gross_profit = get_values(transposed_df, "KQKD. LỢI NHUẬN GỘP VỀ BÁN HÀNG VÀ CUNG CẤP DỊCH VỤ")
-        financial_expense = get_values(transposed_df, "KQKD. CHI PHÍ TÀI CHÍNH")
-        selling_expense = get_values(transposed_df, "KQKD. CHI PHÍ BÁN HÀNG")
-        admin_expense = get_values(transposed_df, "KQKD. CHI PHÍ QUẢN LÝ DOANH NGHIỆP")
-        operating_profit = get_values(transposed_df, "KQKD. LỢI NHUẬN THUẦN TỪ HOẠT ĐỘNG KINH DOANH")
-        other_profit = get_values(transposed_df, "KQKD. LỢI NHUẬN KHÁC")
-        jv_profit = get_values(transposed_df, "KQKD. LÃI/ LỖ TỪ CÔNG TY LIÊN DOANH (TRƯỚC 2015)")
-        
-        # Calculate complex metrics
-        ppe = calculate_ppe(tangible_assets, finance_leased_assets, intangible_assets, construction_in_progress)
-        ebitda = calculate_ebitda(net_income, interest_expense, taxes, depreciation_amortization)
-        total_operating_expense = calculate_total_operating_expense(revenue, gross_profit, financial_expense, selling_expense, admin_expense)
-        net_income_before_taxes = calculate_net_income_before_taxes(operating_profit, other_profit, jv_profit)
-        net_income_before_extraordinary = calculate_net_income_before_extraordinary_items(net_income, other_profit)
-        
-        # Calculate financial ratios
-        ratios = calculate_financial_ratios(
-            net_income=net_income, 
-            total_equity=total_equity, 
-            total_assets=total_assets, 
-            revenue=revenue, 
-            long_term_debt=total_long_term_debt, 
-            total_debt=total_liabilities
-        )
-        
-        # Format data for PDF tables
-        def format_values(values):
-            return [f"{value:,.2f}" for value in values]
-            
-        def format_percentages(values):
-            return [f"{value * 100:,.2f}" for value in values]
-        
-        # Create data dictionaries for PDF tables
-        balance_sheet_data = {
-            "Total Current Assets": format_values(total_current_assets),
-            "Property/Plant/Equipment": format_values(ppe),
-            "Total Assets": format_values(total_assets),
-            "Total Current Liabilities": format_values(total_current_liabilities),
-            "Total Long-Term Debt": format_values(total_long_term_debt),
-            "Total Liabilities": format_values(total_liabilities),
-        }
-        
-        fundamental_data = {
-            "EBITDA": format_values(ebitda),
-        }
-        
-        income_statement_data = {
-            "Revenue": format_values(revenue),
-            "Total Operating Expense": format_values(total_operating_expense),
-            "Net Income Before Taxes": format_values(net_income_before_taxes),
-            "Net Income After Taxes": format_values(net_income),
-            "Net Income Before Extra. Items": format_values(net_income_before_extraordinary),
-        }
-        
-        profitability_analysis_data = {
-            "ROE Tot Equity, %": format_percentages(ratios["roe"]),
-            "ROA Tot Assets, %": format_percentages(ratios["roa"]),
-            "Income Aft Tax Margin, %": format_percentages(ratios["income_after_tax_margin"]),
-            "Revenue/Tot Assets, %": format_percentages(ratios["revenue_to_total_assets"]),
-            "Long Term Debt/Equity, %": format_percentages(ratios["long_term_debt_to_equity"]),
-            "Total Debt/Equity, %": format_percentages(ratios["total_debt_to_equity"]),
-            "ROS, %": format_percentages(ratios["ros"]),
-        }
-        
-        # Tạo financial_data dictionary để sử dụng cho việc tạo biểu đồ
-        financial_data = {
-            "revenue": revenue,
-            "net_income": net_income,
-            "total_assets": total_assets,
-            "total_equity": total_equity,
-            "total_liabilities": total_liabilities,
-            "roe": ratios["roe"],
-            "roa": ratios["roa"],
-            "ros": ratios["ros"],
-            "long_term_debt_to_equity": ratios["long_term_debt_to_equity"],
-            "total_debt_to_equity": ratios["total_debt_to_equity"]
-        }
-        
-        # Request AI analysis
-        analysis = generate_financial_analysis(
-            custom_prompt=f"Analyze financial performance of {symbol} based on: Balance Sheet: {balance_sheet_data}, Income Statement: {income_statement_data}, Profitability Analysis: {profitability_analysis_data}"
-        )
-        
-        # Create output directory
-        output_dir = "reports"
-        os.makedirs(output_dir, exist_ok=True)
-        output_path = os.path.join(output_dir, f"Financial_Report_{symbol}.pdf")
-        
-        # Tạo biểu đồ tài chính
-        chart_paths = generate_financial_charts(os.path.dirname(os.path.abspath(__file__)), symbol, years, financial_data)
-
-        # Tạo các dictionary dữ liệu cho báo cáo
-        data = {
-            "info": [
-                ("Company Name", company_name),
-                ("Stock Symbol", symbol),
-                ("Exchange", exchange),
-                ("Report Date", datetime.date.today().strftime('%d-%b-%Y')),
-            ],
-            "BALANCE SHEET": balance_sheet_data,
-            "FUNDAMENTAL": fundamental_data,
-            "INCOME STATEMENT": income_statement_data,
-            "PROFITABILITY ANALYSIS": profitability_analysis_data
-        }
-        
-        # Lấy thông tin ngành nghề của công ty
-        industry = get_company_industry(symbol)
-        print(f"Đã lấy thông tin ngành nghề của {symbol}: {industry}")
-        name = get_company_name(symbol)
-        # Chuẩn bị dữ liệu cho báo cáo định dạng mới
-        company_data = {
-            "name": f"{name}",  # Chỉ hiển thị tên công ty, không kèm mã
-            "symbol": symbol,
-            "info": f"[ {symbol} | {exchange} | Ngành: {industry} ]"  # Thêm thông tin ngành
-        }
-        
-        # Đảm bảo trường name luôn có giá trị đầy đủ
-        if company_data["name"] is None or company_data["name"] == "" or company_data["name"] == symbol:
-            company_data["name"] = f"Công ty Cổ phần {symbol}"
-            
-        # Đảm bảo company_data hợp lệ trước khi truyền vào create_stock_report  
-        if not isinstance(company_data, dict):
-            company_data = {
-                "name": f"Công ty Cổ phần {symbol}",
-                "symbol": symbol,
-                "info": f"[ {symbol} | {exchange} | Ngành: {industry} ]"
-            }
-        
-        # Lấy giá hiện tại từ API thay vì tính toán
-        formatted_current_price = "N/A"
-        formatted_price_target = "N/A"
-        profit_percent = "N/A"
-        
-        try:
-            # Đổi tên gọi hàm để tránh nhầm lẫn với biến
-            current_price_value = current_price(symbol)
-            formatted_current_price = f"{current_price_value:,.0f}"
-            print(f"Đã lấy giá hiện tại của {symbol} từ API: {formatted_current_price}")
-            
-            # Tính giá mục tiêu và suất sinh lời sử dụng hàm predict_price
-            try:
-                price_target, profit_percent = predict_price(symbol)
-                print(f"Đã tính giá mục tiêu cho {symbol}: {price_target} VND, Suất sinh lời: {profit_percent * 100}%")
-                formatted_price_target = f"{price_target:,.0f}"
-            except Exception as e:
-                print(f"Lỗi khi tính giá mục tiêu: {str(e)}")
-                # Kiểm tra nếu price_value là số thì mới tính toán giá mục tiêu dự phòng
-                if isinstance(current_price_value, (int, float)) and current_price_value > 0:
-                    # Fallback: Tính toán giá mục tiêu đơn giản (50% cao hơn giá hiện tại)
-                    price_target = current_price_value * 1.5
-                    formatted_price_target = f"{price_target:,.0f}"
-                    profit_percent = 0.5  # 50% được lưu dưới dạng thập phân
-                    print(f"Sử dụng giá mục tiêu đơn giản: {formatted_price_target} VND, Suất sinh lời: {profit_percent * 100}%")
-                else:
-                    # Nếu không thể tính toán được giá mục tiêu, sử dụng "N/A"
-                    formatted_price_target = "N/A"
-                    profit_percent = "N/A"
-                    print("Không thể tính toán giá mục tiêu, sử dụng N/A")
-        except Exception as e:
-            print(f"Lỗi khi lấy giá hiện tại từ API: {str(e)}")
-            # Fallback: Tính toán giá hiện tại từ net_income và total_equity nếu API lỗi
-            try:
-                if len(net_income) > 0 and len(total_equity) > 0 and total_equity[-1] != 0:
-                    price_value = net_income[-1] / total_equity[-1] * 10000
-                    formatted_current_price = f"{price_value:,.0f}"
-                    print(f"Sử dụng giá hiện tại tính toán: {formatted_current_price}")
-                    
-                    # Tính giá mục tiêu đơn giản và suất sinh lời
-                    price_target = price_value * 1.25
-                    formatted_price_target = f"{price_target:,.0f}"
-                    profit_percent = 0.25  # 25% được lưu dưới dạng thập phân
-                else:
-                    formatted_current_price = "N/A"
-                    formatted_price_target = "N/A"
-                    profit_percent = "N/A"
-            except Exception as e:
-                print(f"Lỗi khi tính giá hiện tại từ dữ liệu tài chính: {str(e)}")
-                formatted_current_price = "N/A"
-                formatted_price_target = "N/A"
-                profit_percent = "N/A"
-        
-        # Chuẩn bị dữ liệu peers cho trang 3
-        peer_data = []
-        
-        # Chuẩn bị dữ liệu định giá
-        valuation_data = {
-            'pe_avg': 'N/A',
-            'pe_median': 'N/A',
-            'pe_10yr_avg': 'N/A',
-            'pe_target': 'N/A',
-            'eps_target': 'N/A',
-            'price_target': formatted_price_target,
-            'current_price': formatted_current_price,
-            'upside': f"{float(profit_percent)*100:.2f}" if isinstance(profit_percent, (int, float)) else 'N/A'
-        }
-        
-        # Danh sách mẫu các công ty để sử dụng khi không lấy được dữ liệu hoặc không đủ dữ liệu
-        sample_companies = [
-            {
-                'company_name': 'Công ty Mẫu A',
-                'country': 'Việt Nam',
-                'pe': '12.50',
-                'market_cap': '2.35',
-                'revenue_growth': '8.75',
-                'eps_growth': '12.30',
-                'roa': '7.80',
-                'roe': '15.40'
-            },
-            {
-                'company_name': 'Công ty Mẫu B',
-                'country': 'Việt Nam',
-                'pe': '14.20',
-                'market_cap': '1.85',
-                'revenue_growth': '6.50',
-                'eps_growth': '9.70',
-                'roa': '6.40',
-                'roe': '13.80'
-            },
-            {
-                'company_name': 'Công ty Mẫu C',
-                'country': 'Việt Nam',
-                'pe': '9.80',
-                'market_cap': '3.10',
-                'revenue_growth': '10.20',
-                'eps_growth': '15.50',
-                'roa': '8.90',
-                'roe': '17.60'
-            },
-            {
-                'company_name': 'Công ty Mẫu D',
-                'country': 'Việt Nam',
-                'pe': '16.40',
-                'market_cap': '1.45',
-                'revenue_growth': '5.30',
-                'eps_growth': '7.80',
-                'roa': '5.20',
-                'roe': '11.50'
-            },
-            {
-                'company_name': 'Công ty Mẫu E',
-                'country': 'Việt Nam',
-                'pe': '11.30',
-                'market_cap': '2.75',
-                'revenue_growth': '9.40',
-                'eps_growth': '14.20',
-                'roa': '7.60',
-                'roe': '16.30'
-            }
-        ]
-        
-        try:
-            from app.api.v1.report.module_report.finance_calc import get_cty_cung_nganh_p3
-            import numpy as np  # Ensure numpy is imported here to fix the reference error
-            
-            # Helper functions to format values
-            def format_market_cap(value):
-                """Format market cap from VND to billion USD"""
-                try:
-                    if isinstance(value, (int, float, np.int64, np.float64)):
-                        # Convert from VND to billion USD (approximate conversion)
-                        return f"{value/1000000000000/24:.2f}"
-                    return str(value)
-                except:
-                    return 'N/A'
-            
-            def format_percentage(value):
-                """Format value as percentage with 2 decimal places"""
-                try:
-                    if isinstance(value, (int, float, np.int64, np.float64)):
-                        return f"{value*100:.2f}"
-                    return str(value)
-                except:
-                    return 'N/A'
-            
-            # Lấy dữ liệu từ API
-            try:
-                peer_comparison_data = get_cty_cung_nganh_p3(symbol)
-                print(f"Dữ liệu công ty cùng ngành: {peer_comparison_data}")
-            except Exception as e:
-                print(f"Lỗi khi gọi get_cty_cung_nganh_p3: {str(e)}")
-                peer_comparison_data = {}
-            
-            # Chỉ xử lý nếu dữ liệu trả về không rỗng và không có lỗi
-            if peer_comparison_data and isinstance(peer_comparison_data, dict):
-                print(f"Xử lý dữ liệu cho {len(peer_comparison_data)} công ty")
-                
-                # Tạo danh sách P/E để tính trung bình/trung vị
-                pe_values = []
-                
-                # Xử lý tất cả dữ liệu, bao gồm công ty hiện tại
-                all_entries = []
-                
-                # Xử lý công ty hiện tại trước (nếu có)
-                if symbol in peer_comparison_data:
-                    main_company = peer_comparison_data[symbol]
-                    if isinstance(main_company, dict) and 'organ_name' in main_company:
-                        try:
-                            # Lấy P/E từ dữ liệu trả về
-                            pe_value = main_company.get('P/E', 'N/A')
-                            if isinstance(pe_value, (int, float, np.int64, np.float64)):
-                                pe_formatted = f"{pe_value:.2f}"
-                                pe_values.append(pe_value)
-                            else:
-                                pe_formatted = str(pe_value)
-                                
-                            # Tạo entry cho công ty hiện tại
-                            main_entry = {
-                                'company_name': f"{main_company.get('organ_name', 'N/A')} (Hiện tại)",
-                                'country': 'Việt Nam',
-                                'pe': pe_formatted,
-                                'market_cap': format_market_cap(main_company.get('market_cap', 'N/A')),
-                                'revenue_growth': format_percentage(main_company.get('revenue_growth', 'N/A')),
-                                'eps_growth': format_percentage(main_company.get('EPS_growth', 'N/A')),
-                                'roa': format_percentage(main_company.get('ROA', 'N/A')),
-                                'roe': format_percentage(main_company.get('ROE', 'N/A'))
-                            }
-                            all_entries.append(main_entry)
-                            
-                            # Lưu P/E của công ty hiện tại
-                            if isinstance(pe_value, (int, float, np.int64, np.float64)):
-                                valuation_data['pe_10yr_avg'] = pe_formatted
-                                
-                            # Lưu EPS mục tiêu nếu có
-                            eps = main_company.get('EPS', 'N/A')
-                            if isinstance(eps, (int, float, np.int64, np.float64)):
-                                valuation_data['eps_target'] = f"{eps:.2f}"
-                        except Exception as e:
-                            print(f"Lỗi khi xử lý dữ liệu công ty chính {symbol}: {str(e)}")
-                    
-                # Xử lý các công ty cùng ngành
-                for sym, data in peer_comparison_data.items():
-                    # Bỏ qua công ty hiện tại (đã xử lý ở trên)
-                    if sym == symbol:
-                        continue
-                        
-                    try:
-                        if isinstance(data, dict) and 'organ_name' in data:
-                            # Lấy P/E từ dữ liệu trả về
-                            pe_value = data.get('P/E', 'N/A')
-                            if isinstance(pe_value, (int, float, np.int64, np.float64)):
-                                pe_formatted = f"{pe_value:.2f}"
-                                pe_values.append(pe_value)
-                            else:
-                                pe_formatted = str(pe_value)
-                                
-                            # Tạo entry cho công ty cùng ngành
-                            peer_entry = {
-                                'company_name': data.get('organ_name', 'N/A'),
-                                'country': 'Việt Nam',
-                                'pe': pe_formatted,
-                                'market_cap': format_market_cap(data.get('market_cap', 'N/A')),
-                                'revenue_growth': format_percentage(data.get('revenue_growth', 'N/A')),
-                                'eps_growth': format_percentage(data.get('EPS_growth', 'N/A')),
-                                'roa': format_percentage(data.get('ROA', 'N/A')),
-                                'roe': format_percentage(data.get('ROE', 'N/A'))
-                            }
-                            all_entries.append(peer_entry)
-                    except Exception as e:
-                        print(f"Lỗi khi xử lý dữ liệu công ty {sym}: {str(e)}")
-                
-                # Tính P/E trung bình và trung vị
-                if pe_values:
-                    valuation_data['pe_avg'] = f"{np.mean(pe_values):.2f}"
-                    valuation_data['pe_median'] = f"{np.median(pe_values):.2f}"
-                    
-                    # Đặt P/E mục tiêu là P/E trung vị ngành, không thấp hơn 10
-                    target_pe = max(10, np.median(pe_values))
-                    valuation_data['pe_target'] = f"{target_pe:.2f}"
-                    
-                    # Cập nhật giá mục tiêu nếu có đủ thông tin
-                    if valuation_data['eps_target'] != 'N/A' and valuation_data['pe_target'] != 'N/A':
-                        try:
-                            eps_target = float(valuation_data['eps_target'])
-                            pe_target = float(valuation_data['pe_target'])
-                            price_target = eps_target * pe_target
-                            valuation_data['price_target'] = f"{price_target:,.0f}"
-                            
-                            # Cập nhật upside nếu có giá hiện tại
-                            if valuation_data['current_price'] != 'N/A':
-                                current_price_val = float(valuation_data['current_price'].replace(',', ''))
-                                upside = (price_target - current_price_val) / current_price_val * 100
-                                valuation_data['upside'] = f"{upside:.2f}"
-                        except Exception as e:
-                            print(f"Lỗi khi cập nhật giá mục tiêu: {str(e)}")
-                
-                # Lấy tối đa 5 công ty
-                peer_data = all_entries[:5]
-                print(f"Đã chuẩn bị dữ liệu cho {len(peer_data)} công ty cho báo cáo.")
-            else:
-                print(f"Không nhận được dữ liệu hợp lệ từ get_cty_cung_nganh_p3.")
-            
-            # Đảm bảo luôn có ít nhất 5 công ty trong peer_data
-            if len(peer_data) < 5:
-                print(f"Chỉ có {len(peer_data)} công ty, thêm công ty mẫu để đủ 5 công ty")
-                # Số lượng công ty mẫu cần thêm
-                num_sample_needed = 5 - len(peer_data)
-                # Thêm các công ty mẫu cần thiết
-                for i in range(min(num_sample_needed, len(sample_companies))):
-                    peer_data.append(sample_companies[i])
-        except Exception as e:
-            print(f"Lỗi khi lấy dữ liệu cho trang 3, sử dụng dữ liệu mẫu: {str(e)}")
-            # Nếu có lỗi nghiêm trọng, sử dụng dữ liệu mẫu
-            peer_data = sample_companies[:5]
-            
-            # Tính các giá trị mẫu cho valuation_data
-            valuation_data['pe_avg'] = '13.25'
-            valuation_data['pe_median'] = '12.50'
-            valuation_data['pe_10yr_avg'] = '14.00'
-            valuation_data['pe_target'] = '13.00'
-            
-            # Nếu eps_target đã có từ dữ liệu trước đó thì giữ nguyên, nếu không thì dùng giá trị mẫu
-            if valuation_data['eps_target'] == 'N/A':
-                valuation_data['eps_target'] = '5000.00'
-                
-                # Cập nhật giá mục tiêu từ EPS và PE mục tiêu mẫu
-                price_target = 5000 * 13
-                valuation_data['price_target'] = f"{price_target:,.0f}"
-                
-                # Cập nhật upside nếu có giá hiện tại
-                if valuation_data['current_price'] != 'N/A':
-                    try:
-                        current_price_val = float(valuation_data['current_price'].replace(',', ''))
-                        upside = (price_target - current_price_val) / current_price_val * 100
-                        valuation_data['upside'] = f"{upside:.2f}"
-                    except:
-                        valuation_data['upside'] = '20.00'
-                else:
-                    valuation_data['upside'] = '20.00'
-        
-        recommendation_data = {
-            "date": datetime.date.today().strftime('%d/%m/%Y'),
-            "price_date": datetime.date.today().strftime('%d/%m/%Y'),
-            "current_price": formatted_current_price,
-            "target_price": formatted_price_target,
-            "profit_percent": f"{profit_percent}"
-        }
-        
-        # Chuẩn bị nội dung phân tích
-        analysis_paragraphs = []
-        if analysis:
-            # Loại bỏ các dòng lời chào nếu có
-            if isinstance(analysis, str):
-                # Loại bỏ các dòng lời chào đầu tiên
-                lines = analysis.split('\n')
-                clean_lines = []
-                skip_intro = True
-                for line in lines:
-                    # Bỏ qua các dòng cho đến khi gặp tiêu đề đầu tiên
-                    if skip_intro and not line.startswith('**Định giá cập nhật với khuyến nghị MUA**'):
-                        continue
-                    skip_intro = False
-                    clean_lines.append(line)
-                
-                analysis = '\n'.join(clean_lines)
-            
-            # Tạo tiêu đề cho các phần phân tích chính
-            analysis_sections = [
-                "**Định giá cập nhật với khuyến nghị MUA**",
-                "**TÌNH HÌNH TÀI CHÍNH HIỆN NAY**"
-            ]
-            
-            # Chia phân tích thành các phần
-            paragraphs = analysis.split('\n\n')
-            
-            # Kiểm tra xem phân tích đã có tiêu đề Markdown hay chưa
-            if paragraphs and not any(p.startswith('**') for p in paragraphs):
-                # Không có tiêu đề Markdown, thêm tiêu đề vào nội dung
-                formatted_paragraphs = []
-                section_idx = 0
-                paragraphs_per_section = max(1, len(paragraphs) // len(analysis_sections))
-                
-                for i, para in enumerate(paragraphs):
-                    if i % paragraphs_per_section == 0 and section_idx < len(analysis_sections):
-                        # Thêm tiêu đề kết hợp với đoạn đầu tiên của phần
-                        formatted_paragraphs.append(f"{analysis_sections[section_idx]} {para}")
-                        section_idx += 1
-                    else:
-                        # Thêm đoạn thông thường
-                        formatted_paragraphs.append(para)
-                
-                # Đảm bảo sử dụng tất cả các tiêu đề
-                while section_idx < len(analysis_sections):
-                    formatted_paragraphs.append(analysis_sections[section_idx])
-                    section_idx += 1
-                
-                analysis_paragraphs = formatted_paragraphs
-            else:
-                # Đã có tiêu đề Markdown, giữ nguyên định dạng
-                analysis_paragraphs = paragraphs
-        
-        # Loại bỏ các lời chào khỏi tiêu đề và khuyến nghị 
-        # Lưu ý: Các giá trị này không được sử dụng nữa vì đã xóa bỏ hiển thị trong generate_pdf.py
-        
-        analysis_data = {
-            "content": analysis_paragraphs
-        }
-        
-        # Lấy dữ liệu thị trường từ module finance_calc thay vì tạo trực tiếp trong services
-        # Chuẩn bị thông tin cổ phiếu để truyền vào get_market_data
-        stock_info = {
-            'current_price': float(recommendation_data['current_price'].replace(',', '')) if recommendation_data.get('current_price') else 0,
-            'shares_outstanding': financial_data.get('shares_outstanding', 1000) if isinstance(financial_data, dict) else 1000,
-            'free_float': 35,  # Giá trị mặc định nếu không có dữ liệu
-            'ratios': ratios
-        }
-        
-        # Lấy dữ liệu thị trường từ API - truyền thêm symbol
-        market_data = get_market_data(stock_info, symbol)
-        print(f"Đã lấy dữ liệu thị trường từ module finance_calc cho {symbol}: {market_data}")
-        
-        # Tạo dữ liệu dự phóng
-        projection_data = create_projection_data(symbol)
-        
-        # Sử dụng dữ liệu thực từ các biến đã tạo ở trên thay vì dữ liệu mẫu
-        # Dữ liệu peer_data và valuation_data đã được chuẩn bị trước đó
-        # Nếu peer_data rỗng, thêm công ty hiện tại làm ví dụ
-        if not peer_data:
-            peer_data.append({
-                'company_name': f"{company_data['name']} (Hiện tại)",
-                'country': 'Việt Nam',
-                'pe': '15.2',
-                'market_cap': '12.5',
-                'revenue_growth': '8.5',
-                'eps_growth': '10.2',
-                'roa': '8.4',
-                'roe': '15.6'
-            })
-        
-        # Format lại valuation_data nếu cần thiết
-        if isinstance(profit_percent, (int, float)) and profit_percent != 'N/A':
-            valuation_data['upside'] = f"{float(profit_percent) * 100:.2f}"
-        
-        # Generate PDF using ReportLab với định dạng mới
-        pdf = PDFReport()
-        pdf.create_stock_report(
-            output_path=output_path,
-            company_data=company_data,
-            recommendation_data=recommendation_data,
-            market_data=market_data,
-            analysis_data=analysis_data,
-            projection_data=projection_data,  # Dữ liệu dự phóng
-            peer_data=peer_data,              # Dữ liệu các công ty cùng ngành
-            valuation_data=valuation_data     # Dữ liệu định giá
-        )
-        
-        return output_path
-    
-    except Exception as e:
-        print(f"Error generating PDF report: {str(e)}")
-        # Create a simple error PDF
-        error_pdf = PDFReport()
-        
-        error_dir = "reports"
-        os.makedirs(error_dir, exist_ok=True)
-        error_path = os.path.join(error_dir, f"error_{symbol}.pdf")
-        
-        # Sử dụng mẫu báo cáo mới cho cả báo cáo lỗi
-        company_data = {"name": f"Error Report for {symbol}", "info": "Error"}
-        recommendation_data = {"date": datetime.date.today().strftime('%d/%m/%Y')}
-        analysis_data = {
-            "title": "Error Generating Report",
-            "content": [f"Could not generate report for {symbol}: {str(e)}"]
-        }
-        
-        error_pdf.create_stock_report(
-            output_path=error_path,
-            company_data=company_data,
-            recommendation_data=recommendation_data,
-            market_data={},
-            analysis_data=analysis_data
-        )
-        
-        return error_path
-
-def get_financial_analysis(symbol=None):
-    """Generate financial analysis for a specified symbol or general market analysis"""
-    try:
-        if symbol:
-            # Get actual financial data for the specified symbol
-            # File paths for financial data
-            data_dir = os.path.join("e:", "Chatbotfinance", "Main", "backend", "data")
-            file_paths = [
-                os.path.join(data_dir, f"2020-Vietnam.xlsx"), 
-                os.path.join(data_dir, f"2021-Vietnam.xlsx"), 
-                os.path.join(data_dir, f"2022-Vietnam.xlsx"), 
-                os.path.join(data_dir, f"2023-Vietnam.xlsx"),
-                os.path.join(data_dir, f"2024-Vietnam.xlsx")
-            ]
-            
-            # Read and process data
-            df_list = read_data(file_paths)
-            clean_column_names(df_list)
-            
-            # Filter data for specified symbol
-            dfs = [standardize_columns(df) for df in df_list]
-            merged_df = merge_balance_sheets(dfs, symbol)
-            
-            if merged_df.empty:
-                return f"No data found for symbol: {symbol}"
-                
-            # Process the data as needed to get financial metrics
-            # (Similar to what's done in generate_pdf_report)
-            # ...
-
-            # Format the data for the API
-            balance_sheet = {
-                "Total Current Assets": ["100,000", "120,000", "150,000"],
-                "Total Assets": ["500,000", "550,000", "600,000"],
-            }
-            income_statement = {
-                "Revenue": ["250,000", "300,000", "350,000"],
-                "Net Income": ["50,000", "60,000", "75,000"],
-            }
-            profitability_analysis = {
-                "ROE": ["10%", "12%", "15%"],
-                "ROA": ["8%", "10%", "12%"],
-            }
-            
-            # Generate analysis using the financial data
-            return generate_financial_analysis(
-                balance_sheet=balance_sheet,
-                income_statement=income_statement,
-                profitability_analysis=profitability_analysis
-            )
-        else:
-            # Provide a general market analysis if no symbol is specified
-            custom_prompt = "Provide a general financial market overview for Vietnam market, focusing on current trends and potential investment opportunities."
-            return generate_financial_analysis(custom_prompt=custom_prompt)
-    except Exception as e:
-        return f"Error generating analysis: {str(e)}"
-
-def generate_company_overview_pdf(output_path=None):
-    """
-    Generate a PDF file with company overview information.
-    
-    Args:
-        output_path (str, optional): Path where the PDF file will be saved.
-            If None, a default path will be used.
-            
-    Returns:
-        str: Path to the generated PDF file
-    """
-    if output_path is None:
-        # Create a directory for reports if it doesn't exist
-        reports_dir = os.path.join(os.getcwd(), "reports")
-        os.makedirs(reports_dir, exist_ok=True)
-        
-        # Generate a filename based on current date and time
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = os.path.join(reports_dir, f"company_overview_{timestamp}.pdf")
-    
-    # Call the function to generate the PDF
-    result_path = generate_page4_pdf(output_path)
-    
-    return result_path
-
-def generate_financial_ratios_pdf(output_path=None):
-    """
-    Generate a PDF file with financial ratios information.
-    
-    Args:
-        output_path (str, optional): Path where the PDF file will be saved.
-            If None, a default path will be used.
-            
-    Returns:
-        str: Path to the generated PDF file
-    """
-    if output_path is None:
-        # Create a directory for reports if it doesn't exist
-        reports_dir = os.path.join(os.getcwd(), "reports")
-        os.makedirs(reports_dir, exist_ok=True)
-        
-        # Generate a filename based on current date and time
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = os.path.join(reports_dir, f"financial_ratios_{timestamp}.pdf")
-    
-    # Call the function to generate the PDF
-    result_path = generate_page5_pdf(output_path)
-    
-    return result_path
-
-def generate_additional_info_pdf(output_path=None):
-    """
-    Generate a PDF file with additional information.
-    
-    Args:
-        output_path (str, optional): Path where the PDF file will be saved.
-            If None, a default path will be used.
-            
-    Returns:
-        str: Path to the generated PDF file
-    """
-    if output_path is None:
-        # Create a directory for reports if it doesn't exist
-        reports_dir = os.path.join(os.getcwd(), "reports")
-        os.makedirs(reports_dir, exist_ok=True)
-        
-        # Generate a filename based on current date and time
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = os.path.join(reports_dir, f"additional_info_{timestamp}.pdf")
-    
-    # Call the function to generate the PDF
-    result_path = generate_page6_pdf(output_path)
-    
-    return result_path
-
-if __name__ == "__main__":
-    # Test code
-    symbol = "VCB"  # Example symbol
-    pdf_path = generate_pdf_report(symbol)
-    print(f"Generated PDF at: {pdf_path}")
@@ -1,15 +1,18 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 from typing import Dict, List, Any
+import asyncio
 import time
 
-from .services import Treemap
+from app.core.services import treemap_service
+from app.core.log import get_logger
 from .schemas import TreemapResponse, StockData
 
 router = APIRouter(tags=["Treemap"])
+log = get_logger(__name__)
 
-# Sử dụng một instance duy nhất cho toàn bộ ứng dụng
-treemap_instance = Treemap()
+# Service dùng chung với API v1/v2 (tạo ở request đầu tiên, cache treemap chỉ có một bản)
+treemap_instance = treemap_service
 
 @router.get("/{index_name}", response_model=TreemapResponse)
 async def get_stocks_by_index(index_name: str):
@@ -23,11 +26,11 @@ async def get_stocks_by_index(index_name: str):
         TreemapResponse: Danh sách cổ phiếu với thông tin
     """
     try:
-        print(f"Starting to fetch stock data for {index_name}...")
         start_time = time.time()
         
         # Lấy dữ liệu cổ phiếu với vốn hóa và GTGD
-        result = treemap_instance.sort_cp(index_name)
+        # Service gọi vnstock đồng bộ (có thể chờ rate limit), chạy ngoài event loop
+        result = await asyncio.to_thread(treemap_instance.sort_cp, index_name)
         
         # Extract the DataFrame and convert to records
         if isinstance(result, dict) and 'market_cap_data' in result:
@@ -46,7 +49,7 @@ async def get_stocks_by_index(index_name: str):
             formatted_data = []
         
         elapsed = time.time() - start_time
-        print(f"Fetched {len(formatted_data)} stocks from {index_name} in {elapsed:.2f} seconds")
+        log.debug("treemap.request", api="v1", index=index_name, stocks=len(formatted_data), seconds=round(elapsed, 3))
         
         return JSONResponse(
             content={
@@ -61,7 +64,7 @@ async def get_stocks_by_index(index_name: str):
             }
         )
     except Exception as e:
-        print(f"Error in get_stocks_by_index: {str(e)}")
+        log.exception("treemap.request_failed", api="v1", index=index_name)
         return JSONResponse(
             status_code=500,
             content={
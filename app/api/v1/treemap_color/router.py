@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
-from .services import TreemapColorService
+import asyncio
 from .schemas import StockChangeResponse
+from app.core.services import treemap_color_service
 
 router = APIRouter(
     prefix="/treemap-color",
@@ -20,8 +21,8 @@ async def get_stock_change(symbol: str) -> Dict[str, Any]:
     - Dictionary containing price difference and percentage change
     """
     try:
-        service = TreemapColorService()
-        difference, percentage_change = service.get_data_cp(symbol)
+        # Service gọi vnstock đồng bộ (có thể chờ rate limit), chạy ngoài event loop
+        difference, percentage_change = await asyncio.to_thread(treemap_color_service.get_data_cp, symbol)
         
         return {
             "symbol": symbol,
@@ -0,0 +1,165 @@
+from typing import Dict, List, Optional, Tuple
+import threading
+import json
+import time
+import os
+import re
+
+from app.core.keyed_locks import IdleSweeper
+
+class ConversationStore:
+    """
+    Lưu lịch sử hội thoại theo từng người dùng dưới dạng log append-only (mỗi người một file .jsonl):
+    - mỗi tin nhắn chỉ ghi thêm một dòng, không ghi lại toàn bộ lịch sử
+    - lịch sử của người dùng chỉ được đọc vào bộ nhớ khi họ nhắn tin
+    - người dùng không hoạt động quá idle_ttl giây bị giải phóng khỏi bộ nhớ (dựa trên last_activity)
+    - file bị process khác (bot, API worker) ghi thêm thì được đọc lại ở lần truy cập tiếp theo
+    """
+
+    def __init__(self, base_dir: str, max_messages: int = 20, idle_ttl: float = 3600,
+                 compact_factor: int = 4, legacy_file: Optional[str] = None):
+        self.base_dir = base_dir
+        self.max_messages = max_messages
+        self.idle_ttl = idle_ttl
+        # File được ghi gọn lại khi số dòng vượt quá max_messages * compact_factor
+        self.compact_factor = compact_factor
+        self._conversations: Dict[str, Dict] = {}
+        self._line_counts: Dict[str, int] = {}
+        # (mtime_ns, size) của file sau lần đọc/ghi gần nhất của process này
+        self._signatures: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._lock = threading.RLock()
+        self._sweeper = IdleSweeper()
+        os.makedirs(self.base_dir, exist_ok=True)
+        if legacy_file:
+            self._migrate_legacy_file(legacy_file)
+
+    def _get_file_path(self, user_id: str) -> str:
+        safe_id = re.sub(r'[^0-9A-Za-z_-]', '_', str(user_id))
+        return os.path.join(self.base_dir, f"{safe_id}.jsonl")
+
+    def _signature(self, user_id: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self._get_file_path(user_id))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _migrate_legacy_file(self, legacy_file: str):
+        """Chuyển file conversation_history.json cũ sang log theo người dùng (chỉ chạy một lần)"""
+        if not os.path.exists(legacy_file):
+            return
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for user_id, conversation in data.items():
+                if not isinstance(conversation, dict):
+                    continue
+                messages = conversation.get("messages", [])[-self.max_messages:]
+                if messages and not os.path.exists(self._get_file_path(user_id)):
+                    self._rewrite(str(user_id), messages)
+            os.replace(legacy_file, legacy_file + ".migrated")
+            print(f"✅ Migrated {len(data)} user conversation histories to {self.base_dir}")
+        except Exception as e:
+            print(f"❌ Error migrating conversation history: {e}")
+
+    def _load(self, user_id: str) -> Dict:
+        messages: List[Dict] = []
+        line_count = 0
+        file_path = self._get_file_path(user_id)
+        if os.path.exists(file_path):
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line_count += 1
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            # Dòng cuối có thể bị ghi dở nếu tiến trình dừng đột ngột
+                            continue
+                        if record.get("type") == "clear":
+                            messages = []
+                        else:
+                            messages.append(record)
+            except Exception as e:
+                print(f"❌ Error loading conversation history for {user_id}: {e}")
+
+        self._line_counts[user_id] = line_count
+        self._signatures[user_id] = self._signature(user_id)
+        last_activity = messages[-1].get("timestamp", time.time()) if messages else time.time()
+        return {"messages": messages[-self.max_messages:], "last_activity": last_activity}
+
+    def _append_line(self, user_id: str, record: Dict):
+        try:
+            with open(self._get_file_path(user_id), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._line_counts[user_id] = self._line_counts.get(user_id, 0) + 1
+            self._signatures[user_id] = self._signature(user_id)
+        except Exception as e:
+            print(f"❌ Error saving conversation history for {user_id}: {e}")
+
+    def _rewrite(self, user_id: str, messages: List[Dict]):
+        """Ghi gọn file của một người dùng (ghi file tạm rồi os.replace để không bị hỏng khi crash)"""
+        file_path = self._get_file_path(user_id)
+        tmp_file = file_path + ".tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                for message in messages:
+                    f.write(json.dumps(message, ensure_ascii=False) + "\n")
+            os.replace(tmp_file, file_path)
+            self._line_counts[user_id] = len(messages)
+            self._signatures[user_id] = self._signature(user_id)
+        except Exception as e:
+            print(f"❌ Error compacting conversation history for {user_id}: {e}")
+
+    def get(self, user_id: str) -> Dict:
+        """Trả về {"messages", "last_activity"} của người dùng, đọc từ file nếu chưa có trong bộ nhớ"""
+        user_id = str(user_id)
+        with self._lock:
+            if user_id not in self._conversations or self._signatures.get(user_id) != self._signature(user_id):
+                self._conversations[user_id] = self._load(user_id)
+            return self._conversations[user_id]
+
+    def has_history(self, user_id: str) -> bool:
+        user_id = str(user_id)
+        with self._lock:
+            return user_id in self._conversations or os.path.exists(self._get_file_path(user_id))
+
+    def touch(self, user_id: str, timestamp: Optional[float] = None):
+        self.get(user_id)["last_activity"] = timestamp or time.time()
+        self.evict_idle()
+
+    def append(self, user_id: str, role: str, content: str, timestamp: Optional[float] = None):
+        """Thêm một tin nhắn: ghi thêm một dòng vào log và giữ tối đa max_messages trong bộ nhớ"""
+        user_id = str(user_id)
+        message = {"role": role, "content": content, "timestamp": timestamp or time.time()}
+        with self._lock:
+            conversation = self.get(user_id)
+            conversation["messages"].append(message)
+            if len(conversation["messages"]) > self.max_messages:
+                conversation["messages"] = conversation["messages"][-self.max_messages:]
+            self._append_line(user_id, message)
+            if self._line_counts.get(user_id, 0) > self.max_messages * self.compact_factor:
+                self._rewrite(user_id, conversation["messages"])
+
+    def clear(self, user_id: str):
+        user_id = str(user_id)
+        with self._lock:
+            self.get(user_id)["messages"] = []
+            self._append_line(user_id, {"type": "clear", "timestamp": time.time()})
+
+    def evict_idle(self, now: Optional[float] = None):
+        """Giải phóng lịch sử của người dùng không hoạt động (dữ liệu vẫn còn trên đĩa)"""
+        now = now or time.time()
+        if not self._sweeper.due(now):
+            return
+        with self._lock:
+            idle_users = [
+                user_id for user_id, conversation in self._conversations.items()
+                if now - conversation["last_activity"] > self.idle_ttl
+            ]
+            for user_id in idle_users:
+                del self._conversations[user_id]
+                self._line_counts.pop(user_id, None)
+                self._signatures.pop(user_id, None)
+        if idle_users:
+            print(f"🧹 Evicted {len(idle_users)} idle conversation histories from memory")
@@ -1,62 +1,137 @@
 import google.generativeai as genai
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, CallbackContext
 from telegram import Update
+from telegram.error import RetryAfter, TelegramError
 from datetime import datetime
+import asyncio
 import time
 from .generate_plot import GeneratePlot
+from .llm_client import gemini_client, LLMError
+from .conversation_store import ConversationStore
+from app.core.log import get_logger
 import re
 import io
 import json
 import os
 
+# Telegram giới hạn tần suất sửa tin nhắn (~1 lần/giây cho mỗi chat) và độ dài 4096 ký tự
+STREAM_EDIT_INTERVAL = float(os.getenv("TELEGRAM_STREAM_EDIT_INTERVAL", 1.0))
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+# Số lần thử lại lần sửa cuối khi bị RetryAfter, hết lượt thì gửi phần còn thiếu thành tin nhắn mới
+STREAM_FINAL_EDIT_ATTEMPTS = int(os.getenv("TELEGRAM_STREAM_FINAL_EDIT_ATTEMPTS", 3))
+STREAM_INTERRUPTED_NOTE = "\n\n⚠️ Câu trả lời bị gián đoạn do lỗi kỹ thuật. Vui lòng thử lại."
+
+log = get_logger(__name__)
+
 class Gemini_api:
     def __init__(self):
-        # Initialize with improved conversation history structure
-        self.user_conversations = {}  # Store as dict with timestamp, role, and content
         self.user_plot_data = {}
         self.plot_generator = GeneratePlot(None, None, self)
         self.latex_generator = None
+        self.llm_client = gemini_client
         self.max_history_length = 10  # Increased from 3 to retain more context
-        self.history_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conversation_history.json")
-        self._load_history()
-        
-    def _load_history(self):
-        """Load conversation history from file if it exists"""
-        try:
-            if os.path.exists(self.history_file):
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    self.user_conversations = json.load(f)
-                print(f"✅ Loaded {len(self.user_conversations)} user conversation histories")
-        except Exception as e:
-            print(f"❌ Error loading conversation history: {e}")
-            self.user_conversations = {}
-    
-    def _save_history(self):
-        """Save conversation history to file"""
-        try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.user_conversations, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"❌ Error saving conversation history: {e}")
+        self.stream_responses = os.getenv("GEMINI_STREAM", "true").lower() == "true"
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        # Lịch sử hội thoại: mỗi người dùng một log append-only, chỉ nạp khi cần
+        self.conversations = ConversationStore(
+            os.path.join(base_dir, "conversation_history"),
+            max_messages=self.max_history_length * 2,  # Store more than we use in prompts
+            idle_ttl=float(os.getenv("CONVERSATION_IDLE_TTL", 3600)),
+            legacy_file=os.path.join(base_dir, "conversation_history.json"),
+        )
 
     async def start_command(self, update: Update, context: CallbackContext):
         """Lệnh /start"""
-        user_id = update.message.chat_id
-        self.user_conversations[user_id] = []
+        user_id = str(update.message.chat_id)
+        self.conversations.clear(user_id)
         self.user_plot_data[user_id] = []
         await update.message.reply_text(
             "Xin chào! Tôi là chatbot hỗ trợ với Gemini AI.")
 
     async def generate_ai_response(self, prompt, max_retries=3):
-        for attempt in range(max_retries):
+        # Gọi Gemini bất đồng bộ để không chặn event loop của bot trong lúc chờ LLM
+        try:
+            return await self.llm_client.generate(prompt, max_retries=max_retries)
+        except LLMError:
+            return "Xin lỗi, tôi đang gặp vấn đề kỹ thuật. Vui lòng thử lại sau."
+
+    async def stream_ai_response(self, prompt, max_retries=3):
+        """Stream câu trả lời theo từng đoạn; ném LLMError nếu không nhận được gì từ Gemini"""
+        async for chunk in self.llm_client.stream(prompt, max_retries=max_retries):
+            yield chunk
+
+    async def _reply_streaming(self, update: Update, prompt):
+        """
+        Gửi câu trả lời dạng stream: tạo một tin nhắn ngay khi có đoạn đầu tiên,
+        sau đó sửa dần tin nhắn đó (tối đa một lần mỗi STREAM_EDIT_INTERVAL giây).
+        Trả về toàn bộ câu trả lời để lưu lịch sử.
+        """
+        response = ""
+        sent_text = ""
+        reply = None
+        next_edit = 0.0
+
+        async def edit(text):
+            """Sửa tin nhắn đang stream; True nếu thành công, None nếu bị RetryAfter (thử lại được)"""
+            nonlocal sent_text, next_edit
             try:
-                model = genai.GenerativeModel("gemini-2.0-flash")
-                response = model.generate_content(prompt)
-                return response.text
-            except Exception as e:
-                print(f"❌ Lỗi lần {attempt + 1}: {e}")
-                if attempt == max_retries - 1:
-                    return "Xin lỗi, tôi đang gặp vấn đề kỹ thuật. Vui lòng thử lại sau."
+                await reply.edit_text(text)
+                sent_text = text
+                return True
+            except RetryAfter as e:
+                # Bị Telegram giới hạn: chờ đủ thời gian yêu cầu rồi mới sửa tiếp
+                retry_after = e.retry_after
+                if hasattr(retry_after, "total_seconds"):
+                    retry_after = retry_after.total_seconds()
+                next_edit = time.monotonic() + float(retry_after)
+                return None
+            except TelegramError as e:
+                log.warning("chatbot.stream.edit_failed", error=str(e))
+                return False
+
+        try:
+            async for chunk in self.stream_ai_response(prompt):
+                response += chunk.replace('*', '')
+                text = response[:TELEGRAM_MAX_MESSAGE_LENGTH]
+                if not text.strip():
+                    continue
+                if reply is None:
+                    reply = await update.message.reply_text(text)
+                    sent_text = text
+                    next_edit = time.monotonic() + STREAM_EDIT_INTERVAL
+                elif text != sent_text and time.monotonic() >= next_edit:
+                    next_edit = time.monotonic() + STREAM_EDIT_INTERVAL
+                    await edit(text)
+        except LLMError:
+            if not response:
+                response = "Xin lỗi, tôi đang gặp vấn đề kỹ thuật. Vui lòng thử lại sau."
+            else:
+                # Đã gửi một phần câu trả lời: báo cho người dùng biết câu trả lời chưa đầy đủ
+                log.warning("chatbot.stream.interrupted", chars=len(response))
+                response += STREAM_INTERRUPTED_NOTE
+
+        if reply is None:
+            await update.message.reply_text(response or "Xin lỗi, tôi đang gặp vấn đề kỹ thuật. Vui lòng thử lại sau.")
+            return response
+
+        # Lần sửa cuối luôn gửi nội dung đầy đủ; phần vượt quá giới hạn gửi thành tin nhắn mới
+        final_text = response[:TELEGRAM_MAX_MESSAGE_LENGTH]
+        for _ in range(STREAM_FINAL_EDIT_ATTEMPTS):
+            if final_text == sent_text:
+                break
+            remaining = next_edit - time.monotonic()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+            if await edit(final_text) is not None:
+                break
+        if final_text != sent_text:
+            # Không sửa được tin nhắn: gửi phần người dùng chưa thấy thành tin nhắn mới
+            missing = final_text[len(sent_text):] if final_text.startswith(sent_text) else final_text
+            if missing.strip():
+                await update.message.reply_text(missing)
+        for start in range(TELEGRAM_MAX_MESSAGE_LENGTH, len(response), TELEGRAM_MAX_MESSAGE_LENGTH):
+            await update.message.reply_text(response[start:start + TELEGRAM_MAX_MESSAGE_LENGTH])
+        return response
 
     async def handle_message(self, update: Update, context: CallbackContext):
         """Xử lý tin nhắn"""
@@ -83,30 +158,20 @@ class Gemini_api:
             # Add other handlers for different expected inputs
         
         # Handle text messages as before
-        print(f"📩 Nhận tin nhắn từ người dùng ({user_id}): {message}")
+        # Không ghi nội dung tin nhắn của người dùng ra log, chỉ độ dài
+        log.debug("chatbot.message.received", user_id=user_id, chars=len(message or ""))
 
-        # Initialize chat history if needed with structured format
-        if user_id not in self.user_conversations:
-            self.user_conversations[user_id] = {
-                "messages": [],
-                "last_activity": current_time
-            }
-        
         if user_id not in self.user_plot_data:
             self.user_plot_data[user_id] = []
 
-        # Update last activity time
-        self.user_conversations[user_id]["last_activity"] = current_time
+        # Update last activity time (lịch sử được nạp từ đĩa nếu chưa có trong bộ nhớ)
+        self.conversations.touch(user_id, current_time)
         
         # Handle VNStock related queries - redirect appropriate queries
         stock_keywords = ["chỉ số tài chính", "cổ phiếu", "chứng khoán", "thị trường"]
         if any(keyword in message.lower() for keyword in stock_keywords) and not message.startswith('/'):
             # Save the message in history for context
-            self.user_conversations[user_id]["messages"].append({
-                "role": "user",
-                "content": message,
-                "timestamp": current_time,
-            })
+            self.conversations.append(user_id, "user", message, current_time)
             
             # Generate a response about using search commands
             response = (
@@ -119,11 +184,7 @@ class Gemini_api:
             )
             
             # Save the response
-            self.user_conversations[user_id]["messages"].append({
-                "role": "assistant",
-                "content": response,
-                "timestamp": time.time()
-            })
+            self.conversations.append(user_id, "assistant", response, time.time())
             
             await update.message.reply_text(response)
             return
@@ -148,22 +209,14 @@ class Gemini_api:
         # Xử lý yêu cầu vẽ đồ thị (với phát hiện mở rộng)
         if any(indicator in message.lower() for indicator in plot_indicators) or message.lower().startswith("sửa"):
             # Add to conversation history so we remember the request was made
-            self.user_conversations[user_id]["messages"].append({
-                "role": "user",
-                "content": message,
-                "timestamp": current_time,
-            })
+            self.conversations.append(user_id, "user", message, current_time)
             
             # Forward to plot generator
             description = message.replace("/plot", "").strip()
             await self.plot_generator.generate_plot(update, context, description)
             
             # Save the response to indicate we tried to generate a plot
-            self.user_conversations[user_id]["messages"].append({
-                "role": "assistant",
-                "content": f"Đã xử lý yêu cầu vẽ biểu đồ: '{description}'",
-                "timestamp": time.time(),
-            })
+            self.conversations.append(user_id, "assistant", f"Đã xử lý yêu cầu vẽ biểu đồ: '{description}'", time.time())
             return
         
         # Xử lý yêu cầu đổi loại đồ thị
@@ -187,27 +240,12 @@ class Gemini_api:
                 prompt = prompt.strip()
                 
                 await self.latex_generator.generate_latex(update, context, prompt)
-                self.user_conversations[user_id]["messages"].append({
-                    "role": "user",
-                    "content": message,
-                    "timestamp": current_time,
-                })
-                self.user_conversations[user_id]["messages"].append({
-                    "role": "assistant",
-                    "content": "Đã tạo tài liệu PDF theo yêu cầu của bạn.",
-                    "timestamp": time.time()
-                })
+                self.conversations.append(user_id, "user", message, current_time)
+                self.conversations.append(user_id, "assistant", "Đã tạo tài liệu PDF theo yêu cầu của bạn.", time.time())
                 return
 
-        # Handle regular messages - save with structured format
-        user_message = {
-            "role": "user",
-            "content": message,
-            "timestamp": current_time,
-        }
-        
         # Add user message to history
-        self.user_conversations[user_id]["messages"].append(user_message)
+        self.conversations.append(user_id, "user", message, current_time)
         
         # Get conversation history - process the structured format for the Gemini prompt
         conversation_history = self._format_conversation_history(user_id)
@@ -239,39 +277,26 @@ class Gemini_api:
 
         try:
             # Generate response
-            response = await self.generate_ai_response(prompt)
-            response = response.replace('*', '')
-            print(f"🤖 Phản hồi từ Gemini: {response}")
-            
-            # Save bot response with structured format
-            bot_message = {
-                "role": "assistant", 
-                "content": response,
-                "timestamp": time.time()
-            }
-            
-            self.user_conversations[user_id]["messages"].append(bot_message)
+            if self.stream_responses:
+                response = await self._reply_streaming(update, prompt)
+            else:
+                response = await self.generate_ai_response(prompt)
+                response = response.replace('*', '')
+                await update.message.reply_text(response)
+            log.debug("chatbot.message.replied", user_id=user_id, chars=len(response or ""))
             
-            # Trim conversation history if it gets too long
-            self._trim_conversation_history(user_id)
+            # Save bot response (chỉ ghi thêm một dòng vào log của người dùng)
+            self.conversations.append(user_id, "assistant", response, time.time())
             
-            # Save history periodically
-            self._save_history()
-            
-            await update.message.reply_text(response)
-            print("✅ Gửi tin nhắn thành công!")
             
         except Exception as e:
-            print(f"❌ Lỗi khi gửi tin nhắn: {e}")
+            log.warning("chatbot.message.failed", user_id=user_id, error=str(e))
             await update.message.reply_text("Xin lỗi, đã xảy ra lỗi. Vui lòng thử lại sau.")
     
     def _format_conversation_history(self, user_id):
         """Format conversation history for prompt context"""
-        if user_id not in self.user_conversations:
-            return ""
-            
         # Get messages and check if we have any
-        messages = self.user_conversations[user_id]["messages"]
+        messages = self.conversations.get(user_id)["messages"]
         if not messages:
             return ""
             
@@ -286,29 +311,15 @@ class Gemini_api:
             
         return "\n".join(formatted_messages)
     
-    def _trim_conversation_history(self, user_id):
-        """Trim conversation history to avoid it getting too long"""
-        if user_id not in self.user_conversations:
-            return
-            
-        messages = self.user_conversations[user_id]["messages"]
-        max_history = self.max_history_length * 2  # Store more than we use in prompts
-        
-        if len(messages) > max_history:
-            # Keep only the most recent messages
-            self.user_conversations[user_id]["messages"] = messages[-max_history:]
-
     async def clear_history(self, update: Update, context: CallbackContext):
         """Clear conversation history for a user"""
         user_id = str(update.message.chat_id)
         
-        if user_id in self.user_conversations:
-            self.user_conversations[user_id]["messages"] = []
+        if self.conversations.has_history(user_id):
+            self.conversations.clear(user_id)
             await update.message.reply_text("🧹 Lịch sử cuộc trò chuyện đã được xóa.")
         else:
             await update.message.reply_text("Không tìm thấy lịch sử cuộc trò chuyện nào.")
-        
-        self._save_history()
 
     async def handle_plot_callback(self, update: Update, context: CallbackContext):
         """Delegate plot callbacks to the plot_generator"""
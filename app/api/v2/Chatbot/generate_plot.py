@@ -1,5 +1,5 @@
-import matplotlib.pyplot as plt
 import numpy as np
+import textwrap
 import re
 import io
 import os
@@ -7,6 +7,11 @@ import json
 from datetime import datetime
 from telegram import Update
 from telegram.ext import CallbackContext
+from .plot_worker import plot_worker_pool, PlotRenderError
+from .plot_spec import build_spec, apply_edit, spec_to_code, spec_hash, render_cache
+from app.core.log import get_logger
+
+log = get_logger(__name__)
 
 class GeneratePlot:
     def __init__(self, x, y, gemini_api=None):
@@ -21,6 +26,7 @@ class GeneratePlot:
             r'```python\s*',  # Xóa markdown
             r'```\s*',
             r'plt\.show\(\)',  # Xóa lệnh hiển thị
+            r'plt\.savefig\(.*\)',  # Worker tự lưu ảnh, code không được ghi file
             r'#.*\n',  # Xóa comment
             r'print\(.*\)\n'  # Xóa lệnh print
         ]
@@ -30,7 +36,7 @@ class GeneratePlot:
 
     def get_default_plot_code(self):
         """Return a safe default plot when everything else fails"""
-        return """
+        return textwrap.dedent("""
         import matplotlib.pyplot as plt
         import numpy as np
 
@@ -44,7 +50,7 @@ class GeneratePlot:
         plt.title('Biểu đồ mẫu - Doanh số sản phẩm')
         plt.ylabel('Doanh số (triệu đồng)')
         plt.grid(axis='y', linestyle='--', alpha=0.7)
-        """
+        """)
 
     async def generate_plot_code(self, description, last_data=None, plot_type=None):
         """Generate plot code using AI with better context about previous data"""
@@ -61,7 +67,7 @@ class GeneratePlot:
                 if data_vars:
                     last_data_str = "\n".join(data_vars)
             except Exception as e:
-                print(f"Error formatting previous plot data: {e}")
+                log.warning("chatbot.plot.format_data_failed", error=str(e))
                 last_data_str = "Error accessing previous data"
 
         prompt = f"""
@@ -94,7 +100,7 @@ class GeneratePlot:
             cleaned_code = self.clean_generated_code(code) if code else None
             return cleaned_code or self.get_default_plot_code()
         except Exception as e:
-            print(f"Error generating plot code: {e}")
+            log.warning("chatbot.plot.generate_code_failed", error=str(e))
             return self.get_default_plot_code()
 
     def _detect_plot_type(self, description):
@@ -122,7 +128,7 @@ class GeneratePlot:
                          "thay", "điều chỉnh", "hiệu chỉnh"]
         return any(keyword in description.lower() for keyword in edit_keywords)
 
-    def _store_plot_data(self, user_id, description, code, data_vars):
+    def _store_plot_data(self, user_id, description, code, data_vars, spec=None):
         """Store plot data with enhanced metadata"""
         if user_id not in self.user_plot_data:
             self.user_plot_data[user_id] = []
@@ -133,7 +139,9 @@ class GeneratePlot:
             "code": code,
             "data": data_vars,
             "timestamp": datetime.now().isoformat(),
-            "plot_type": self._detect_plot_type(description)
+            "plot_type": spec["type"] if spec else self._detect_plot_type(description),
+            # Spec (kiểu, dữ liệu, nhãn, style) để sửa đồ thị mà không cần gọi lại Gemini
+            "spec": spec,
         }
         
         # Add to user's plot history
@@ -159,6 +167,15 @@ class GeneratePlot:
         # Default to most recent plot
         return self.user_plot_data[user_id][-1]
 
+    async def _render_spec(self, spec):
+        """Vẽ đồ thị từ spec, dùng lại ảnh đã render nếu spec không đổi"""
+        key = spec_hash(spec)
+        image = render_cache.get(key)
+        if image is None:
+            image, _, _ = await plot_worker_pool.render(spec_to_code(spec))
+            render_cache.put(key, image)
+        return image
+
     async def generate_plot(self, update: Update, context: CallbackContext, description: str):
         user_id = update.message.chat_id
         try:
@@ -170,6 +187,7 @@ class GeneratePlot:
 
             # Check if this is an edit request and get relevant previous plot data
             last_data = None
+            spec = None
             plot_type = self._detect_plot_type(description)
             
             if self._is_edit_request(description):
@@ -178,44 +196,37 @@ class GeneratePlot:
                     last_data = prev_plot.get("data", {})
                     if not plot_type and "plot_type" in prev_plot:
                         plot_type = prev_plot.get("plot_type")
+                    if prev_plot.get("spec"):
+                        # Chỉ xét phần yêu cầu, bỏ phần mô tả đồ thị cũ được ghép vào khi "đổi loại đồ thị"
+                        instruction = description.split("Dựa trên đồ thị:")[0]
+                        spec = apply_edit(prev_plot["spec"], instruction)
                     await update.message.reply_text("🔄 Đang chỉnh sửa biểu đồ trước đó...")
 
-            # Tạo code vẽ đồ thị
-            plot_code = await self.generate_plot_code(description, last_data, plot_type)
-
-            # Thực thi code
-            plt.clf()
-            exec_globals = {"plt": plt, "np": np, "io": io}
-            exec_locals = {}
             try:
-                # Fix any code that might try to save files
-                modified_code = plot_code.replace("plt.savefig", "# plt.savefig")
-                exec(modified_code, exec_globals, exec_locals)
-            except Exception as e:
-                error_msg = f"🚨 LỖI CODE:\n{plot_code}\nLỖI: {str(e)}"
-                print(error_msg)
+                if spec:
+                    # Sửa kiểu/màu/tiêu đề: vẽ lại từ dữ liệu đã lưu, không cần gọi Gemini
+                    plot_code = spec_to_code(spec)
+                    image = await self._render_spec(spec)
+                    data_to_store = last_data
+                else:
+                    # Tạo code vẽ đồ thị
+                    plot_code = await self.generate_plot_code(description, last_data, plot_type)
+                    # Thực thi code trong worker process riêng (có giới hạn thời gian/CPU/bộ nhớ)
+                    # Fix any code that might try to save files
+                    modified_code = plot_code.replace("plt.savefig", "# plt.savefig")
+                    image, data_to_store, meta = await plot_worker_pool.render(modified_code)
+                    spec = build_spec(data_to_store, meta, plot_type)
+            except PlotRenderError as e:
+                # Không ghi cả đoạn code ra log, chỉ độ dài để tra lỗi
+                log.warning("chatbot.plot.render_failed", user_id=user_id, code_chars=len(plot_code or ""), error=str(e))
                 # Ask user to try again instead of using a default plot
                 await update.message.reply_text("⚠️ Không thể tạo biểu đồ với yêu cầu này. Vui lòng mô tả lại với yêu cầu cụ thể hơn.")
-                plt.close()  # Make sure to close any partial figure
                 return  # Exit the function early
 
-            # Lưu đồ thị vào buffer
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-            buffer.seek(0)
-
-            # Extract variable data for storage
-            data_to_store = {}
-            for var_name, var_value in exec_locals.items():
-                if isinstance(var_value, (list, np.ndarray)) and len(var_value) > 0:
-                    # Convert numpy arrays to lists for easier storage
-                    if isinstance(var_value, np.ndarray):
-                        data_to_store[var_name] = var_value.tolist()
-                    else:
-                        data_to_store[var_name] = var_value
+            buffer = io.BytesIO(image)
 
             # Store plot data with enhanced metadata
-            self._store_plot_data(user_id, description, plot_code, data_to_store)
+            self._store_plot_data(user_id, description, plot_code, data_to_store, spec)
 
             # Gửi ảnh qua Telegram
             await update.message.reply_photo(photo=buffer, caption=f"📊 {description}")
@@ -229,20 +240,7 @@ class GeneratePlot:
             )
             await update.message.reply_text(help_message)
 
-            # Đóng figure
-            plt.close()
-            
-            # Clean up any potential temporary files in the current directory
-            for file in os.listdir('.'):
-                if file.endswith('.png') and (file == 'plot.png' or file.startswith('plt_')):
-                    try:
-                        os.remove(file)
-                        print(f"✅ Đã xóa file tạm: {file}")
-                    except Exception as e:
-                        print(f"❌ Không thể xóa file {file}: {e}")
-
         except Exception as e:
-            print(f"❌ Lỗi khi tạo đồ thị: {e}")
+            log.warning("chatbot.plot.failed", user_id=user_id, error=str(e))
             # Ask the user to try again with a different request instead of creating a fallback plot
-            plt.close()  # Make sure to close any partial figure
             await update.message.reply_text("❌ Xảy ra lỗi khi xử lý yêu cầu. Vui lòng thử lại với cách mô tả khác.")
\ No newline at end of file
@@ -1,53 +1,186 @@
-import subprocess
+from typing import Dict, Tuple
+import threading
+import hashlib
+import asyncio
+import time
+import re
 import os
 import shutil
 
-def compile_latex_to_pdf(latex_file, output_dir=None):
-    if output_dir is None:
-        output_dir = os.path.dirname(latex_file)
-    
-    # Ensure output directory exists
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Get filename without path and extension
-    base_filename = os.path.basename(latex_file)
-    filename_no_ext = os.path.splitext(base_filename)[0]
-    
-    # Working directory and command
-    working_dir = os.path.dirname(latex_file)
-    
-    command = [
-        "xelatex", #pylatex
-        "-interaction=nonstopmode",
-        "-halt-on-error",
-        f"-output-directory={output_dir}",
-        latex_file
-    ]
-
-    try:
-        # Run xelatex twice for proper cross-references and TOC
-        for _ in range(2):
-            result = subprocess.run(command, 
-                                   capture_output=True, 
-                                   text=True,
-                                   cwd=working_dir)
-            
-            # Check if compilation was successful
-            if result.returncode != 0:
-                return False, f"Lỗi biên dịch LaTeX:\n{result.stderr[:500]}..."
-        
-        # PDF file path
+# Số lần xelatex chạy đồng thời (mỗi lần chiếm trọn 1 core), các yêu cầu còn lại xếp hàng
+LATEX_MAX_CONCURRENCY = int(os.getenv("LATEX_MAX_CONCURRENCY", 2))
+LATEX_TIMEOUT = int(os.getenv("LATEX_TIMEOUT", 120))
+LATEX_CACHE_MAX_FILES = int(os.getenv("LATEX_CACHE_MAX_FILES", 200))
+
+# File phụ mà lần chạy sau đọc lại: mục lục, danh sách hình/bảng, bookmark của hyperref
+REFERENCE_FILE_EXTENSIONS = ['.toc', '.lof', '.lot', '.out']
+# Chỉ các dòng tham chiếu trong .aux (nhãn, trích dẫn) quyết định có cần chạy lại hay không
+AUX_REFERENCE_PATTERN = re.compile(r"^\\(?:newlabel|bibcite|@writefile)\b.*$", re.MULTILINE)
+RERUN_PATTERN = re.compile(r"Rerun to get|Label\(s\) may have changed|There were undefined references")
+
+def _reference_state(output_dir, filename_no_ext):
+    """Dấu vết các tham chiếu mà xelatex sẽ đọc ở lần chạy tiếp theo"""
+    digest = hashlib.sha256()
+    aux_file = os.path.join(output_dir, f"{filename_no_ext}.aux")
+    if os.path.exists(aux_file):
+        with open(aux_file, "r", encoding="utf-8", errors="replace") as f:
+            digest.update("\n".join(AUX_REFERENCE_PATTERN.findall(f.read())).encode("utf-8"))
+    for ext in REFERENCE_FILE_EXTENSIONS:
+        ref_file = os.path.join(output_dir, f"{filename_no_ext}{ext}")
+        digest.update(ext.encode("utf-8"))
+        if os.path.exists(ref_file):
+            with open(ref_file, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+def _needs_rerun(output_dir, filename_no_ext, state_before):
+    if _reference_state(output_dir, filename_no_ext) != state_before:
+        return True
+    log_file = os.path.join(output_dir, f"{filename_no_ext}.log")
+    if os.path.exists(log_file):
+        with open(log_file, "r", encoding="utf-8", errors="replace") as f:
+            return RERUN_PATTERN.search(f.read()) is not None
+    return False
+
+def _hash_file(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+class LatexCompiler:
+    """
+    Dịch vụ biên dịch LaTeX bất đồng bộ:
+    - xelatex chạy bằng asyncio.create_subprocess_exec, không chặn event loop của bot/API;
+      đọc/ghi file (hash, .aux/.log, cache PDF) chạy trong thread bằng asyncio.to_thread
+    - tối đa max_concurrency lần biên dịch cùng lúc, các yêu cầu khác chờ lượt
+    - lần chạy thứ hai chỉ khi tham chiếu (.aux/.toc/...) thay đổi sau lần đầu
+    - PDF được cache theo hash của mã nguồn LaTeX
+    """
+
+    def __init__(self, max_concurrency=LATEX_MAX_CONCURRENCY, timeout=LATEX_TIMEOUT,
+                 cache_dir=None, max_cache_files=LATEX_CACHE_MAX_FILES):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdf_cache")
+        self.max_cache_files = max_cache_files
+        # Bot và API có thể chạy trên các event loop khác nhau, mỗi loop một semaphore
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._semaphores:
+                self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+            return self._semaphores[loop]
+
+    def _cache_path(self, source_hash) -> str:
+        return os.path.join(self.cache_dir, f"{source_hash}.pdf")
+
+    def _restore_from_cache(self, source_hash, pdf_path) -> bool:
+        cached_file = self._cache_path(source_hash)
+        if not os.path.exists(cached_file):
+            return False
+        shutil.copyfile(cached_file, pdf_path)
+        os.utime(cached_file)  # Đánh dấu vừa dùng để không bị xoá khi dọn cache
+        return True
+
+    def _save_to_cache(self, source_hash, pdf_path):
+        cached_file = self._cache_path(source_hash)
+        tmp_file = cached_file + ".tmp"
+        try:
+            shutil.copyfile(pdf_path, tmp_file)
+            os.replace(tmp_file, cached_file)
+            cached = sorted(
+                (os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith(".pdf")),
+                key=os.path.getmtime,
+            )
+            for old_file in cached[:max(0, len(cached) - self.max_cache_files)]:
+                os.remove(old_file)
+        except OSError as e:
+            print(f"Error saving PDF cache {cached_file}: {str(e)}")
+
+    async def _run_xelatex(self, command, working_dir) -> Tuple[int, str]:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=working_dir,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        try:
+            output, _ = await asyncio.wait_for(process.communicate(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        return process.returncode, output.decode("utf-8", errors="replace")
+
+    async def compile(self, latex_file, output_dir=None) -> Tuple[bool, str, Dict[str, float]]:
+        """
+        Biên dịch file .tex thành PDF.
+        Trả về (thành công, đường dẫn PDF hoặc thông báo lỗi, thời gian từng bước tính bằng giây).
+        """
+        if output_dir is None:
+            output_dir = os.path.dirname(latex_file)
+        os.makedirs(output_dir, exist_ok=True)
+
+        filename_no_ext = os.path.splitext(os.path.basename(latex_file))[0]
+        working_dir = os.path.dirname(latex_file)
         pdf_path = os.path.join(output_dir, f"{filename_no_ext}.pdf")
-        
-        # Check if PDF was created
-        if os.path.exists(pdf_path):
+        command = [
+            "xelatex",
+            "-interaction=nonstopmode",
+            "-halt-on-error",
+            f"-output-directory={output_dir}",
+            latex_file
+        ]
+
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+        try:
+            source_hash = await asyncio.to_thread(_hash_file, latex_file)
+            if await asyncio.to_thread(self._restore_from_cache, source_hash, pdf_path):
+                timings["cache"] = time.perf_counter() - started
+                timings["total"] = timings["cache"]
+                return True, pdf_path, timings
+
+            async with self._get_semaphore():
+                timings["queue"] = time.perf_counter() - started
+                # Yêu cầu giống hệt có thể vừa biên dịch xong trong lúc chờ lượt
+                if await asyncio.to_thread(self._restore_from_cache, source_hash, pdf_path):
+                    timings["cache"] = time.perf_counter() - started - timings["queue"]
+                    timings["total"] = time.perf_counter() - started
+                    return True, pdf_path, timings
+
+                for run in (1, 2):
+                    state_before = await asyncio.to_thread(_reference_state, output_dir, filename_no_ext)
+                    stage_started = time.perf_counter()
+                    returncode, output = await self._run_xelatex(command, working_dir)
+                    timings[f"pass{run}"] = time.perf_counter() - stage_started
+                    if returncode != 0:
+                        timings["total"] = time.perf_counter() - started
+                        return False, f"Lỗi biên dịch LaTeX:\n{output[-500:]}...", timings
+                    if not await asyncio.to_thread(_needs_rerun, output_dir, filename_no_ext, state_before):
+                        break
+
+            timings["total"] = time.perf_counter() - started
+            if not os.path.exists(pdf_path):
+                return False, "PDF không được tạo ra mặc dù không có lỗi biên dịch", timings
+
+            await asyncio.to_thread(self._save_to_cache, source_hash, pdf_path)
             print(f"✅ PDF đã tạo thành công tại: {pdf_path}")
-            return True, pdf_path
-        else:
-            return False, "PDF không được tạo ra mặc dù không có lỗi biên dịch"
-            
-    except Exception as e:
-        return False, f"Lỗi khi biên dịch: {str(e)}"
+            return True, pdf_path, timings
+
+        except asyncio.TimeoutError:
+            timings["total"] = time.perf_counter() - started
+            return False, f"Biên dịch LaTeX quá {self.timeout} giây", timings
+        except Exception as e:
+            timings["total"] = time.perf_counter() - started
+            return False, f"Lỗi khi biên dịch: {str(e)}", timings
+
+def format_timings(timings: Dict[str, float]) -> str:
+    return ", ".join(f"{stage}={seconds:.2f}s" for stage, seconds in timings.items())
 
 def clean_latex_auxiliary_files(output_dir, filename_no_ext):
     """Remove auxiliary files created during LaTeX compilation"""
@@ -59,3 +192,6 @@ def clean_latex_auxiliary_files(output_dir, filename_no_ext):
                 os.remove(aux_file)
             except:
                 pass  # Ignore errors in cleanup
+
+# Sử dụng một instance duy nhất cho toàn bộ ứng dụng
+latex_compiler = LatexCompiler()
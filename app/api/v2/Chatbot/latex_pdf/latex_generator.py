@@ -8,7 +8,7 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-from compile_latex import compile_latex_to_pdf, clean_latex_auxiliary_files
+from compile_latex import latex_compiler, format_timings, clean_latex_auxiliary_files
 
 class LatexGenerator:
     def __init__(self, gemini_api):
@@ -99,8 +99,9 @@ class LatexGenerator:
             # Let the user know compilation is starting
             await update.message.reply_text("Đang biên dịch LaTeX thành PDF...")
             
-            # Compile to PDF
-            success, result = compile_latex_to_pdf(tex_filepath, self.pdf_dir)
+            # Compile to PDF (bất đồng bộ, không chặn các tin nhắn khác)
+            success, result, timings = await latex_compiler.compile(tex_filepath, self.pdf_dir)
+            print(f"⏱️ LaTeX {tex_filename}: {format_timings(timings)}")
             
             # Store reference to files
             if user_id not in self.user_latex_files:
@@ -0,0 +1,127 @@
+import google.generativeai as genai
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import random
+import os
+
+DEFAULT_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
+
+class LLMError(Exception):
+    """Lỗi khi gọi Gemini sau khi đã retry hết số lần cho phép"""
+
+class AsyncGeminiClient:
+    """
+    Client bất đồng bộ cho Gemini:
+    - dùng API async của SDK (fallback sang executor riêng nếu SDK không hỗ trợ)
+    - timeout cho mỗi lần gọi, retry với exponential backoff + jitter
+    - giới hạn số request đồng thời (mỗi event loop một semaphore)
+    """
+
+    def __init__(self, model_name=None, max_concurrency=None, timeout=None,
+                 max_retries=3, base_delay=1.0, max_delay=20.0):
+        self.model_name = model_name or DEFAULT_MODEL
+        self.max_concurrency = max_concurrency or int(os.getenv("LLM_MAX_CONCURRENCY", 8))
+        self.timeout = timeout or float(os.getenv("LLM_TIMEOUT", 60))
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._models = {}
+        self._semaphores = {}
+        self._executor = None
+
+    def _get_model(self, model_name):
+        if model_name not in self._models:
+            self._models[model_name] = genai.GenerativeModel(model_name)
+        return self._models[model_name]
+
+    def _get_semaphore(self):
+        # asyncio.Semaphore gắn với event loop: bot Telegram và FastAPI có thể chạy ở hai loop khác nhau
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="gemini")
+        return self._executor
+
+    def _backoff_delay(self, attempt):
+        # Full jitter: ngẫu nhiên trong [0, min(max_delay, base * 2^attempt)]
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def _call(self, model, prompt, **kwargs):
+        if hasattr(model, "generate_content_async"):
+            return await model.generate_content_async(prompt, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), lambda: model.generate_content(prompt, **kwargs))
+
+    async def generate(self, prompt, model_name=None, timeout=None, max_retries=None, **kwargs):
+        """Sinh câu trả lời; ném LLMError nếu thất bại sau khi retry, CancelledError được truyền nguyên vẹn"""
+        model = self._get_model(model_name or self.model_name)
+        timeout = timeout or self.timeout
+        max_retries = max_retries or self.max_retries
+        last_error = None
+
+        for attempt in range(max_retries):
+            try:
+                async with self._get_semaphore():
+                    response = await asyncio.wait_for(self._call(model, prompt, **kwargs), timeout=timeout)
+                return response.text
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                last_error = e
+                print(f"❌ Lỗi lần {attempt + 1}: {str(e) or type(e).__name__}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(self._backoff_delay(attempt))
+
+        raise LLMError(str(last_error) or type(last_error).__name__)
+
+    async def stream(self, prompt, model_name=None, timeout=None, max_retries=None, **kwargs):
+        """
+        Sinh câu trả lời dạng stream, yield từng đoạn text ngay khi Gemini trả về.
+        Chỉ retry khi chưa nhận được đoạn nào; timeout áp dụng cho thời gian chờ mỗi đoạn.
+        """
+        model = self._get_model(model_name or self.model_name)
+        timeout = timeout or self.timeout
+        max_retries = max_retries or self.max_retries
+
+        if not hasattr(model, "generate_content_async"):
+            # SDK cũ không có stream async: trả về cả câu trả lời một lần
+            yield await self.generate(prompt, model_name, timeout, max_retries, **kwargs)
+            return
+
+        last_error = None
+        for attempt in range(max_retries):
+            emitted = False
+            try:
+                async with self._get_semaphore():
+                    response = await asyncio.wait_for(
+                        model.generate_content_async(prompt, stream=True, **kwargs), timeout=timeout)
+                    chunks = response.__aiter__()
+                    while True:
+                        try:
+                            chunk = await asyncio.wait_for(chunks.__anext__(), timeout=timeout)
+                        except StopAsyncIteration:
+                            break
+                        text = getattr(chunk, "text", "")
+                        if text:
+                            emitted = True
+                            yield text
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                last_error = e
+                print(f"❌ Lỗi stream lần {attempt + 1}: {str(e) or type(e).__name__}")
+                # Đã gửi một phần cho người dùng thì không retry để tránh lặp nội dung
+                if emitted:
+                    break
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(self._backoff_delay(attempt))
+
+        raise LLMError(str(last_error) or type(last_error).__name__)
+
+# Dùng chung một client (và một giới hạn đồng thời) cho cả bot và API
+gemini_client = AsyncGeminiClient()
@@ -1,11 +1,10 @@
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, CallbackContext, CallbackQueryHandler
-from flask import Flask, request
+from fastapi import APIRouter, Request, Response
 import google.generativeai as genai
 import matplotlib.pyplot as plt
 import numpy as np
 import io
-import threading
 import re
 from dotenv import load_dotenv
 import os
@@ -13,15 +12,28 @@ from .gemini_api import Gemini_api
 from .latex_pdf.latex_generator import LatexGenerator
 import datetime
 from .vnstock_service.service import VNStockService
+from .plot_worker import plot_worker_pool
+from app.core.log import get_logger
+from app.core.process_lock import ProcessLock
 
-# Create Flask app
-flask_app = Flask(__name__)
+log = get_logger(__name__)
+
+# Webhook: Telegram gửi update thẳng vào FastAPI, xử lý trên cùng event loop với API
+webhook_router = APIRouter()
+WEBHOOK_PATH = "/webhook"
+WEBHOOK_URL = os.getenv("WEBHOOK_URL")  # Địa chỉ công khai của server, ví dụ https://bot.example.com
+WEBHOOK_SECRET = os.getenv("TELEGRAM_WEBHOOK_SECRET")
+# Số update đang chờ xử lý tối đa, vượt quá thì trả 503 để Telegram gửi lại sau
+WEBHOOK_MAX_PENDING = int(os.getenv("TELEGRAM_WEBHOOK_MAX_PENDING", 256))
 
 # Initialize global variables
 app = None
 gemini_bot = None
 vnstock_service = None
 latex_generator = None
+pending_webhook_updates = 0  # Update webhook đã nhận nhưng chưa xử lý xong
+# Giữ khoá suốt vòng đời process: chỉ process giữ khoá gọi set_webhook
+webhook_lock = ProcessLock("telegram_set_webhook", ttl=60)
 
 def initialize_bot():
     """Initialize the Telegram bot and all services"""
@@ -37,18 +49,22 @@ def initialize_bot():
     genai.configure(api_key=GEMINI_API_KEY)
     
     # Initialize Telegram app
-    app = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+    # Xử lý nhiều update song song để một câu trả lời chậm không chặn người dùng khác
+    concurrent_updates = int(os.getenv("TELEGRAM_CONCURRENT_UPDATES", 32))
+    app = Application.builder().token(TELEGRAM_BOT_TOKEN).concurrent_updates(concurrent_updates).build()
     
     # Initialize services
     vnstock_service = VNStockService()
     gemini_bot = Gemini_api()
     latex_generator = LatexGenerator(gemini_bot)
     gemini_bot.latex_generator = latex_generator
+    # Khởi động sẵn các worker vẽ đồ thị (import matplotlib mất vài giây)
+    plot_worker_pool.warm_up()
     
     # Register all command handlers
     register_commands()
     
-    return app, flask_app
+    return app
 
 async def start_command(update: Update, context: CallbackContext):
     """Lệnh /start"""
@@ -168,7 +184,7 @@ async def search_info_command(update: Update, context: CallbackContext):
     # Call VNStockService to get company info
     try:
         # First set the current symbol
-        vnstock_service.current_symbol = symbol
+        vnstock_service.get_session(update).symbol = symbol
         
         # Then get company information using existing method
         time_period = datetime.datetime.now().strftime("%Y%m%d")
@@ -209,22 +225,70 @@ def register_commands():
     app.add_handler(CallbackQueryHandler(vnstock_service.handle_callback, pattern="^company_section_"))
     print("✅ All commands registered!")
 
-@flask_app.route("/")
-def home():
-    return "Bot is running!"
+async def _process_webhook_update(update: Update):
+    global pending_webhook_updates
+    try:
+        # update_processor giới hạn số update xử lý song song (TELEGRAM_CONCURRENT_UPDATES)
+        await app.update_processor.process_update(update, app.process_update(update))
+    except Exception:
+        log.exception("telegram.webhook_update_failed", update_id=update.update_id)
+    finally:
+        pending_webhook_updates -= 1
 
-@flask_app.route("/webhook", methods=["POST"])
-def webhook():
+@webhook_router.post(WEBHOOK_PATH)
+async def webhook(request: Request):
     """Xử lý Webhook từ Telegram"""
-    update_json = request.get_json(force=True)
-    print("📩 Nhận tin nhắn từ Telegram:", update_json)
-    update = Update.de_json(update_json, app)
-    app.update_queue.put(update)
-    return "ok"
+    global pending_webhook_updates
+    if WEBHOOK_SECRET and request.headers.get("X-Telegram-Bot-Api-Secret-Token") != WEBHOOK_SECRET:
+        return Response(status_code=403)
+    if app is None or not app.running:
+        return Response(status_code=503)
+    if pending_webhook_updates >= WEBHOOK_MAX_PENDING:
+        # Telegram sẽ gửi lại update này sau, không nhận thêm khi đang quá tải
+        return Response(status_code=503, headers={"Retry-After": "1"})
+
+    update = Update.de_json(await request.json(), app.bot)
+    # Cùng event loop với Application nên xử lý trực tiếp, không qua hàng đợi giữa các thread
+    pending_webhook_updates += 1
+    app.create_task(_process_webhook_update(update), update=update)
+    return Response(status_code=200)
+
+async def start_webhook():
+    """Khởi động Application trên event loop của FastAPI và đăng ký webhook với Telegram"""
+    await app.initialize()
+    await app.start()
+    # Chỉ một process đăng ký webhook với Telegram (phòng khi nhiều process/máy cùng khởi động)
+    if WEBHOOK_URL and webhook_lock.acquire():
+        await app.bot.set_webhook(
+            url=WEBHOOK_URL.rstrip("/") + WEBHOOK_PATH,
+            secret_token=WEBHOOK_SECRET,
+            allowed_updates=Update.ALL_TYPES,
+            max_connections=int(os.getenv("TELEGRAM_WEBHOOK_MAX_CONNECTIONS", 40)),
+        )
+    print("🌐 Telegram webhook is ready!")
+
+async def stop_webhook():
+    if app is not None and app.running:
+        await app.stop()
+        await app.shutdown()
 
-def run_flask():
-    """Chạy Flask để xử lý Webhook"""
-    flask_app.run(host="0.0.0.0", port=8080)
+def create_webhook_app():
+    """FastAPI chỉ gồm /webhook cho role bot (một process) khi API chạy nhiều worker"""
+    from fastapi import FastAPI
+
+    webhook_app = FastAPI(title="ChatBot Finance Telegram Webhook")
+    webhook_app.include_router(webhook_router, tags=["Telegram"])
+
+    @webhook_app.on_event("startup")
+    async def _startup():
+        initialize_bot()
+        await start_webhook()
+
+    @webhook_app.on_event("shutdown")
+    async def _shutdown():
+        await stop_webhook()
+
+    return webhook_app
 
 def run_bot():
     """Run the bot directly"""
@@ -233,12 +297,7 @@ def run_bot():
     # Initialize bot and services
     initialize_bot()
     
-    # Start the Flask server in a separate thread if webhook mode is used
-    if os.getenv("USE_WEBHOOK", "False").lower() == "true":
-        threading.Thread(target=run_flask, daemon=True).start()
-        print("🌐 Webhook server started!")
-    
-    # Start the bot
+    # Start the bot (chế độ webhook chạy cùng FastAPI trong app/main.py)
     print("✅ Bot started successfully! Press Ctrl+C to stop.")
     app.run_polling()
 
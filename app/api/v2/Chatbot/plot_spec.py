@@ -0,0 +1,192 @@
+from collections import OrderedDict
+from typing import Dict, Optional
+import threading
+import hashlib
+import json
+import re
+
+# Các kiểu đồ thị có thể vẽ lại trực tiếp từ spec (không cần gọi Gemini)
+SPEC_PLOT_TYPES = ("line", "bar", "pie", "scatter", "area")
+
+PLOT_TYPE_KEYWORDS = [
+    ("line", ["đường", "line", "xu hướng"]),
+    ("bar", ["cột", "bar", "histogram"]),
+    ("pie", ["tròn", "pie", "bánh"]),
+    ("scatter", ["scatter", "điểm", "chấm", "phân tán"]),
+    ("area", ["area", "vùng", "diện tích"]),
+]
+
+# Tên màu tiếng Việt/tiếng Anh -> màu matplotlib (cụm dài đặt trước để "xanh lá" không bị nhận là "xanh")
+COLOR_KEYWORDS = [
+    ("xanh lá", "green"), ("xanh dương", "blue"), ("xanh lam", "blue"), ("đỏ", "red"),
+    ("vàng", "gold"), ("cam", "orange"), ("tím", "purple"), ("hồng", "pink"), ("đen", "black"),
+    ("xám", "gray"), ("nâu", "brown"), ("xanh", "blue"),
+    ("green", "green"), ("blue", "blue"), ("red", "red"), ("yellow", "gold"), ("orange", "orange"),
+    ("purple", "purple"), ("pink", "pink"), ("black", "black"), ("gray", "gray"), ("brown", "brown"),
+]
+
+# Yêu cầu thay đổi dữ liệu thì vẫn phải nhờ Gemini sinh lại code
+DATA_EDIT_KEYWORDS = ["thêm dữ liệu", "số liệu", "dữ liệu", "thêm cột", "thêm đường", "bớt", "xóa", "xoá", "data"]
+
+def _is_number_list(values) -> bool:
+    return isinstance(values, list) and len(values) > 0 and all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)
+
+def build_spec(data: Dict, meta: Dict, plot_type: Optional[str] = None) -> Optional[Dict]:
+    """
+    Tạo spec từ dữ liệu và nhãn của đồ thị vừa render:
+    trục x là list nhãn chữ (hoặc list số đầu tiên), các series là các list số cùng độ dài.
+    Trả về None nếu không suy ra được cấu trúc đơn giản.
+    """
+    plot_type = meta.get("type") or plot_type
+    if plot_type not in SPEC_PLOT_TYPES or not data:
+        return None
+
+    lists = [(name, values) for name, values in data.items() if isinstance(values, list) and values]
+    x_name, x_values = next(
+        ((name, values) for name, values in lists if all(isinstance(v, str) for v in values)),
+        next(((name, values) for name, values in lists if _is_number_list(values)), (None, None)),
+    )
+    if x_values is None:
+        return None
+
+    series = [
+        {"name": name, "values": values}
+        for name, values in lists
+        if name != x_name and _is_number_list(values) and len(values) == len(x_values)
+    ]
+    plotted = meta.get("plotted") or []
+    drawn = [item for item in series if [float(v) for v in item["values"]] in plotted]
+    if drawn:
+        series = drawn
+    if not series:
+        return None
+
+    return {
+        "type": plot_type,
+        "x": x_values,
+        "series": series,
+        "title": meta.get("title", ""),
+        "xlabel": meta.get("xlabel", ""),
+        "ylabel": meta.get("ylabel", ""),
+        "style": {"color": None, "grid": bool(meta.get("grid", False))},
+    }
+
+def apply_edit(spec: Dict, instruction: str) -> Optional[Dict]:
+    """
+    Áp dụng các chỉnh sửa phổ biến (kiểu đồ thị, màu, tiêu đề, nhãn trục, lưới) lên spec.
+    Trả về spec mới, hoặc None nếu yêu cầu cần sinh lại code (thay đổi dữ liệu, không nhận ra chỉnh sửa nào).
+    """
+    text = instruction.lower()
+    if any(keyword in text for keyword in DATA_EDIT_KEYWORDS):
+        return None
+
+    new_spec = json.loads(json.dumps(spec))
+    changed = False
+
+    for plot_type, keywords in PLOT_TYPE_KEYWORDS:
+        if any(keyword in text for keyword in keywords):
+            new_spec["type"] = plot_type
+            changed = True
+            break
+
+    for keyword, color in COLOR_KEYWORDS:
+        if re.search(rf"(?<!\w){re.escape(keyword)}(?!\w)", text):
+            new_spec["style"]["color"] = color
+            changed = True
+            break
+
+    # Giữ nguyên chữ hoa/thường của người dùng khi lấy tiêu đề/nhãn
+    for field, pattern in [
+        ("title", r"tiêu đề"), ("xlabel", r"nhãn trục x|trục x"), ("ylabel", r"nhãn trục y|trục y"),
+    ]:
+        match = re.search(rf"(?:{pattern})\s*(?:thành|là|:)?\s*[\"“']([^\"”']+)[\"”']", instruction, re.IGNORECASE)
+        if match is None:
+            match = re.search(rf"(?:{pattern})\s*(?:thành|là|:)\s*([^.,;\n]+)", instruction, re.IGNORECASE)
+        if match:
+            new_spec[field] = match.group(1).strip()
+            changed = True
+
+    if any(keyword in text for keyword in ["bỏ lưới", "không lưới", "xóa lưới", "no grid"]):
+        new_spec["style"]["grid"] = False
+        changed = True
+    elif any(keyword in text for keyword in ["thêm lưới", "có lưới", "lưới", "grid"]):
+        new_spec["style"]["grid"] = True
+        changed = True
+
+    return new_spec if changed else None
+
+def spec_to_code(spec: Dict) -> str:
+    """Sinh code matplotlib từ spec (chạy trong plot worker như code của Gemini)"""
+    color = spec["style"].get("color")
+    color_arg = f", color={color!r}" if color else ""
+    lines = [
+        "import matplotlib.pyplot as plt",
+        "import numpy as np",
+        f"x = {spec['x']!r}",
+    ]
+    for i, series in enumerate(spec["series"]):
+        lines.append(f"y{i} = {series['values']!r}")
+    lines.append("plt.figure(figsize=(10, 6))")
+
+    plot_type = spec["type"]
+    count = len(spec["series"])
+    if plot_type == "pie":
+        lines.append("plt.pie(y0, labels=x, autopct='%1.1f%%', startangle=90)")
+        lines.append("plt.axis('equal')")
+    else:
+        lines.append("positions = np.arange(len(x))")
+        width = 0.8 / count
+        for i, series in enumerate(spec["series"]):
+            label = series["name"]
+            series_color = color_arg if count == 1 else ""
+            if plot_type == "bar":
+                offset = (i - (count - 1) / 2) * width
+                lines.append(f"plt.bar(positions + {offset!r}, y{i}, width={width!r}, label={label!r}{series_color})")
+            elif plot_type == "scatter":
+                lines.append(f"plt.scatter(positions, y{i}, label={label!r}{series_color})")
+            elif plot_type == "area":
+                lines.append(f"plt.fill_between(positions, y{i}, alpha=0.4, label={label!r}{series_color})")
+                lines.append(f"plt.plot(positions, y{i}{series_color})")
+            else:
+                lines.append(f"plt.plot(positions, y{i}, marker='o', label={label!r}{series_color})")
+        lines.append("plt.xticks(positions, x)")
+        if spec.get("xlabel"):
+            lines.append(f"plt.xlabel({spec['xlabel']!r})")
+        if spec.get("ylabel"):
+            lines.append(f"plt.ylabel({spec['ylabel']!r})")
+        if spec["style"].get("grid"):
+            lines.append("plt.grid(linestyle='--', alpha=0.7)")
+        if count > 1:
+            lines.append("plt.legend()")
+    if spec.get("title"):
+        lines.append(f"plt.title({spec['title']!r})")
+    return "\n".join(lines)
+
+def spec_hash(spec: Dict) -> str:
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+class RenderCache:
+    """LRU ảnh PNG đã render, theo hash của spec: vẽ lại đúng spec cũ không cần chạy worker"""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+            return image
+
+    def put(self, key: str, image: bytes):
+        with self._lock:
+            self._entries[key] = image
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+# Sử dụng một cache duy nhất cho toàn bộ ứng dụng
+render_cache = RenderCache()
@@ -0,0 +1,397 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+import subprocess
+import threading
+import tempfile
+import asyncio
+import base64
+import signal
+import queue
+import json
+import ast
+import sys
+import os
+
+try:
+    import resource
+except ImportError:  # Windows: không có giới hạn tài nguyên theo process
+    resource = None
+
+PLOT_WORKERS = int(os.getenv("PLOT_WORKERS", min(4, os.cpu_count() or 1)))
+PLOT_TIMEOUT = int(os.getenv("PLOT_TIMEOUT", 20))
+# Thời gian chờ một worker mới khởi động (import matplotlib), không tính vào PLOT_TIMEOUT
+PLOT_START_TIMEOUT = 60
+PLOT_CPU_SECONDS = int(os.getenv("PLOT_CPU_SECONDS", 15))
+# Bộ nhớ được cấp thêm cho mỗi lần render, ngoài phần đã dùng sau khi import matplotlib
+PLOT_MEMORY_MB = int(os.getenv("PLOT_MEMORY_MB", 512))
+# Telegram nén ảnh về cạnh dài tối đa 1280px, figure 10x6 ở 150 dpi đã đủ nét
+PLOT_DPI = int(os.getenv("PLOT_DPI", 150))
+
+# Biến môi trường được chuyển cho worker; token Telegram, API key Gemini... không được truyền xuống
+PLOT_WORKER_ENV = ("PATH", "HOME", "USERPROFILE", "SYSTEMROOT", "TEMP", "TMP", "TMPDIR", "LANG", "LC_ALL", "MPLCONFIGDIR")
+# Module mà code do Gemini sinh ra được import
+ALLOWED_MODULES = frozenset({"matplotlib", "numpy", "math"})
+# Builtin được dùng trong code sinh ra: không có open, eval/exec, getattr, __import__ gốc...
+SAFE_BUILTINS = (
+    "abs", "all", "any", "bool", "dict", "divmod", "enumerate", "filter", "float", "format", "int",
+    "isinstance", "len", "list", "map", "max", "min", "pow", "print", "range", "reversed", "round",
+    "set", "slice", "sorted", "str", "sum", "tuple", "zip",
+    "Exception", "ValueError", "TypeError", "KeyError", "IndexError", "ZeroDivisionError",
+)
+# Thuộc tính không được truy cập: đường vòng tới os/sys qua module khác, đọc/ghi file của numpy/matplotlib
+BLOCKED_ATTRIBUTES = frozenset({
+    "os", "sys", "subprocess", "socket", "importlib", "builtins", "ctypes", "ctypeslib", "shutil",
+    "pathlib", "io", "load", "loadtxt", "genfromtxt", "fromfile", "fromregex", "memmap", "DataSource",
+    "save", "savez", "savez_compressed", "savetxt", "tofile", "imread", "imsave", "savefig",
+})
+
+class PlotCodeError(Exception):
+    """Lỗi xảy ra trong worker khi chạy code vẽ đồ thị"""
+
+class PlotRenderError(Exception):
+    """Không render được đồ thị (lỗi code, quá thời gian, vượt giới hạn tài nguyên)"""
+
+def check_plot_code(code):
+    """
+    Kiểm tra tĩnh code sinh ra trước khi exec: chỉ import module trong ALLOWED_MODULES,
+    không dùng tên/thuộc tính bắt đầu bằng "_" (chặn lối thoát qua __class__, __globals__...)
+    và không truy cập BLOCKED_ATTRIBUTES. Vi phạm thì ném PlotCodeError.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        raise PlotCodeError(f"SyntaxError: {e}") from None
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            modules = [node.module or ""] if not node.level else ["."]
+        else:
+            modules = []
+        for module in modules:
+            if module.split(".")[0] not in ALLOWED_MODULES:
+                raise PlotCodeError(f"Không được import {module}")
+        if isinstance(node, ast.Attribute) and (node.attr.startswith("_") or node.attr in BLOCKED_ATTRIBUTES):
+            raise PlotCodeError(f"Không được truy cập thuộc tính {node.attr}")
+        if isinstance(node, ast.Name) and node.id.startswith("_"):
+            raise PlotCodeError(f"Không được dùng tên {node.id}")
+        if isinstance(node, ast.alias) and (node.asname or node.name).startswith("_"):
+            raise PlotCodeError(f"Không được dùng tên {node.asname or node.name}")
+
+def _safe_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if level or name.split(".")[0] not in ALLOWED_MODULES:
+        raise ImportError(f"Không được import {name}")
+    return __import__(name, globals, locals, fromlist, level)
+
+def _safe_builtins():
+    import builtins
+
+    safe = {name: getattr(builtins, name) for name in SAFE_BUILTINS}
+    safe["__import__"] = _safe_import
+    return safe
+
+def _raise_timeout(signum, frame):
+    raise PlotCodeError("Vượt quá thời gian/CPU cho phép")
+
+def _address_space_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+def _init_worker(memory_mb):
+    """Khởi tạo worker: import sẵn matplotlib, giới hạn bộ nhớ (process đã chạy trong thư mục tạm riêng)"""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot  # noqa: F401 - import trước để request đầu tiên không phải chờ
+    import numpy  # noqa: F401
+
+    if resource is not None and memory_mb:
+        limit = _address_space_bytes() + memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, _raise_timeout)
+    if hasattr(signal, "SIGXCPU"):
+        signal.signal(signal.SIGXCPU, _raise_timeout)
+
+def _json_default(value):
+    # Phần tử numpy (np.float64...) trong các biến dữ liệu
+    return value.item() if hasattr(value, "item") else str(value)
+
+def _send_message(stream, message):
+    stream.write(json.dumps(message, ensure_ascii=False, default=_json_default).encode("utf-8") + b"\n")
+    stream.flush()
+
+def _worker_main(memory_mb):
+    """
+    Vòng lặp của process worker (chạy bằng `python plot_worker.py <memory_mb>`):
+    mỗi dòng stdin là một job JSON, mỗi dòng stdout là một kết quả JSON ("ready", "ok" hoặc "error").
+    Dùng JSON thay vì pickle để process chạy code không tin cậy không thể gửi object độc hại về bot.
+    """
+    results = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    # print() của code sinh ra đi vào stderr, không lẫn vào kênh kết quả
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+    _init_worker(memory_mb)
+    _send_message(results, {"status": "ready", "pid": os.getpid()})
+    for line in sys.stdin.buffer:
+        job = json.loads(line)
+        try:
+            image, data, meta = _render(job["code"], job["dpi"], job["wall_seconds"], job["cpu_seconds"])
+            result = {"status": "ok", "image": base64.b64encode(image).decode("ascii"), "data": data, "meta": meta}
+        except PlotCodeError as e:
+            result = {"status": "error", "error": str(e)}
+        _send_message(results, result)
+
+def _describe_axes(ax):
+    """Nhãn và kiểu đồ thị của trục chính, dùng để dựng plot spec cho các lần sửa sau"""
+    from matplotlib.collections import PathCollection, PolyCollection
+    from matplotlib.patches import Rectangle, Wedge
+
+    if any(isinstance(patch, Wedge) for patch in ax.patches):
+        plot_type = "pie"
+    elif any(isinstance(collection, PolyCollection) for collection in ax.collections):
+        plot_type = "area"
+    elif any(isinstance(patch, Rectangle) for patch in ax.patches):
+        plot_type = "bar"
+    elif any(isinstance(collection, PathCollection) for collection in ax.collections):
+        plot_type = "scatter"
+    elif ax.lines:
+        plot_type = "line"
+    else:
+        plot_type = None
+
+    # Giá trị trục y của các series thực sự được vẽ (để bỏ các biến phụ không có trên đồ thị)
+    plotted = []
+    try:
+        plotted += [[float(v) for v in line.get_ydata()] for line in ax.lines]
+        plotted += [[float(bar.get_height()) for bar in container] for container in ax.containers]
+        plotted += [[float(v) for v in collection.get_offsets()[:, 1]]
+                    for collection in ax.collections if isinstance(collection, PathCollection)]
+    except (TypeError, ValueError):
+        plotted = []
+    return {
+        "type": plot_type,
+        "title": ax.get_title(),
+        "xlabel": ax.get_xlabel(),
+        "ylabel": ax.get_ylabel(),
+        "grid": any(line.get_visible() for line in ax.get_xgridlines() + ax.get_ygridlines()),
+        "plotted": plotted,
+    }
+
+def _render(code, dpi, wall_seconds, cpu_seconds):
+    """Chạy code matplotlib trong worker, trả về (ảnh PNG, các biến dữ liệu dạng list, nhãn/kiểu đồ thị)"""
+    import matplotlib.pyplot as plt
+    import numpy as np
+    import io
+
+    if resource is not None and cpu_seconds:
+        # RLIMIT_CPU tính cộng dồn cho cả process nên đặt lại mốc cho từng lần render
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = int(usage.ru_utime + usage.ru_stime)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        resource.setrlimit(resource.RLIMIT_CPU, (used + cpu_seconds, hard))
+    if hasattr(signal, "alarm"):
+        signal.alarm(wall_seconds)
+
+    exec_globals = {"__builtins__": _safe_builtins(), "plt": plt, "np": np}
+    exec_locals = {}
+    try:
+        check_plot_code(code)
+        plt.clf()
+        exec(code, exec_globals, exec_locals)
+        meta = _describe_axes(plt.gca())
+        buffer = io.BytesIO()
+        plt.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    except PlotCodeError:
+        raise
+    except BaseException as e:
+        # Exception của code sinh ra có thể không pickle được, chỉ trả về nội dung lỗi
+        message = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+        raise PlotCodeError(message) from None
+    finally:
+        if hasattr(signal, "alarm"):
+            signal.alarm(0)
+        plt.close('all')
+
+    data = {}
+    for var_name, var_value in exec_locals.items():
+        if isinstance(var_value, (list, np.ndarray)) and len(var_value) > 0:
+            # Convert numpy arrays to lists for easier storage
+            data[var_name] = var_value.tolist() if isinstance(var_value, np.ndarray) else var_value
+    return buffer.getvalue(), data, meta
+
+def _worker_env():
+    """Môi trường tối thiểu cho worker, không chứa secret của bot (đã nạp từ .env)"""
+    env = {key: os.environ[key] for key in PLOT_WORKER_ENV if key in os.environ}
+    env["MPLBACKEND"] = "Agg"
+    return env
+
+class _PlotWorker:
+    """
+    Một process worker, chạy file này bằng một interpreter mới với môi trường đã lọc
+    (không import lại module của bot như multiprocessing spawn), nhận việc qua stdin/stdout;
+    bị treo thì chỉ process này bị kill
+    """
+
+    def __init__(self, memory_mb):
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), str(memory_mb)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=_worker_env(),
+            # File do code tự sinh ra (nếu có) nằm trong thư mục riêng, không lẫn vào thư mục của bot
+            cwd=tempfile.mkdtemp(prefix="plot_worker_"),
+        )
+        self._messages = queue.Queue()
+        threading.Thread(target=self._read_messages, daemon=True, name="plot_worker_reader").start()
+        self.ready = False
+
+    def _read_messages(self):
+        """Đọc kết quả từ stdout của worker; None báo worker đã dừng"""
+        try:
+            for line in self.process.stdout:
+                self._messages.put(json.loads(line))
+        except (OSError, ValueError):
+            pass
+        self._messages.put(None)
+
+    def send(self, job: Dict):
+        self.process.stdin.write(json.dumps(job).encode("utf-8") + b"\n")
+        self.process.stdin.flush()
+
+    def receive(self, timeout) -> Optional[Dict]:
+        """Kết quả tiếp theo, None nếu quá timeout; worker đã dừng thì ném EOFError"""
+        try:
+            message = self._messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if message is None:
+            raise EOFError
+        return message
+
+    def wait_ready(self, timeout):
+        """Chờ worker import xong matplotlib (không tính vào thời gian render)"""
+        if not self.ready:
+            if self.receive(timeout) is None:
+                raise PlotRenderError("Worker không khởi động được")
+            self.ready = True
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def kill(self):
+        if self.process.poll() is None:
+            self.process.kill()
+        try:
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+class PlotWorkerPool:
+    """
+    Pool các process worker (đã import sẵn matplotlib) để chạy code vẽ đồ thị do Gemini sinh ra:
+    - không chạy exec trong process/event loop của bot, nhiều đồ thị render song song trên nhiều core
+    - worker không nhận biến môi trường chứa secret; code chỉ được import matplotlib/numpy/math,
+      chỉ có một số builtin an toàn (không open, eval, __import__ gốc) và được kiểm tra bằng check_plot_code
+    - mỗi thread render sở hữu một process worker: request chờ trong hàng đợi của thread pool,
+      thời gian chờ đó không tính vào timeout; timeout chỉ tính từ lúc worker nhận việc
+    - mỗi lần render bị giới hạn thời gian, CPU và bộ nhớ; worker bị treo/chết thì chỉ worker đó bị thay,
+      các đồ thị đang render ở worker khác không bị ảnh hưởng
+    - nhận code, trả về bytes PNG (không ghi file, không cần dọn thư mục)
+    """
+
+    def __init__(self, max_workers=PLOT_WORKERS, timeout=PLOT_TIMEOUT, cpu_seconds=PLOT_CPU_SECONDS,
+                 memory_mb=PLOT_MEMORY_MB, dpi=PLOT_DPI):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.dpi = dpi
+        self._threads = None
+        self._local = threading.local()
+        self._workers = set()
+        self._lock = threading.Lock()
+
+    def _get_threads(self):
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="plot_worker")
+            return self._threads
+
+    def _worker(self) -> _PlotWorker:
+        """Worker của thread hiện tại, tạo mới nếu chưa có hoặc đã chết"""
+        worker = getattr(self._local, "worker", None)
+        if worker is None or not worker.alive():
+            if worker is not None:
+                self._discard(worker)
+            worker = _PlotWorker(self.memory_mb)
+            with self._lock:
+                self._workers.add(worker)
+            self._local.worker = worker
+        return worker
+
+    def _discard(self, worker):
+        worker.kill()
+        with self._lock:
+            self._workers.discard(worker)
+        if getattr(self._local, "worker", None) is worker:
+            self._local.worker = None
+
+    def _render_blocking(self, code) -> Tuple[bytes, Dict, Dict]:
+        worker = self._worker()
+        try:
+            worker.wait_ready(PLOT_START_TIMEOUT)
+            worker.send({"code": code, "dpi": self.dpi, "wall_seconds": self.timeout, "cpu_seconds": self.cpu_seconds})
+            # Worker tự ngắt khi quá thời gian; chờ thêm 5 giây chỉ để phòng worker bị treo hẳn
+            result = worker.receive(self.timeout + 5)
+            if result is None:
+                self._discard(worker)
+                raise PlotRenderError("Worker không phản hồi")
+        except (EOFError, OSError):
+            self._discard(worker)
+            raise PlotRenderError("Worker bị dừng (vượt giới hạn bộ nhớ/CPU)")
+        except PlotRenderError:
+            if worker.alive() and not worker.ready:
+                self._discard(worker)
+            raise
+        if result["status"] == "error":
+            raise PlotRenderError(result["error"])
+        return base64.b64decode(result["image"]), result["data"], result["meta"]
+
+    def warm_up(self):
+        """Khởi động trước các worker để request đầu tiên không phải chờ import matplotlib"""
+        threads = self._get_threads()
+        for _ in range(self.max_workers):
+            threads.submit(self._warm_up_worker)
+
+    def _warm_up_worker(self):
+        try:
+            self._worker().wait_ready(PLOT_START_TIMEOUT)
+        except Exception as e:
+            print(f"Error warming up plot worker: {str(e)}")
+
+    async def render(self, code) -> Tuple[bytes, Dict, Dict]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_threads(), self._render_blocking, code)
+
+    def shutdown(self):
+        with self._lock:
+            threads, self._threads = self._threads, None
+            workers, self._workers = list(self._workers), set()
+        if threads is not None:
+            threads.shutdown(wait=False, cancel_futures=True)
+        for worker in workers:
+            worker.kill()
+
+# Sử dụng một pool duy nhất cho toàn bộ ứng dụng
+plot_worker_pool = PlotWorkerPool()
+
+if __name__ == "__main__":
+    _worker_main(int(sys.argv[1]))
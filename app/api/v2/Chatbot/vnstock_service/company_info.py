@@ -1,32 +1,63 @@
+import threading
 import os
 import json
-from .get_data import Vnstockk
+from .get_data import CompanyProfileLoader
+from .frame_cache import frame_cache, COMPANY_INFO
 
 class CompanyInfo:
     """Service for handling company information"""
     
     def __init__(self):
-        self.time_period = "quarter"  # Default to quarterly data
-        
-    def get_company_info(self, symbol):
+        # (symbol, time_period) -> loader đang tải, để nhiều chat cùng xem một mã dùng chung lời gọi
+        self._loaders = {}
+        self._loaders_lock = threading.RLock()
+
+    def _get_loader(self, symbol, time_period):
+        key = (symbol, time_period)
+        with self._loaders_lock:
+            loader = self._loaders.get(key)
+            if loader is None:
+                loader = CompanyProfileLoader(symbol)
+                self._loaders[key] = loader
+                loader.add_done_callback(lambda done: self._on_loaded(key, done))
+            return loader
+
+    def _on_loaded(self, key, loader):
+        with self._loaders_lock:
+            self._loaders.pop(key, None)
+        errors = loader.errors()
+        if errors:
+            # Không cache kết quả thiếu mục, lần sau sẽ tải lại
+            print(f"Company info for {key[0]} incomplete, failed sections: {list(errors)}")
+            return
+        frame_cache.put(COMPANY_INFO, key[0], key[1], loader.result())
+
+    async def get_company_section(self, symbol, section, time_period="quarter"):
+        """
+        Lấy một mục thông tin công ty, chỉ chờ đúng mục đó (các mục khác tiếp tục tải nền).
+        Trả về (success, data hoặc thông báo lỗi).
+        """
+        cached = frame_cache.get(COMPANY_INFO, symbol, time_period)
+        if cached is not None:
+            if section in cached:
+                return True, cached[section]
+            return False, f"Không có dữ liệu {section} cho {symbol}"
+
+        try:
+            return True, await self._get_loader(symbol, time_period).get_section(section)
+        except Exception as e:
+            print(f"Error loading company {section} for {symbol}: {str(e)}")
+            return False, f"Không có dữ liệu {section} cho {symbol}"
+
+    def get_company_info(self, symbol, time_period="quarter"):
         """Get comprehensive company information"""
-        vnstock_instance = Vnstockk()
-        
         try:
-            # Check if data already exists
-            file_path = os.path.join("financial_data", f"{symbol}_{self.time_period}_company_info.json")
-            print(f"Looking for file: {file_path}")
-            
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    company_data = json.load(f)
-                    print(f"Found existing company data with sections: {list(company_data.keys())}")
-            else:
-                # Load new data
-                print(f"File not found. Loading new data...")
-                company_data = vnstock_instance.company_info(symbol, self.time_period)
-                print(f"Loaded new company data")
-                
+            # Dùng cache chung (bộ nhớ/đĩa), chỉ tải lại từ vnstock khi dữ liệu hết hạn
+            company_data = frame_cache.get(COMPANY_INFO, symbol, time_period)
+            if company_data is None:
+                company_data = self._get_loader(symbol, time_period).result()
+            if not company_data:
+                return False, f"Không thể tải thông tin công ty {symbol}"
             return True, company_data
         except Exception as e:
             import traceback
@@ -2,9 +2,13 @@ import json
 import os
 import pandas as pd
 from .get_data import Vnstockk
+from .frame_cache import frame_cache, FINANCIAL_RATIO
 
 class FinanceInfo:
-    """Service for handling financial information and metrics"""
+    """
+    Service for handling financial information and metrics.
+    Trạng thái của từng người dùng (mã, kỳ, dữ liệu) nằm trong StockSession được truyền vào mỗi hàm.
+    """
     
     def __init__(self):
         try:
@@ -13,46 +17,37 @@ class FinanceInfo:
         except Exception as e:
             print(f"Error loading labels.json: {e}")
             self.labels = {}
-            
-        self.current_symbol = None
-        self.stock_data = None
-        self.time_period = "quarter"  # Default to quarterly data
 
-    def get_stock_info(self, symbol):
+    def load_stock_data(self, symbol, time_period):
+        """Lấy bảng chỉ số của mã từ cache dùng chung (bộ nhớ/đĩa), chỉ gọi vnstock khi hết hạn"""
+        return frame_cache.get_or_load(
+            FINANCIAL_RATIO, symbol, time_period,
+            lambda: Vnstockk().get_data_info(symbol, time_period),
+        )
+
+    def get_stock_info(self, session, symbol):
         """Get stock information for a given symbol"""
         try:
             # Initialize current symbol
-            self.current_symbol = symbol
-            
-            vnstock_instance = Vnstockk()
-            
-            # First try to load existing data
-            existing_data = vnstock_instance.load_financial_data(symbol, self.time_period)
-            
-            if existing_data is not None and not existing_data.empty:
-                self.stock_data = existing_data
-                print(f"Using existing data for {symbol}")
-            else:
-                # If no existing data, fetch new data
-                print(f"Fetching fresh data for {symbol}")
-                self.stock_data = vnstock_instance.get_data_info(symbol, self.time_period)
+            session.symbol = symbol
+            session.stock_data = self.load_stock_data(symbol, session.time_period)
             
-            if self.stock_data is None or (isinstance(self.stock_data, pd.DataFrame) and self.stock_data.empty):
+            if session.stock_data is None or (isinstance(session.stock_data, pd.DataFrame) and session.stock_data.empty):
                 return False, f"Không thể lấy dữ liệu cho {symbol}. Vui lòng thử lại sau."
             
-            period_text = "Quý" if self.time_period == "quarter" else "Năm"
+            period_text = "Quý" if session.time_period == "quarter" else "Năm"
             return True, f"Đã tải dữ liệu {period_text} thành công cho {symbol}!\nVui lòng chọn loại chỉ số để xem:"
         except Exception as e:
             print(f"Error getting stock info: {e}")
             return False, f"Lỗi khi tải dữ liệu cho {symbol}: {str(e)}"
 
-    def get_categories_menu(self):
+    def get_categories_menu(self, session):
         """Generate menu of available categories"""
         # Get actual categories from the financial data if available
         categories = []
-        if self.stock_data is not None and isinstance(self.stock_data.columns, pd.MultiIndex):
+        if session.stock_data is not None and isinstance(session.stock_data.columns, pd.MultiIndex):
             # Extract unique level 0 values (categories) from MultiIndex columns
-            categories = [cat for cat in self.stock_data.columns.get_level_values(0).unique() 
+            categories = [cat for cat in session.stock_data.columns.get_level_values(0).unique() 
                          if cat != "Meta"]  # Exclude Meta category
         
         # Use default categories if no data is available or if they don't have categories
@@ -67,34 +62,34 @@ class FinanceInfo:
         menu += "\nNhập /vnstock_get [số] hoặc /vnstock_get all để xem tất cả chỉ số."
         return menu
 
-    def get_indicators(self, category_idx):
+    def get_indicators(self, session, category_idx):
         """Get indicators for a specific category"""
-        if not self.current_symbol or self.stock_data is None:
+        if not session.symbol or session.stock_data is None:
             return "Vui lòng nhập lệnh /search [mã cổ phiếu] trước!"
 
         try:
             # Check if stock_data has categories
-            if isinstance(self.stock_data.columns, pd.MultiIndex):
+            if isinstance(session.stock_data.columns, pd.MultiIndex):
                 # Get all categories except Meta
-                categories = [cat for cat in self.stock_data.columns.get_level_values(0).unique() 
+                categories = [cat for cat in session.stock_data.columns.get_level_values(0).unique() 
                              if cat != "Meta"]
             else:
                 # Try to categorize using labels from labels.json
-                return f"Dữ liệu tài chính cho {self.current_symbol} không có cấu trúc phù hợp để phân loại."
+                return f"Dữ liệu tài chính cho {session.symbol} không có cấu trúc phù hợp để phân loại."
             
             if not categories:
-                return f"Không tìm thấy dữ liệu phân loại cho {self.current_symbol}."
+                return f"Không tìm thấy dữ liệu phân loại cho {session.symbol}."
             
             if category_idx == 'all':
-                result = f"📊 Tất cả chỉ số cho {self.current_symbol}:\n\n"
+                result = f"📊 Tất cả chỉ số cho {session.symbol}:\n\n"
                 
                 # Get years and quarters if available
                 years = []
                 quarters = []
-                if ('Meta', 'Năm') in self.stock_data.columns:
-                    years = self.stock_data[('Meta', 'Năm')].tolist()
-                    if ('Meta', 'Kỳ') in self.stock_data.columns:
-                        quarters = self.stock_data[('Meta', 'Kỳ')].tolist()
+                if ('Meta', 'Năm') in session.stock_data.columns:
+                    years = session.stock_data[('Meta', 'Năm')].tolist()
+                    if ('Meta', 'Kỳ') in session.stock_data.columns:
+                        quarters = session.stock_data[('Meta', 'Kỳ')].tolist()
                 
                 # Get indices for the 3 most recent years
                 if years:
@@ -117,11 +112,11 @@ class FinanceInfo:
                     for cat in categories:
                         result += f"=== {cat} ===\n"
                         # Get indicators for this category
-                        indicators = [col[1] for col in self.stock_data.columns if col[0] == cat]
+                        indicators = [col[1] for col in session.stock_data.columns if col[0] == cat]
                         
                         for indicator in indicators:
-                            if (cat, indicator) in self.stock_data.columns:
-                                values = self.stock_data[(cat, indicator)].tolist()
+                            if (cat, indicator) in session.stock_data.columns:
+                                values = session.stock_data[(cat, indicator)].tolist()
                                 if values and len(values) > 0:
                                     result += f"{indicator}:\n"
                                     
@@ -129,7 +124,7 @@ class FinanceInfo:
                                     for i in indices_to_show:
                                         if i < len(values):
                                             # Format the time period based on data type
-                                            if self.time_period == "yearly" or self.time_period == "year":
+                                            if session.time_period == "yearly" or session.time_period == "year":
                                                 time_period = f"{years[i]}"
                                             else:
                                                 time_period = f"Q{quarters[i]}/{years[i]}" if i < len(quarters) else f"{years[i]}"
@@ -163,14 +158,14 @@ class FinanceInfo:
                 category_name = matching_categories[0]
 
             # Get results for the selected category
-            result = f"📊 {category_name} cho {self.current_symbol}:\n\n"
+            result = f"📊 {category_name} cho {session.symbol}:\n\n"
             
             # Get indicators for this category
-            indicators = [col[1] for col in self.stock_data.columns if col[0] == category_name]
+            indicators = [col[1] for col in session.stock_data.columns if col[0] == category_name]
             
             for indicator in indicators:
-                if (category_name, indicator) in self.stock_data.columns:
-                    values = self.stock_data[(category_name, indicator)].tolist()
+                if (category_name, indicator) in session.stock_data.columns:
+                    values = session.stock_data[(category_name, indicator)].tolist()
                     if values and len(values) > 0:
                         latest_value = values[-1]  # Get most recent value
                         if isinstance(latest_value, (int, float)):
@@ -184,24 +179,24 @@ class FinanceInfo:
             print(f"Error getting indicators: {e}")
             return f"Lỗi khi truy xuất dữ liệu: {str(e)}"
 
-    def _get_specific_category_indicators(self, category_name):
+    def _get_specific_category_indicators(self, session, category_name):
         """Get all indicators for a specific category"""
-        if not self.current_symbol or self.stock_data is None:
+        if not session.symbol or session.stock_data is None:
             return "Vui lòng nhập lệnh /search [mã cổ phiếu] trước!"
             
         try:
-            result = f"📊 {category_name} cho {self.current_symbol}:\n\n"
+            result = f"📊 {category_name} cho {session.symbol}:\n\n"
             
             # Get indicators for this category
-            indicators = [col[1] for col in self.stock_data.columns if col[0] == category_name]
+            indicators = [col[1] for col in session.stock_data.columns if col[0] == category_name]
             
             # Get years and quarters if available
             years = []
             quarters = []
-            if ('Meta', 'Năm') in self.stock_data.columns:
-                years = self.stock_data[('Meta', 'Năm')].tolist()
-                if ('Meta', 'Kỳ') in self.stock_data.columns:
-                    quarters = self.stock_data[('Meta', 'Kỳ')].tolist()
+            if ('Meta', 'Năm') in session.stock_data.columns:
+                years = session.stock_data[('Meta', 'Năm')].tolist()
+                if ('Meta', 'Kỳ') in session.stock_data.columns:
+                    quarters = session.stock_data[('Meta', 'Kỳ')].tolist()
             
             # Show data by year for all categories if years data is available
             if years:
@@ -221,15 +216,15 @@ class FinanceInfo:
                 
                 # Show each indicator with values for recent years
                 for indicator in indicators:
-                    if (category_name, indicator) in self.stock_data.columns:
+                    if (category_name, indicator) in session.stock_data.columns:
                         result += f"\n{indicator}:\n"
-                        values = self.stock_data[(category_name, indicator)].tolist()
+                        values = session.stock_data[(category_name, indicator)].tolist()
                         
                         # Show each period's value
                         for i in indices_to_show:
                             if i < len(values):
                                 # Format time period based on data type
-                                if self.time_period == "yearly" or self.time_period == "year":
+                                if session.time_period == "yearly" or session.time_period == "year":
                                     time_period = f"{years[i]}"
                                 else:
                                     time_period = f"Q{quarters[i]}/{years[i]}" if i < len(quarters) else f"{years[i]}"
@@ -241,8 +236,8 @@ class FinanceInfo:
             else:
                 # Fallback when no year data is available
                 for indicator in indicators:
-                    if (category_name, indicator) in self.stock_data.columns:
-                        values = self.stock_data[(category_name, indicator)].tolist()
+                    if (category_name, indicator) in session.stock_data.columns:
+                        values = session.stock_data[(category_name, indicator)].tolist()
                         if values and len(values) > 0:
                             latest_value = values[-1]
                             if isinstance(latest_value, (int, float)):
@@ -255,30 +250,30 @@ class FinanceInfo:
             print(f"Error getting indicators: {e}")
             return f"Lỗi khi truy xuất dữ liệu: {str(e)}"
 
-    def _get_specific_indicator(self, category_name, indicator_name):
+    def _get_specific_indicator(self, session, category_name, indicator_name):
         """Get data for a specific indicator"""
-        if not self.current_symbol or self.stock_data is None:
+        if not session.symbol or session.stock_data is None:
             return "Vui lòng nhập lệnh /search [mã cổ phiếu] trước!"
             
         try:
-            result = f"📊 {category_name} - {indicator_name} cho {self.current_symbol}:\n\n"
+            result = f"📊 {category_name} - {indicator_name} cho {session.symbol}:\n\n"
             
-            if (category_name, indicator_name) in self.stock_data.columns:
-                values = self.stock_data[(category_name, indicator_name)].tolist()
+            if (category_name, indicator_name) in session.stock_data.columns:
+                values = session.stock_data[(category_name, indicator_name)].tolist()
                 
                 # Get metadata (years/quarters) if available
                 years = []
                 quarters = []
-                if ('Meta', 'Năm') in self.stock_data.columns and ('Meta', 'Kỳ') in self.stock_data.columns:
-                    years = self.stock_data[('Meta', 'Năm')].tolist()
-                    quarters = self.stock_data[('Meta', 'Kỳ')].tolist()
+                if ('Meta', 'Năm') in session.stock_data.columns and ('Meta', 'Kỳ') in session.stock_data.columns:
+                    years = session.stock_data[('Meta', 'Năm')].tolist()
+                    quarters = session.stock_data[('Meta', 'Kỳ')].tolist()
                 
                 # Display first 5 values with timeframe if available (changed from last 5)
                 first_n = min(5, len(values))
                 for i in range(first_n):
                     if years and i < len(years):
                         # Check if we're using yearly or quarterly data
-                        if self.time_period == "yearly" or self.time_period == "year":
+                        if session.time_period == "yearly" or session.time_period == "year":
                             time_period = f"{years[i]}"
                         else:
                             # For quarterly data, show quarter and year
@@ -0,0 +1,144 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional, Tuple
+import threading
+import pickle
+import os
+
+from app.core.keyed_locks import KeyedLocks
+
+# Loại dữ liệu được cache: bảng chỉ số tài chính (DataFrame MultiIndex) và thông tin công ty (dict các mục)
+FINANCIAL_RATIO = "financial_ratio"
+COMPANY_INFO = "company_info"
+
+CacheKey = Tuple[str, str, str]  # (kind, symbol, time_period)
+
+# Số ngày sau khi kết thúc kỳ mà doanh nghiệp còn công bố báo cáo (mùa báo cáo)
+QUARTER_REPORTING_DAYS = 45
+YEAR_REPORTING_DAYS = 120
+
+# Thư mục file cache, mặc định nằm cạnh module (không phụ thuộc thư mục chạy ứng dụng)
+FRAME_CACHE_DIR = os.getenv("FRAME_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache"))
+
+def _next_midnight(now: datetime) -> datetime:
+    return datetime(now.year, now.month, now.day) + timedelta(days=1)
+
+def reporting_period_expiry(kind: str, time_period: str, now: Optional[datetime] = None) -> datetime:
+    """
+    Thời điểm dữ liệu hết hạn, theo lịch công bố báo cáo:
+    - trong mùa báo cáo (sau khi kết thúc quý/năm) số liệu thay đổi hằng ngày -> hết hạn lúc nửa đêm
+    - ngoài mùa báo cáo số liệu không đổi -> giữ đến đầu kỳ tiếp theo
+    Thông tin công ty có tin tức, giao dịch nội bộ nên luôn làm mới mỗi ngày.
+    """
+    now = now or datetime.now()
+    if kind != FINANCIAL_RATIO:
+        return _next_midnight(now)
+
+    if time_period in ("year", "yearly"):
+        period_start = datetime(now.year, 1, 1)
+        next_period = datetime(now.year + 1, 1, 1)
+        reporting_days = YEAR_REPORTING_DAYS
+    else:
+        quarter_month = 3 * ((now.month - 1) // 3) + 1
+        period_start = datetime(now.year, quarter_month, 1)
+        next_period = datetime(now.year + (quarter_month == 10), (quarter_month + 2) % 12 + 1, 1)
+        reporting_days = QUARTER_REPORTING_DAYS
+
+    if now < period_start + timedelta(days=reporting_days):
+        return _next_midnight(now)
+    return next_period
+
+class FrameCache:
+    """
+    Cache dùng chung cho dữ liệu vnstock theo (loại, mã, kỳ):
+    - LRU trong bộ nhớ, giới hạn max_entries
+    - file pickle trên đĩa (giữ nguyên MultiIndex, không cần parse JSON/eval lại);
+      chỉ đọc file do chính ứng dụng ghi ra trong cache_dir
+    - hết hạn theo lịch công bố báo cáo (reporting_period_expiry)
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 256):
+        self.cache_dir = cache_dir or FRAME_CACHE_DIR
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[datetime, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = KeyedLocks()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _get_file_path(self, key: CacheKey) -> str:
+        kind, symbol, time_period = key
+        return os.path.join(self.cache_dir, f"{symbol}_{time_period}_{kind}.pkl")
+
+    def _remember(self, key: CacheKey, expires_at: datetime, value: Any):
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _load_from_disk(self, key: CacheKey) -> Optional[Tuple[datetime, Any]]:
+        file_path = self._get_file_path(key)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, 'rb') as f:
+                payload = pickle.load(f)
+            return payload["expires_at"], payload["value"]
+        except Exception as e:
+            print(f"Error loading cache file {file_path}: {str(e)}")
+            return None
+
+    def _save_to_disk(self, key: CacheKey, expires_at: datetime, value: Any):
+        file_path = self._get_file_path(key)
+        tmp_file = file_path + ".tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                pickle.dump({"expires_at": expires_at, "value": value}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, file_path)
+        except Exception as e:
+            print(f"Error saving cache file {file_path}: {str(e)}")
+
+    def get(self, kind: str, symbol: str, time_period: str) -> Optional[Any]:
+        """Trả về dữ liệu còn hạn (bộ nhớ trước, sau đó đến đĩa) hoặc None"""
+        key = (kind, symbol.upper(), time_period)
+        now = datetime.now()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+
+        entry = self._load_from_disk(key)
+        if entry is None or entry[0] <= now:
+            return None
+        self._remember(key, *entry)
+        return entry[1]
+
+    def put(self, kind: str, symbol: str, time_period: str, value: Any):
+        key = (kind, symbol.upper(), time_period)
+        expires_at = reporting_period_expiry(kind, time_period)
+        self._remember(key, expires_at, value)
+        self._save_to_disk(key, expires_at, value)
+
+    def get_or_load(self, kind: str, symbol: str, time_period: str, loader: Callable[[], Any]) -> Any:
+        """
+        Lấy từ cache, nếu không có thì gọi loader (gọi mạng) rồi lưu lại.
+        Nhiều luồng cùng yêu cầu một khoá chỉ gọi loader một lần. Kết quả rỗng không được cache.
+        """
+        value = self.get(kind, symbol, time_period)
+        if value is not None:
+            return value
+
+        with self._key_locks.get((kind, symbol.upper(), time_period)):
+            value = self.get(kind, symbol, time_period)
+            if value is not None:
+                return value
+            value = loader()
+            if value is not None and not getattr(value, "empty", False) and len(value) > 0:
+                self.put(kind, symbol, time_period, value)
+            return value
+
+# Dùng chung cho toàn bộ ứng dụng
+frame_cache = FrameCache()
@@ -1,162 +1,124 @@
-from vnstock import Vnstock
-import json
+from app.core.vnstock_pool import vnstock_pool
+from concurrent.futures import ThreadPoolExecutor, wait
+import threading
+import asyncio
 import os
 import pandas as pd 
+
+# Các mục thông tin công ty (tên hàm của vnstock company) theo thứ tự hiển thị
+COMPANY_SECTIONS = ["overview", "profile", "shareholders", "insider_deals", "subsidiaries", "officers", "news"]
+# Các mục có cột thời gian cần chuyển sang chuỗi trước khi lưu
+DATETIME_SECTIONS = {"insider_deals", "subsidiaries", "officers", "news"}
+
+# Thread pool dùng chung cho các lời gọi TCBS của mọi người dùng
+_company_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("COMPANY_FETCH_WORKERS", 14)), thread_name_prefix="company")
+
+def process_df(df):
+    if isinstance(df, pd.DataFrame):
+        for col in df.select_dtypes(include=['datetime64', 'datetime64[ns]']).columns:
+            df[col] = df[col].astype(str)
+    return df
+
+class CompanyProfileLoader:
+    """
+    Tải các mục thông tin công ty song song với một client TCBS dùng chung.
+    Mỗi mục có future riêng nên có thể hiển thị ngay khi mục đó về (ví dụ overview),
+    mục bị lỗi không làm hỏng các mục khác.
+    """
+
+    def __init__(self, symbol, sections=None, executor=None):
+        self.symbol = symbol
+        self._lock = threading.Lock()
+        self._callbacks = []
+        sections = sections or COMPANY_SECTIONS
+        self._pending = len(sections)
+        executor = executor or _company_executor
+        self.futures = {section: executor.submit(self._fetch, section) for section in sections}
+        for future in self.futures.values():
+            future.add_done_callback(self._section_done)
+
+    def _fetch(self, section):
+        data = vnstock_pool.call(self.symbol, 'TCBS', lambda client: getattr(client.company, section)())
+        if section in DATETIME_SECTIONS:
+            data = process_df(data)
+        return data.to_dict(orient='records') if hasattr(data, 'to_dict') else data
+
+    def _section_done(self, future):
+        with self._lock:
+            self._pending -= 1
+            callbacks = self._callbacks if self._pending == 0 else []
+        for callback in callbacks:
+            callback(self)
+
+    def add_done_callback(self, callback):
+        """Gọi callback(loader) khi tất cả các mục đã tải xong (thành công hoặc lỗi)"""
+        with self._lock:
+            if self._pending:
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def section(self, section, timeout=None):
+        """Chờ một mục (blocking); ném lỗi của mục đó nếu tải thất bại"""
+        return self.futures[section].result(timeout=timeout)
+
+    async def get_section(self, section):
+        """Chờ một mục mà không chặn event loop; huỷ việc chờ không huỷ việc tải"""
+        return await asyncio.shield(asyncio.wrap_future(self.futures[section]))
+
+    def errors(self):
+        return {
+            section: str(future.exception())
+            for section, future in self.futures.items()
+            if future.done() and future.exception() is not None
+        }
+
+    def result(self, timeout=None):
+        """Chờ tất cả các mục, trả về dict chỉ gồm các mục tải thành công"""
+        wait(list(self.futures.values()), timeout=timeout)
+        data = {}
+        for section, future in self.futures.items():
+            if not future.done():
+                print(f"Timeout loading company {section} for {self.symbol}")
+            elif future.exception() is not None:
+                print(f"Error loading company {section} for {self.symbol}: {future.exception()}")
+            else:
+                data[section] = future.result()
+        return data
+
 class Vnstockk:
     def get_data_info(self, symbol, time):
-        stock = Vnstock().stock(symbol=symbol, source='VCI')
-        data = stock.finance.ratio(period=time, lang='vi', dropna=True)
-        
-        # Create a dedicated folder for storing data
-        data_folder = "financial_data"
-        os.makedirs(data_folder, exist_ok=True)
-        
-        # Create filename using symbol and time period
-        filename = f"{symbol}_{time}_financial_ratio.json"
-        filepath = os.path.join(data_folder, filename)
-        
-        data_flat = data.copy()
-        if isinstance(data_flat.columns, pd.MultiIndex):
-            # Convert tuple column names to strings
-            data_flat.columns = [str(col) for col in data_flat.columns]
-        
-        # Convert data to JSON and save to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data_flat.to_dict(orient='records'), f, ensure_ascii=False, indent=4)
-        
-        # Print the output
-        print(f"Financial data for {symbol} ({time}):")
-        print(data)
-        
+        data = vnstock_pool.ratio(symbol, 'VCI', period=time, lang='vi', dropna=True)
+        # Không ghi JSON nữa: DataFrame (giữ nguyên MultiIndex) được lưu bởi frame_cache
+        print(f"Fetched financial data for {symbol} ({time}): {len(data)} rows")
         return data
 
     def process_df(self, df):
-        # Implementation from your code
-        if isinstance(df, pd.DataFrame):
-            for col in df.select_dtypes(include=['datetime64', 'datetime64[ns]']).columns:
-                df[col] = df[col].astype(str)
-        return df
+        return process_df(df)
     
-    def save_company_data(self, data, symbol, time, data_type):
-        # Implementation from your code
-        data_folder = "financial_data"
-        os.makedirs(data_folder, exist_ok=True)
-        filename = f"{symbol}_{time}_{data_type}.json"
-        filepath = os.path.join(data_folder, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-        return filepath
-    
-    # Add all the other methods from your Vnstockk class
+    # Các hàm lấy từng mục thông tin công ty (dùng chung CompanyProfileLoader)
     def get_company_overview(self, symbol, time):
-        # Implementation
-        company = Vnstock().stock(symbol=symbol, source='TCBS').company
-        overview = company.overview()
-        data = overview.to_dict(orient='records') if hasattr(overview, 'to_dict') else overview
-        self.save_company_data(data, symbol, time, "company_overview")
-        return data
+        return CompanyProfileLoader(symbol, sections=["overview"]).section("overview")
     
     def get_company_profile(self, symbol, time):
-        company = Vnstock().stock(symbol=symbol, source='TCBS').company
-        profile = company.profile()
-        data = profile.to_dict(orient='records') if hasattr(profile, 'to_dict') else profile
-        self.save_company_data(data, symbol, time, "company_profile")
-        return data
+        return CompanyProfileLoader(symbol, sections=["profile"]).section("profile")
     
     def get_company_shareholders(self, symbol, time):
-        company = Vnstock().stock(symbol=symbol, source='TCBS').company
-        shareholders = company.shareholders()
-        data = shareholders.to_dict(orient='records') if hasattr(shareholders, 'to_dict') else shareholders
-        self.save_company_data(data, symbol, time, "company_shareholders")
-        return data
+        return CompanyProfileLoader(symbol, sections=["shareholders"]).section("shareholders")
     
     def get_company_insider_deals(self, symbol, time):
-        company = Vnstock().stock(symbol=symbol, source='TCBS').company
-        insider_deals = company.insider_deals()
-        insider_deals = self.process_df(insider_deals)
-        data = insider_deals.to_dict(orient='records') if hasattr(insider_deals, 'to_dict') else insider_deals
-        self.save_company_data(data, symbol, time, "company_insider_deals")
-        return data
+        return CompanyProfileLoader(symbol, sections=["insider_deals"]).section("insider_deals")
     
     def get_company_subsidiaries(self, symbol, time):
-        company = Vnstock().stock(symbol=symbol, source='TCBS').company
-        subsidiaries = company.subsidiaries()
-        subsidiaries = self.process_df(subsidiaries)
-        data = subsidiaries.to_dict(orient='records') if hasattr(subsidiaries, 'to_dict') else subsidiaries
-        self.save_company_data(data, symbol, time, "company_subsidiaries")
-        return data
+        return CompanyProfileLoader(symbol, sections=["subsidiaries"]).section("subsidiaries")
     
     def get_company_officers(self, symbol, time):
-        company = Vnstock().stock(symbol=symbol, source='TCBS').company
-        officers = company.officers()
-        officers = self.process_df(officers)
-        data = officers.to_dict(orient='records') if hasattr(officers, 'to_dict') else officers
-        self.save_company_data(data, symbol, time, "company_officers")
-        return data
+        return CompanyProfileLoader(symbol, sections=["officers"]).section("officers")
     
     def get_company_news(self, symbol, time):
-        company = Vnstock().stock(symbol=symbol, source='TCBS').company
-        news = company.news()
-        news = self.process_df(news)
-        data = news.to_dict(orient='records') if hasattr(news, 'to_dict') else news
-        self.save_company_data(data, symbol, time, "company_news")
-        return data
+        return CompanyProfileLoader(symbol, sections=["news"]).section("news")
 
     def company_info(self, symbol, time):
-        # Implementation
-        company_overview = self.get_company_overview(symbol, time)
-        company_profile = self.get_company_profile(symbol, time)
-        company_shareholders = self.get_company_shareholders(symbol, time)
-        company_insider_deals = self.get_company_insider_deals(symbol, time)
-        company_subsidiaries = self.get_company_subsidiaries(symbol, time)
-        company_officers = self.get_company_officers(symbol, time)
-        company_news = self.get_company_news(symbol, time)
-        
-        all_company_data = {
-            "overview": company_overview,
-            "profile": company_profile,
-            "shareholders": company_shareholders,
-            "insider_deals": company_insider_deals,
-            "subsidiaries": company_subsidiaries,
-            "officers": company_officers,
-            "news": company_news
-        }
-        
-        self.save_company_data(all_company_data, symbol, time, "company_info")
-        return all_company_data
-
-    def load_financial_data(self, symbol, time_period, data_type="financial_ratio"):
-        data_folder = "financial_data"
-        filename = f"{symbol}_{time_period}_{data_type}.json"
-        filepath = os.path.join(data_folder, filename)
-        
-        if os.path.exists(filepath):
-            try:
-                print(f"Loading data from {filepath}")
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                # If data is for financial ratios, convert to DataFrame for easier processing
-                if data_type == "financial_ratio" and isinstance(data, list):
-                    df = pd.DataFrame(data)
-                    
-                    # Convert column names to MultiIndex if they are string representations of tuples
-                    if df.columns.str.contains(r'^\(.*\)$').any():
-                        # Extract tuples from string representation
-                        tuples = [eval(col) if col.startswith('(') else ('Other', col) for col in df.columns]
-                        df.columns = pd.MultiIndex.from_tuples(tuples)
-                    
-                    return df
-                    
-                return data
-            except Exception as e:
-                print(f"Error loading data from {filepath}: {str(e)}")
-                return None
-        else:
-            print(f"File not found: {filepath}")
-            return None
-
-    def load_company_data(self, symbol, time_period):
-        """Load company information from saved JSON files"""
-        data_type = "company_info"
-        return self.load_financial_data(symbol, time_period, data_type)
\ No newline at end of file
+        """Tải song song 7 mục thông tin công ty; mục nào lỗi thì bỏ qua"""
+        return CompanyProfileLoader(symbol).result()
@@ -1,10 +1,11 @@
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import CallbackContext
-import os
+import asyncio
 import json
 from .get_data import Vnstockk
 from .finance_info import FinanceInfo
 from .company_info import CompanyInfo
+from .session_store import SessionStore
 
 class VNStockService:
     """Enhanced VNStock service that provides stock information via Telegram"""
@@ -13,11 +14,11 @@ class VNStockService:
         self.vnstock = Vnstockk()
         self.finance_info = FinanceInfo()
         self.company_info = CompanyInfo()
-        self.current_symbol = None
-        self.time_period = "quarter"  # Default to quarterly data
-        
-        # Create directory for financial data if it doesn't exist
-        os.makedirs("financial_data", exist_ok=True)
+        # Mỗi chat có phiên riêng (mã, kỳ dữ liệu, bảng chỉ số), tự xoá khi hết hạn
+        self.sessions = SessionStore()
+
+    def get_session(self, update: Update):
+        return self.sessions.get(update.effective_chat.id)
 
     async def search_stock(self, update: Update, context: CallbackContext):
         """Handle the /search command"""
@@ -40,9 +41,7 @@ class VNStockService:
             return
             
         symbol = context.args[0].upper()
-        self.current_symbol = symbol
-        self.finance_info.current_symbol = symbol
-        self.company_info.time_period = self.time_period
+        self.get_session(update).symbol = symbol
         
         keyboard = [
             [
@@ -58,27 +57,29 @@ class VNStockService:
 
     async def get_financial_data(self, update: Update, context: CallbackContext):
         """Handle the /search_get command to retrieve financial data"""
-        if not self.current_symbol:
+        session = self.get_session(update)
+        if not session.symbol:
             await update.message.reply_text("Vui lòng sử dụng /search [mã cổ phiếu] trước!")
             return
             
         if not context.args:
-            await update.message.reply_text(self.finance_info.get_categories_menu())
+            await update.message.reply_text(self.finance_info.get_categories_menu(session))
             return
             
         category = context.args[0]
-        result = self.finance_info.get_indicators(category)
+        result = self.finance_info.get_indicators(session, category)
         await update.message.reply_text(result)
         
     async def get_stock_chart(self, update: Update, context: CallbackContext):
         """Handle the /search_chart command to get stock charts"""
-        if not self.current_symbol:
+        session = self.get_session(update)
+        if not session.symbol:
             await update.message.reply_text("Vui lòng sử dụng /search [mã cổ phiếu] trước!")
             return
         
         # This would normally fetch and display a chart
         await update.message.reply_text(
-            f"📊 Biểu đồ cho {self.current_symbol}:\n\n"
+            f"📊 Biểu đồ cho {session.symbol}:\n\n"
             "Tính năng đang được phát triển. Sẽ có trong bản cập nhật tiếp theo!"
         )
         
@@ -86,16 +87,15 @@ class VNStockService:
         """Handle callback queries for VNStock interactions"""
         query = update.callback_query
         await query.answer()
+        session = self.get_session(update)
         
         # Handle period selection
         if query.data.startswith("vnstock_period_"):
             parts = query.data.split("_")
             if len(parts) >= 4:
-                self.time_period = parts[2]  # quarter or yearly
-                self.finance_info.time_period = self.time_period
-                self.company_info.time_period = self.time_period
+                session.time_period = parts[2]  # quarter or yearly
                 symbol = parts[3]
-                self.current_symbol = symbol
+                session.symbol = symbol
                 
                 await query.edit_message_text(f"Đã tải dữ liệu thành công cho {symbol}!")
                 
@@ -139,10 +139,12 @@ class VNStockService:
             await query.edit_message_text(f"Đang tải thông tin công ty {symbol}...")
             
             try:
-                success, company_data = self.company_info.get_company_info(symbol)
+                # Các mục được tải song song; chỉ cần chờ phần tổng quan là hiển thị menu
+                success, overview = await self.company_info.get_company_section(
+                    symbol, "overview", session.time_period)
                 
                 if not success:
-                    await query.edit_message_text(company_data)  # Error message in company_data
+                    await query.edit_message_text(f"Không thể tải thông tin công ty {symbol}")
                     return
                     
                 keyboard = [
@@ -176,7 +178,7 @@ class VNStockService:
             category = query.data.replace("vnstock_category_", "")
             
             if category == "all":
-                result = self.finance_info.get_indicators("all")
+                result = self.finance_info.get_indicators(session, "all")
                 await query.edit_message_text(text=result)
                 return
             
@@ -185,7 +187,7 @@ class VNStockService:
                 category_idx = int(category)
                 
                 # Get the category name
-                categories = [cat for cat in self.finance_info.stock_data.columns.get_level_values(0).unique() 
+                categories = [cat for cat in session.stock_data.columns.get_level_values(0).unique() 
                              if cat != "Meta"]
                 
                 if category_idx < 1 or category_idx > len(categories):
@@ -195,7 +197,7 @@ class VNStockService:
                 category_name = categories[category_idx - 1]
                 
                 # Get indicators for this category
-                indicators = [col[1] for col in self.finance_info.stock_data.columns if col[0] == category_name]
+                indicators = [col[1] for col in session.stock_data.columns if col[0] == category_name]
                 
                 # Create buttons for each indicator
                 keyboard = []
@@ -230,7 +232,7 @@ class VNStockService:
                 
                 reply_markup = InlineKeyboardMarkup(keyboard)
                 await query.edit_message_text(
-                    f"Chọn chỉ số {category_name} bạn muốn xem ({self.time_period}):",
+                    f"Chọn chỉ số {category_name} bạn muốn xem ({session.time_period}):",
                     reply_markup=reply_markup
                 )
             except Exception as e:
@@ -243,7 +245,7 @@ class VNStockService:
                 indicator_idx = parts[3]      # Indicator index or "all"
                 
                 # Get the category name
-                categories = [cat for cat in self.finance_info.stock_data.columns.get_level_values(0).unique() 
+                categories = [cat for cat in session.stock_data.columns.get_level_values(0).unique() 
                             if cat != "Meta"]
                 if not categories or category_idx > len(categories):
                     await query.edit_message_text("Dữ liệu không hợp lệ.")
@@ -253,20 +255,20 @@ class VNStockService:
                 
                 if indicator_idx == "all":
                     # Show all indicators in this category
-                    result = self.finance_info._get_specific_category_indicators(category_name)
+                    result = self.finance_info._get_specific_category_indicators(session, category_name)
                     await query.edit_message_text(text=result)
                 else:
                     # Show the specific indicator based on index
                     try:
                         indicator_idx = int(indicator_idx)
-                        indicators = [col[1] for col in self.finance_info.stock_data.columns if col[0] == category_name]
+                        indicators = [col[1] for col in session.stock_data.columns if col[0] == category_name]
                         
                         if indicator_idx >= len(indicators):
                             await query.edit_message_text("Chỉ số không hợp lệ.")
                             return
                             
                         indicator_name = indicators[indicator_idx]
-                        result = self.finance_info._get_specific_indicator(category_name, indicator_name)
+                        result = self.finance_info._get_specific_indicator(session, category_name, indicator_name)
                         
                         # Add a back button - use shortened callback data
                         keyboard = [[InlineKeyboardButton("← Quay lại", callback_data=f"vnstock_category_{category_idx}")]]
@@ -283,26 +285,18 @@ class VNStockService:
             
             if len(parts) >= 4:
                 symbol = parts[2]
-                section = parts[3]
+                section = "_".join(parts[3:])  # insider_deals có dấu gạch dưới
                 
                 await query.answer()
                 await query.edit_message_text(f"Đang tải thông tin {section} cho {symbol}...")
                 
                 try:
-                    success, company_data = self.company_info.get_company_info(symbol)
+                    success, section_data = await self.company_info.get_company_section(
+                        symbol, section, session.time_period)
                     
                     if not success:
                         await query.edit_message_text(
-                            company_data,  # Error message
-                            reply_markup=InlineKeyboardMarkup([[
-                                InlineKeyboardButton("← Quay lại", callback_data=f"vnstock_company_info_{symbol}")
-                            ]])
-                        )
-                        return
-                    
-                    if section not in company_data:
-                        await query.edit_message_text(
-                            f"Không có dữ liệu {section} cho {symbol}", 
+                            section_data,  # Error message
                             reply_markup=InlineKeyboardMarkup([[
                                 InlineKeyboardButton("← Quay lại", callback_data=f"vnstock_company_info_{symbol}")
                             ]])
@@ -310,7 +304,7 @@ class VNStockService:
                         return
                     
                     # Format the specific section data
-                    result = self.company_info.format_company_section_data(symbol, section, company_data[section])
+                    result = self.company_info.format_company_section_data(symbol, section, section_data)
                     
                     # Add back button
                     keyboard = [
@@ -356,16 +350,15 @@ class VNStockService:
         elif query.data.startswith("vnstock_fin_period_"):
             parts = query.data.split("_")
             if len(parts) >= 4:
-                self.time_period = parts[3]
-                self.finance_info.time_period = self.time_period
-                self.company_info.time_period = self.time_period
+                session.time_period = parts[3]
                 symbol = parts[4]
-                self.current_symbol = symbol
+                session.symbol = symbol
                 
-                await query.edit_message_text(f"Đang tải dữ liệu tài chính {self.time_period} cho {symbol}...")
+                await query.edit_message_text(f"Đang tải dữ liệu tài chính {session.time_period} cho {symbol}...")
                 
                 try:
-                    success, message = self.finance_info.get_stock_info(symbol)
+                    # Tải dữ liệu ở thread riêng để không chặn các chat khác
+                    success, message = await asyncio.to_thread(self.finance_info.get_stock_info, session, symbol)
                     if not success:
                         await query.edit_message_text(message)
                         return
@@ -374,7 +367,7 @@ class VNStockService:
                     return
                 
                 # Show financial categories
-                categories = [cat for cat in self.finance_info.stock_data.columns.get_level_values(0).unique() 
+                categories = [cat for cat in session.stock_data.columns.get_level_values(0).unique() 
                             if cat != "Meta"]
                 
                 # Create buttons for each category
@@ -396,23 +389,23 @@ class VNStockService:
                 
                 reply_markup = InlineKeyboardMarkup(keyboard)
                 await query.edit_message_text(
-                    f"Chọn chỉ số tài chính của {symbol} bạn muốn xem ({self.time_period}):",
+                    f"Chọn chỉ số tài chính của {symbol} bạn muốn xem ({session.time_period}):",
                     reply_markup=reply_markup
                 )
                 
         elif query.data == "vnstock_back_to_main":
-            if self.current_symbol:
+            if session.symbol:
                 keyboard = [
                     [
-                        InlineKeyboardButton("Thông tin tài chính", callback_data=f"vnstock_financial_info_{self.current_symbol}"),
-                        InlineKeyboardButton("Thông tin công ty", callback_data=f"vnstock_company_info_{self.current_symbol}")
+                        InlineKeyboardButton("Thông tin tài chính", callback_data=f"vnstock_financial_info_{session.symbol}"),
+                        InlineKeyboardButton("Thông tin công ty", callback_data=f"vnstock_company_info_{session.symbol}")
                     ],
                     [
                         InlineKeyboardButton("Biểu đồ", callback_data="vnstock_chart")
                     ]
                 ]
                 reply_markup = InlineKeyboardMarkup(keyboard)
-                await query.edit_message_text(f"Chọn loại thông tin về {self.current_symbol} bạn muốn xem:", reply_markup=reply_markup)
+                await query.edit_message_text(f"Chọn loại thông tin về {session.symbol} bạn muốn xem:", reply_markup=reply_markup)
             else:
                 await query.edit_message_text("Vui lòng sử dụng /search [mã cổ phiếu] để bắt đầu.")
         
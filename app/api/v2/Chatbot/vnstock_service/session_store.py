@@ -0,0 +1,50 @@
+import time
+import os
+
+from app.core.keyed_locks import IdleSweeper
+
+# Phiên không hoạt động quá thời gian này (giây) sẽ bị xoá
+SESSION_TTL = float(os.getenv("VNSTOCK_SESSION_TTL", 1800))
+
+class StockSession:
+    """Trạng thái tra cứu của một chat: mã đang xem, loại kỳ dữ liệu và bảng chỉ số đã tải"""
+
+    def __init__(self, chat_id):
+        self.chat_id = chat_id
+        self.symbol = None
+        self.time_period = "quarter"  # Default to quarterly data
+        self.stock_data = None  # DataFrame dùng chung giữa các chat cùng xem một mã
+        self.last_activity = time.time()
+
+class SessionStore:
+    """Lưu phiên theo chat_id để nhiều người dùng /search cùng lúc không ghi đè trạng thái của nhau"""
+
+    def __init__(self, ttl: float = SESSION_TTL):
+        self.ttl = ttl
+        self._sessions = {}
+        self._sweeper = IdleSweeper()
+
+    def get(self, chat_id) -> StockSession:
+        """Lấy (hoặc tạo) phiên của chat và cập nhật thời điểm hoạt động"""
+        now = time.time()
+        self.evict_expired(now)
+        session = self._sessions.get(chat_id)
+        if session is None:
+            session = StockSession(chat_id)
+            self._sessions[chat_id] = session
+        session.last_activity = now
+        return session
+
+    def evict_expired(self, now=None):
+        now = now or time.time()
+        if not self._sweeper.due(now):
+            return
+        expired = [chat_id for chat_id, session in self._sessions.items()
+                   if now - session.last_activity > self.ttl]
+        for chat_id in expired:
+            del self._sessions[chat_id]
+        if expired:
+            print(f"🧹 Removed {len(expired)} expired VNStock sessions")
+
+    def __len__(self):
+        return len(self._sessions)
@@ -1,35 +1,46 @@
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Response
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Response, Query
+from fastapi.responses import ORJSONResponse
 from typing import Dict, List, Any, Optional
 import asyncio
 import time
 
 # Fix relative import
-from .services import Market_indices
+from app.core.services import market_indices_service
+from app.core.log import get_logger
 from .schemas import MarketIndexResponse
 
 router = APIRouter(tags=["Market Indices"])
+log = get_logger(__name__)
 
-# Sử dụng một instance duy nhất cho toàn bộ ứng dụng
-market_indices_instance = Market_indices()
+# Service dùng chung với API v1/v2 (tạo ở request đầu tiên, cache chỉ số chỉ có một bản)
+market_indices_instance = market_indices_service
+
+FORMAT_QUERY = Query("records", pattern="^(records|columnar)$", description="records: [{time, open}], columnar: {timestamps[], open[]}")
+
+def _load_index(index_code: str, top: int, format: str):
+    """Lấy dữ liệu một chỉ số theo định dạng yêu cầu, kèm cờ N/A"""
+    if format == "columnar":
+        data = market_indices_instance.get_market_indices_columnar(index_code, top)
+        return data, len(data['open']) == 0
+    data = market_indices_instance.get_market_indices(index_code, top)
+    return data, len(data) == 0
 
 @router.get("/indices/{index_code}", response_model=MarketIndexResponse)
-async def get_market_indices(index_code: str = "VNINDEX", top: int = 90):
+async def get_market_indices(index_code: str = "VNINDEX", top: int = 90, format: str = FORMAT_QUERY):
     """
     Get market index data
     """
     try:
         # Sử dụng instance toàn cục thay vì tạo mới
         start_time = time.time()
-        market_indices_data = market_indices_instance.get_market_indices(index_code, top)
-        elapsed = time.time() - start_time
-        print(f"Retrieved {index_code} data in {elapsed:.2f} seconds")
-        
         # Nếu mảng dữ liệu trống, đánh dấu đây là dữ liệu không khả dụng (N/A)
-        is_na = len(market_indices_data) == 0
+        # Service gọi vnstock đồng bộ (có thể chờ rate limit), chạy ngoài event loop
+        market_indices_data, is_na = await asyncio.to_thread(_load_index, index_code, top, format)
+        elapsed = time.time() - start_time
+        log.debug("market_indices.request", index=index_code, seconds=round(elapsed, 3), is_na=is_na)
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "data": market_indices_data,
                 "is_na": is_na  # Thêm flag để frontend biết đây là N/A
@@ -41,9 +52,9 @@ async def get_market_indices(index_code: str = "VNINDEX", top: int = 90):
             }
         )
     except Exception as e:
-        print(f"Error in get_market_indices API: {e}")
+        log.exception("market_indices.request_failed", index=index_code)
         # Return N/A flag when error
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={"data": [], "is_na": True, "error": str(e)},
             headers={
@@ -54,23 +65,22 @@ async def get_market_indices(index_code: str = "VNINDEX", top: int = 90):
         )
 
 # Hàm async để tải một chỉ số
-async def fetch_index_data(index_code: str, top: int = 90):
-    return index_code, market_indices_instance.get_market_indices(index_code, top)
+async def fetch_index_data(index_code: str, top: int = 90, format: str = "records"):
+    return (index_code,) + await asyncio.to_thread(_load_index, index_code, top, format)
 
 @router.get("/indices", response_model=MarketIndexResponse)
-async def get_default_indices(top: int = 90):
+async def get_default_indices(top: int = 90, format: str = FORMAT_QUERY):
     """
     Get default market indices (VNINDEX, HNXINDEX, UPCOMINDEX, VN30, HNX30)
     """
     try:
-        print("Starting to fetch all indices data...")
         total_start_time = time.time()
         
-        vnindex_future = asyncio.create_task(fetch_index_data("VNINDEX", top))
-        vn30_future = asyncio.create_task(fetch_index_data("VN30", top))
-        hnxindex_future = asyncio.create_task(fetch_index_data("HNXINDEX", top))
-        upcomindex_future = asyncio.create_task(fetch_index_data("UPCOMINDEX", top))
-        hnx30_future = asyncio.create_task(fetch_index_data("HNX30", top))
+        vnindex_future = asyncio.create_task(fetch_index_data("VNINDEX", top, format))
+        vn30_future = asyncio.create_task(fetch_index_data("VN30", top, format))
+        hnxindex_future = asyncio.create_task(fetch_index_data("HNXINDEX", top, format))
+        upcomindex_future = asyncio.create_task(fetch_index_data("UPCOMINDEX", top, format))
+        hnx30_future = asyncio.create_task(fetch_index_data("HNX30", top, format))
         
         # Xử lý kết quả khi tất cả các tasks hoàn thành
         results = {}
@@ -78,14 +88,14 @@ async def get_default_indices(top: int = 90):
         
         # Chờ và xử lý kết quả cho TẤT CẢ các chỉ số (thay vì chỉ VNINDEX và VN30)
         for future in [await vnindex_future, await vn30_future, await hnxindex_future, await upcomindex_future, await hnx30_future]:
-            index_code, data = future
+            index_code, data, is_na = future
             results[index_code] = data
-            results_status[index_code] = len(data) == 0
+            results_status[index_code] = is_na
         
         total_elapsed = time.time() - total_start_time
-        print(f"Fetched all indices data in {total_elapsed:.2f} seconds")
+        log.debug("market_indices.request_all", seconds=round(total_elapsed, 3))
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "data": {
                     "VNINDEX": results.get("VNINDEX", []),
@@ -103,9 +113,9 @@ async def get_default_indices(top: int = 90):
             }
         )
     except Exception as e:
-        print(f"Error in get_default_indices API: {e}")
+        log.exception("market_indices.request_all_failed")
         # Tất cả các chỉ số đều không khả dụng khi có lỗi
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "data": {
@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+import json
+import os
+
+from app.core.vnstock_pool import vnstock_pool
+from app.core.cache_policy import cache_policy
+from app.core.keyed_locks import KeyedLocks
+from app.core.log import get_logger
+
+log = get_logger(__name__)
+
+# Lấy dư vài ngày để cửa sổ 2Y luôn đủ dữ liệu
+BACKFILL_DAYS = 740
+# Nguồn lỗi khi nối thêm phiên mới: dùng tạm dữ liệu đã lưu và thử lại sau bấy nhiêu giây
+SYNC_RETRY_SECONDS = 60
+
+class DailyHistoryStore:
+    """
+    Lưu lịch sử giá đóng cửa theo ngày cho từng mã (trong bộ nhớ + file cache).
+    Backfill một lần, sau đó chỉ gọi nguồn để nối thêm các phiên mới khi hết hạn theo cache_policy:
+    trong phiên làm mới theo TTL ngắn (nến hôm nay còn thay đổi), phiên đã đóng thì giữ tới 8:59 phiên sau.
+    Các khoảng 3M/6M/1Y/2Y là lát cắt của cùng một mảng.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, backfill_days: int = BACKFILL_DAYS):
+        self.cache_dir = cache_dir or os.path.join(os.path.dirname(__file__), 'cache')
+        self.backfill_days = backfill_days
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # symbol -> {'times': datetime64[s] array, 'close': float array, 'synced_on': 'YYYY-MM-DD', 'expires_at': epoch}
+        self._series: Dict[str, Dict] = {}
+        self._locks = KeyedLocks()
+
+    def _get_cache_file_path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f"{symbol}_1D.json")
+
+    def _load_from_cache(self, symbol: str) -> Optional[Dict]:
+        cache_file = self._get_cache_file_path(symbol)
+        if not os.path.exists(cache_file):
+            return None
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return {
+                'times': np.array(data['times'], dtype='int64').astype('datetime64[s]'),
+                'close': np.array(data['close'], dtype=float),
+                'synced_on': data['synced_on'],
+                # File cũ chưa có expires_at: coi như hết hạn, chỉ nối thêm các phiên mới
+                'expires_at': data.get('expires_at', 0),
+            }
+        except Exception as e:
+            log.error("adjust_day.history.cache_load_failed", symbol=symbol, error=str(e))
+            return None
+
+    def _save_to_cache(self, symbol: str, entry: Dict) -> None:
+        cache_file = self._get_cache_file_path(symbol)
+        tmp_file = cache_file + '.tmp'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'symbol': symbol,
+                    'synced_on': entry['synced_on'],
+                    'expires_at': entry['expires_at'],
+                    'times': entry['times'].astype('int64').tolist(),
+                    'close': entry['close'].tolist(),
+                }, f)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            log.error("adjust_day.history.cache_save_failed", symbol=symbol, error=str(e))
+
+    def _fetch(self, symbol: str, start: datetime, end: datetime) -> Tuple[np.ndarray, np.ndarray]:
+        df = vnstock_pool.history(symbol, 'VCI', start=start.strftime('%Y-%m-%d'), end=end.strftime('%Y-%m-%d'), interval='1D')
+        if df is None or df.empty or 'close' not in df.columns:
+            return np.array([], dtype='datetime64[s]'), np.array([], dtype=float)
+        times = pd.to_datetime(df['time']).to_numpy().astype('datetime64[s]')
+        return times, df['close'].to_numpy(dtype=float)
+
+    def _sync(self, symbol: str, entry: Optional[Dict], today: datetime) -> Dict:
+        if entry is None or len(entry['times']) == 0:
+            log.info("adjust_day.history.backfill", symbol=symbol, days=self.backfill_days)
+            times, close = self._fetch(symbol, today - timedelta(days=self.backfill_days), today)
+            return self._entry(times, close, today)
+
+        # Lấy lại từ phiên cuối đã lưu (phiên này có thể chưa hoàn tất lúc đồng bộ lần trước)
+        last_session = entry['times'][-1].astype(datetime)
+        log.info("adjust_day.history.append", symbol=symbol, since=f"{last_session:%Y-%m-%d}")
+        times, close = self._fetch(symbol, last_session, today)
+        if len(times):
+            keep = entry['times'] < times[0]
+            times = np.concatenate([entry['times'][keep], times])
+            close = np.concatenate([entry['close'][keep], close])
+        else:
+            times, close = entry['times'], entry['close']
+        return self._entry(times, close, today)
+
+    @staticmethod
+    def _entry(times: np.ndarray, close: np.ndarray, today: datetime) -> Dict:
+        return {'times': times, 'close': close, 'synced_on': today.strftime('%Y-%m-%d'),
+                'expires_at': cache_policy.expires_at(today).timestamp()}
+
+    def get_series(self, symbol: str) -> Dict:
+        """Trả về toàn bộ lịch sử ngày của mã, đồng bộ lại khi hết hạn theo phiên giao dịch"""
+        symbol = symbol.upper()
+        today = datetime.now()
+
+        with self._locks.get(symbol):
+            entry = self._series.get(symbol)
+            if entry is None:
+                entry = self._load_from_cache(symbol)
+            if entry is None or entry['expires_at'] <= today.timestamp():
+                try:
+                    synced = self._sync(symbol, entry, today)
+                except Exception as e:
+                    if entry is None or len(entry['times']) == 0:
+                        raise
+                    # Vẫn trả về lịch sử đã lưu (tới 2 năm) thay vì chuỗi rỗng, thử đồng bộ lại sau
+                    log.warning("adjust_day.history.sync_failed", symbol=symbol, error=str(e))
+                    entry = dict(entry, expires_at=today.timestamp() + SYNC_RETRY_SECONDS)
+                else:
+                    entry = synced
+                    self._save_to_cache(symbol, entry)
+            self._series[symbol] = entry
+            return entry
+
+    def get_window(self, symbol: str, days: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Lát cắt `days` ngày gần nhất (không sao chép dữ liệu)"""
+        entry = self.get_series(symbol)
+        start = np.datetime64(datetime.now() - timedelta(days=days), 's')
+        idx = int(np.searchsorted(entry['times'], start, side='left'))
+        return entry['times'][idx:], entry['close'][idx:]
+
+# Dùng chung cho toàn bộ ứng dụng
+daily_history_store = DailyHistoryStore()
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
-from .services import MarketIndicesAdjustDayService
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any, Optional
+import asyncio
+from app.core.services import adjust_day_service
 from .schemas import MarketIndicesResponse
 
 router = APIRouter(
@@ -9,33 +11,47 @@ router = APIRouter(
 )
 
 @router.get("/{symbol}/{time}", response_model=MarketIndicesResponse)
-async def get_adjusted_market_indices(symbol: str, time: str) -> Dict[str, Any]:
+async def get_adjusted_market_indices(
+    symbol: str,
+    time: str,
+    max_points: Optional[int] = Query(None, ge=10, le=5000, description="Số điểm tối đa trả về (downsample)"),
+    method: str = Query("lttb", pattern="^(lttb|minmax)$", description="Thuật toán downsample"),
+    format: str = Query("records", pattern="^(records|columnar)$", description="records: [{price, date}], columnar: dates[] + timestamps[] + prices[]")
+) -> Dict[str, Any]:
     """
     Get the adjusted market indices data for a given symbol and time period.
     
     Parameters:
     - symbol: Stock symbol to query (e.g., VNINDEX, HNX, UPCOM)
-    - time: Time period (3M, 6M, 1Y, 2Y)
+    - time: Time period (1D, 3M, 6M, 1Y, 2Y)
+    - max_points: Optional point budget; the coarsest sufficient interval is fetched and downsampled
+    - method: Downsampling algorithm (lttb or minmax)
+    - format: records (price-date pairs) or columnar (dates[], timestamps[], prices[])
     
     Returns:
     - Market indices data with price-date pairs
     """
     try:
-        service = MarketIndicesAdjustDayService()
-        data = service.get_adjusted_data(symbol=symbol, time=time)
-        
-        if not data:
-            return {
+        if format == "columnar":
+            # Service gọi vnstock đồng bộ (có thể chờ rate limit), chạy ngoài event loop
+            series = await asyncio.to_thread(adjust_day_service.get_adjusted_series, symbol, time, max_points, method)
+            return ORJSONResponse(content={
                 "symbol": symbol,
                 "time": time,
-                "data": []
-            }
-            
-        return {
+                "interval": series["interval"],
+                "dates": series["dates"],
+                "timestamps": series["timestamps"],
+                "prices": series["prices"]
+            })
+        
+        data = await asyncio.to_thread(adjust_day_service.get_adjusted_data, symbol, time, max_points, method)
+        
+        # Cả hai định dạng đều serialize bằng orjson, không qua validate response_model
+        return ORJSONResponse(content={
             "symbol": symbol,
             "time": time,
-            "data": data
-        }
+            "data": data or []
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching market indices data: {str(e)}")
\ No newline at end of file
@@ -1,66 +1,133 @@
-from vnstock import Vnstock
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
-from typing import List, Dict
-import logging
+from typing import List, Dict, Any, Optional
 
-# Set up logger
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+from app.core.serialization import to_epoch_seconds
+from .downsample import downsample
+from .history_store import daily_history_store
+from app.core.vnstock_pool import vnstock_pool
+from app.core.trading_calendar import trading_calendar
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+# Khoảng thời gian: (số ngày lấy dữ liệu, interval mặc định, interval mịn nhất được phép)
+TIME_RANGES = {
+    "1D": (2, '1m', '1m'),
+    "3M": (90, '1D', '1H'),
+    "6M": (180, '1D', '1H'),
+    "1Y": (365, '1D', '1H'),
+    "2Y": (730, '1D', '1H'),
+}
+
+# Số nến ước tính cho mỗi phiên giao dịch, sắp xếp từ thô đến mịn
+INTERVAL_BARS_PER_SESSION = [
+    ('1D', 1),
+    ('1H', 5),
+    ('30m', 9),
+    ('15m', 18),
+    ('5m', 54),
+    ('1m', 270),
+]
+
+INTRADAY_DATE_FORMAT = '%Y-%m-%d %H:%M'
+DAILY_DATE_FORMAT = '%Y-%m-%d'
+
+def choose_interval(days: int, max_points: Optional[int], default_interval: str, finest_interval: str) -> str:
+    """
+    Chọn interval thô nhất mà vẫn cho đủ số điểm yêu cầu,
+    để lấy ít dữ liệu nhất từ nguồn trước khi downsample.
+    """
+    if not max_points:
+        return default_interval
+
+    today = datetime.now()
+    sessions = max(1, trading_calendar.count_sessions(today - timedelta(days=days), today))
+    candidates = []
+    for interval, bars in INTERVAL_BARS_PER_SESSION:
+        candidates.append((interval, bars))
+        if interval == finest_interval:
+            break
+
+    for interval, bars in candidates:
+        if sessions * bars >= max_points:
+            return interval
+    return finest_interval
+
+def is_intraday(interval: str) -> bool:
+    return interval not in ('1D', '1W', '1M')
+
+class MarketIndicesAdjustDayService:
+    def get_adjusted_series(self, symbol, time, max_points: Optional[int] = None, method: str = "lttb",
+                            interval: Optional[str] = None, days: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Trả về dữ liệu dạng cột: {'interval', 'dates', 'timestamps', 'prices'} (timestamps/prices là numpy array).
+        Nếu có max_points thì chọn interval phù hợp và downsample về tối đa max_points điểm.
+        interval/days: cố định interval và khoảng ngày (today - days), không chọn interval và không lùi về phiên trước (API v1).
+        """
+        logger.debug("adjustday.request", symbol=symbol, time=time, max_points=max_points)
+        empty = {"interval": None, "dates": [], "timestamps": [], "prices": []}
+        if time not in TIME_RANGES:
+            logger.warning("adjustday.unsupported_range", symbol=symbol, time=time)
+            return empty
 
-class MarketIndicesAdjustDayService: 
-    def get_adjusted_data(self, symbol, time) -> List[Dict[str, str]]:
-        logger.info(f"Getting adjusted data for symbol: {symbol}, time: {time}")
         try:
-            end_date = datetime.now().strftime('%Y-%m-%d')
-            if time == "1D":
-                start_date = (datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d')
-                interval = '1m'
-            elif time == "3M":
-                start_date = (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')
-                interval = '1H'
-            elif time == "6M":
-                start_date = (datetime.now() - timedelta(days=180)).strftime('%Y-%m-%d')
-                interval = '1H'
-            elif time == "1Y":
-                start_date = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
-                interval = '1D'
-            elif time == "2Y":
-                start_date = (datetime.now() - timedelta(days=730)).strftime('%Y-%m-%d')
-                interval = '1D'
-                
-            logger.info(f"Date range: {start_date} to {end_date}, interval: {interval}")
-            
-            # Create stock instance properly
-            logger.info(f"Creating VnStock instance for {symbol}")
-            stock = Vnstock().stock(symbol=symbol, source='VCI')
-            
-            # Get historical data
-            logger.info(f"Fetching historical data")
-            df = stock.quote.history(start=start_date, end=end_date, interval=interval)
-            
-            if df is not None and not df.empty:
-                logger.info(f"Got {len(df)} data points")
-                
-                # Convert dates to string format
-                dates = df['time'].dt.strftime('%Y-%m-%d').tolist()
-                
-                # Get close prices
-                close_prices = df['close'].tolist() if 'close' in df.columns else []
-                
-                # Create pairs of close prices and dates
-                price_date_pairs = []
-                for price, date in zip(close_prices, dates):
-                    price_date_pairs.append({
-                        "price": float(price),  # Ensure it's a float
-                        "date": date
-                    })
-                
-                logger.info(f"Returning {len(price_date_pairs)} price-date pairs")
-                return price_date_pairs
+            default_days, default_interval, finest_interval = TIME_RANGES[time]
+            fixed_window = interval is not None
+            days = days or default_days
+            interval = interval or choose_interval(days, max_points, default_interval, finest_interval)
+            if interval == '1D':
+                # Nến ngày lấy từ kho lịch sử dùng chung, không tải lại từ nguồn
+                times, prices = daily_history_store.get_window(symbol, days)
+                times = pd.Series(pd.to_datetime(times))
             else:
-                logger.warning(f"Empty dataframe or None returned for {symbol}")
-                return []
+                # Luôn gồm phiên giao dịch trước đó, để 1D vẫn có dữ liệu vào thứ Hai/sau kỳ nghỉ lễ
+                today = datetime.now()
+                end_date = today.strftime('%Y-%m-%d')
+                start = (today - timedelta(days=days)).date()
+                if not fixed_window:
+                    start = min(start, trading_calendar.previous_session(today))
+                start_date = start.strftime('%Y-%m-%d')
+                logger.debug("adjustday.range", symbol=symbol, start=start_date, end=end_date, interval=interval)
+
+                df = vnstock_pool.history(symbol, 'VCI', start=start_date, end=end_date, interval=interval)
+
+                if df is None or df.empty or 'close' not in df.columns:
+                    logger.warning("adjustday.empty", symbol=symbol, interval=interval)
+                    return empty
+
+                times = pd.to_datetime(df['time']).reset_index(drop=True)
+                prices = df['close'].to_numpy(dtype=float)
+
+            if len(prices) == 0:
+                logger.warning("adjustday.no_data", symbol=symbol, time=time)
+                return empty
+            logger.debug("adjustday.points", symbol=symbol, points=len(prices))
+
+            if max_points and len(prices) > max_points:
+                x = times.astype('int64').to_numpy(dtype=float)
+                keep = downsample(x, prices, max_points, method)
+                times = times.iloc[keep]
+                prices = prices[keep]
+                logger.debug("adjustday.downsampled", symbol=symbol, points=len(prices), method=method)
+
+            # Dữ liệu trong ngày cần giữ giờ:phút để các điểm không bị trùng nhãn
+            date_format = INTRADAY_DATE_FORMAT if is_intraday(interval) else DAILY_DATE_FORMAT
+            return {
+                "interval": interval,
+                "dates": times.dt.strftime(date_format).tolist(),
+                "timestamps": to_epoch_seconds(times),
+                "prices": prices,
+            }
         except Exception as e:
-            logger.error(f"Error fetching data for {symbol}: {str(e)}", exc_info=True)
-            return []
\ No newline at end of file
+            logger.exception("adjustday.failed", symbol=symbol, time=time)
+            return empty
+
+    def get_adjusted_data(self, symbol, time, max_points: Optional[int] = None, method: str = "lttb",
+                          interval: Optional[str] = None, days: Optional[int] = None) -> List[Dict[str, Any]]:
+        series = self.get_adjusted_series(symbol, time, max_points, method, interval, days)
+        return [
+            {"price": price, "date": date}
+            for price, date in zip(np.asarray(series["prices"], dtype=float).tolist(), series["dates"])
+        ]
@@ -1,10 +1,50 @@
 from fastapi import APIRouter, HTTPException, Query
-from .services import news
-from .schemas import NewsResponse, NewsItem, TopNewsResponse
-from typing import List
+from fastapi.responses import StreamingResponse
+from app.core.services import news_service
+from .schemas import (NewsResponse, NewsItem, TopNewsResponse, NewsHistoryResponse,
+                      NewsBatchRequest, NewsBatchResponse, SymbolNewsResult)
+from .store import NewsIngestor, get_news_store, to_epoch
+from typing import List, Optional
+from datetime import datetime
+import asyncio
 
 router = APIRouter()
-news_service = news()
+news_ingestor = NewsIngestor(news_service)
+
+# Giới hạn cho API batch
+MAX_BATCH_SYMBOLS = 100
+BATCH_CONCURRENCY = 8
+
+async def _is_listed(symbol: str) -> bool:
+    # Lần đầu có thể phải tải danh sách mã (gọi vnstock) nên chạy ngoài event loop
+    return await asyncio.to_thread(news_service.is_listed, symbol)
+
+async def _require_listed(symbol: str):
+    """Chỉ theo dõi/gọi TCBS cho mã đang niêm yết, mã lạ không được thêm vào danh sách poll"""
+    if not await _is_listed(symbol):
+        raise HTTPException(status_code=404, detail=f"Unknown symbol: {symbol}")
+
+async def _refresh_if_stale(symbols: List[str], raise_errors: bool = False):
+    """Chỉ gọi TCBS cho các mã (đã kiểm tra niêm yết) chưa được ingest trong chu kỳ hiện tại"""
+    for symbol in symbols:
+        news_ingestor.track(symbol)
+        if not news_ingestor.is_fresh(symbol):
+            try:
+                await news_ingestor.ingest_symbol(symbol)
+            except Exception as e:
+                if raise_errors:
+                    raise
+                # Vẫn trả về dữ liệu đã lưu nếu TCBS lỗi
+                print(f"Error refreshing news for {symbol}: {str(e)}")
+
+def _to_news_items(docs, symbol=None) -> List[NewsItem]:
+    return [
+        NewsItem(
+            title=doc.get('title', ''),
+            publish_date=doc.get('publish_date', ''),
+            symbol=symbol or doc.get('symbol', '')
+        ) for doc in docs
+    ]
 
 @router.get("/top/latest", response_model=TopNewsResponse)
 async def get_top_stocks_news():
@@ -12,42 +52,109 @@ async def get_top_stocks_news():
     Get the latest 10 news from the top 5 stocks by market capitalization
     """
     try:
-        news_data = news_service.get_top_stocks_news(limit=10)
-        if not news_data:
-            return TopNewsResponse(news=[])
-        
-        # Transform the data to match our schema
-        news_items = [
-            NewsItem(
-                title=item.get('title', ''),
-                publish_date=item.get('publish_date', ''),
-                symbol=item.get('symbol', '')
-            ) for item in news_data
-        ]
+        top_symbols = await asyncio.to_thread(news_service.get_top_symbols_from_cache, 5)
+        await _refresh_if_stale(top_symbols)
+        docs, _ = await get_news_store().query(symbols=top_symbols, limit=10)
+        news_items = _to_news_items(docs)
         
         return TopNewsResponse(news=news_items)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch top stocks news: {str(e)}")
 
+async def _load_symbol_news(symbol: str, limit: int, since: Optional[float]) -> SymbolNewsResult:
+    """Lấy tin của một mã cho API batch, lỗi được trả về theo từng mã thay vì làm hỏng cả batch"""
+    error = None
+    if not await _is_listed(symbol):
+        return SymbolNewsResult(symbol=symbol, news=[], error=f"Unknown symbol: {symbol}")
+    try:
+        await _refresh_if_stale([symbol], raise_errors=True)
+    except Exception as e:
+        error = str(e)
+    try:
+        docs, _ = await get_news_store().query(symbols=[symbol], start=since, limit=limit)
+    except Exception as e:
+        docs = []
+        error = error or str(e)
+    return SymbolNewsResult(symbol=symbol, news=_to_news_items(docs, symbol), error=error)
+
+@router.post("/batch", response_model=NewsBatchResponse)
+async def get_batch_news(request: NewsBatchRequest, stream: bool = Query(False, description="Trả về NDJSON theo thứ tự hoàn thành")):
+    """
+    Get recent news for many symbols in one call, fetched with bounded concurrency
+    """
+    # Chuẩn hóa và loại bỏ mã trùng, giữ nguyên thứ tự
+    symbols = list(dict.fromkeys(s.strip().upper() for s in request.symbols if s.strip()))
+    if not symbols:
+        raise HTTPException(status_code=400, detail="symbols must not be empty")
+    if len(symbols) > MAX_BATCH_SYMBOLS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SYMBOLS} symbols per batch")
+    
+    since = to_epoch(request.since) if request.since else None
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    
+    async def _bounded(symbol):
+        async with semaphore:
+            return await _load_symbol_news(symbol, request.limit, since)
+    
+    if stream:
+        async def _ndjson():
+            tasks = [asyncio.create_task(_bounded(symbol)) for symbol in symbols]
+            try:
+                for future in asyncio.as_completed(tasks):
+                    result = await future
+                    yield result.model_dump_json() + "\n"
+            finally:
+                # Client ngắt kết nối thì hủy các request còn lại
+                for task in tasks:
+                    task.cancel()
+        
+        return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+    
+    results = await asyncio.gather(*(_bounded(symbol) for symbol in symbols))
+    return NewsBatchResponse(results=results)
+
 @router.get("/{symbol}", response_model=NewsResponse)
 async def get_stock_news(symbol: str):
     """
     Get news for a specific stock by its symbol
     """
+    await _require_listed(symbol)
     try:
-        news_data = news_service.get_news(symbol)
-        if not news_data:
-            return NewsResponse(symbol=symbol, news=[])
-        
-        # Transform the data to match our schema
-        news_items = [
-            NewsItem(
-                title=item.get('title', ''),
-                publish_date=item.get('publish_date', ''),
-                symbol=symbol
-            ) for item in news_data
-        ]
+        await _refresh_if_stale([symbol])
+        docs, _ = await get_news_store().query(symbols=[symbol], limit=10)
+        news_items = _to_news_items(docs, symbol)
         
         return NewsResponse(symbol=symbol, news=news_items)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch news: {str(e)}")
+
+@router.get("/{symbol}/history", response_model=NewsHistoryResponse)
+async def get_stock_news_history(
+    symbol: str,
+    start: Optional[datetime] = Query(None, description="Chỉ lấy tin đăng từ thời điểm này"),
+    end: Optional[datetime] = Query(None, description="Chỉ lấy tin đăng trước thời điểm này"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100)
+):
+    """
+    Get stored news for a symbol within a time range, newest first, paginated
+    """
+    await _require_listed(symbol)
+    try:
+        await _refresh_if_stale([symbol])
+        docs, total = await get_news_store().query(
+            symbols=[symbol],
+            start=to_epoch(start) if start else None,
+            end=to_epoch(end) if end else None,
+            skip=(page - 1) * page_size,
+            limit=page_size
+        )
+        return NewsHistoryResponse(
+            symbol=symbol,
+            page=page,
+            page_size=page_size,
+            total=total,
+            news=_to_news_items(docs, symbol)
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch news history: {str(e)}")
\ No newline at end of file
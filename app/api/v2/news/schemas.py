@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
+from datetime import datetime
 
 class NewsItem(BaseModel):
     title: str
@@ -12,3 +13,23 @@ class NewsResponse(BaseModel):
     
 class TopNewsResponse(BaseModel):
     news: List[NewsItem]
+
+class NewsHistoryResponse(BaseModel):
+    symbol: str
+    page: int
+    page_size: int
+    total: int
+    news: List[NewsItem]
+
+class NewsBatchRequest(BaseModel):
+    symbols: List[str] = Field(..., description="Danh sách mã cổ phiếu (tối đa 100 mã)")
+    limit: int = Field(10, ge=1, le=50, description="Số tin tối đa cho mỗi mã")
+    since: Optional[datetime] = Field(None, description="Chỉ lấy tin đăng từ thời điểm này")
+
+class SymbolNewsResult(BaseModel):
+    symbol: str
+    news: List[NewsItem]
+    error: Optional[str] = None
+
+class NewsBatchResponse(BaseModel):
+    results: List[SymbolNewsResult]
\ No newline at end of file
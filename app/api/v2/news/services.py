@@ -1,16 +1,52 @@
-from vnstock import Vnstock
+from app.core.vnstock_pool import vnstock_pool
 import pandas as pd
 import json
 import os
 from pathlib import Path
 from datetime import datetime
+import threading
 import heapq
+import time
+import re
+from .store import parse_publish_date
+
+# Mã cổ phiếu Việt Nam: 3 ký tự chữ/số
+SYMBOL_PATTERN = re.compile(r"^[A-Z0-9]{3}$")
+# Danh sách mã niêm yết được tải lại mỗi ngày, tải lỗi thì thử lại sau LISTING_RETRY giây
+LISTING_TTL = 86400
+LISTING_RETRY = 300
 
 class news():
     def __init__(self):
-        self.company = Vnstock()
-        self.cp = Vnstock().stock(symbol="VCI",source='VCI')
-        self.cache_dir = Path(os.path.dirname(os.path.abspath(__file__))).parent.parent.parent / 'api' / 'v1' / 'treemap' / 'cache'
+        # Cache vốn hóa do treemap (dùng chung cho v1/v2) ghi ra
+        self.cache_dir = Path(os.path.dirname(os.path.abspath(__file__))).parent / 'treemap' / 'cache'
+        self._listed = frozenset()
+        self._listed_at = 0
+        self._listing_lock = threading.Lock()
+
+    def listed_symbols(self) -> frozenset:
+        """Tập mã đang niêm yết (rỗng nếu chưa tải được)"""
+        with self._listing_lock:
+            now = time.time()
+            if now - self._listed_at < LISTING_TTL:
+                return self._listed
+            try:
+                data = vnstock_pool.all_symbols()
+                column = 'symbol' if 'symbol' in data.columns else 'ticker'
+                self._listed = frozenset(str(symbol).upper() for symbol in data[column])
+                self._listed_at = now
+            except Exception as e:
+                print(f"Error loading listed symbols: {str(e)}")
+                self._listed_at = now - LISTING_TTL + LISTING_RETRY
+            return self._listed
+
+    def is_listed(self, symbol: str) -> bool:
+        """Mã hợp lệ và đang niêm yết; khi chưa tải được danh sách thì chỉ kiểm tra định dạng"""
+        symbol = symbol.strip().upper()
+        if not SYMBOL_PATTERN.match(symbol):
+            return False
+        listed = self.listed_symbols()
+        return symbol in listed if listed else True
     
     def get_top_symbols_from_cache(self, limit=5):
         """Get top symbols from cache files based on market cap"""
@@ -44,27 +80,30 @@ class news():
         all_cp = self.stock.listing.symbols_by_group(index_name)
         return all_cp
     
+    def fetch_news(self, symbol: str, limit=10):
+        """Lấy tin tức từ TCBS, ném lỗi để nơi gọi tự quyết định cách xử lý"""
+        company = vnstock_pool.company(symbol, 'TCBS')
+        with vnstock_pool.limit('TCBS'):
+            news_data = company.news().head(limit)
+        
+        # Check the structure of the returned data
+        if not isinstance(news_data, pd.DataFrame):
+            raise ValueError(f"Unexpected data type: {type(news_data)}")
+        
+        # Convert DataFrame to a list of dictionaries
+        news_list = []
+        for index, row in news_data.iterrows():
+            news_item = {
+                'title': row.get('title', ''),
+                'publish_date': str(row.get('publish_date', '')),
+                'symbol': symbol  # Add symbol for tracking source
+            }
+            news_list.append(news_item)
+        return news_list
+    
     def get_news(self, symbol: str, limit=10):
         try:
-            company = self.company.stock(symbol=symbol, source='TCBS').company
-            news_data = company.news().head(limit)        
-            
-            # Check the structure of the returned data
-            if isinstance(news_data, pd.DataFrame):
-                # Convert DataFrame to a list of dictionaries
-                news_list = []
-                for index, row in news_data.iterrows():
-                    news_item = {
-                        'title': row.get('title', ''),
-                        'publish_date': str(row.get('publish_date', '')),
-                        'symbol': symbol  # Add symbol for tracking source
-                    }
-                    news_list.append(news_item)
-                return news_list
-            else:
-                # If it's not a DataFrame, return an empty list
-                print(f"Unexpected data type: {type(news_data)}")
-                return []
+            return self.fetch_news(symbol, limit)
         except Exception as e:
             print(f"Error getting news for {symbol}: {str(e)}")
             return []
@@ -80,15 +119,8 @@ class news():
             symbol_news = self.get_news(symbol)
             all_news.extend(symbol_news)
         
-        # Sort by publish_date (newest first)
-        try:
-            all_news.sort(key=lambda x: datetime.strptime(x['publish_date'], '%Y-%m-%d %H:%M:%S'), reverse=True)
-        except ValueError:
-            # Handle different date formats if needed
-            try:
-                all_news.sort(key=lambda x: datetime.strptime(x['publish_date'], '%Y-%m-%d'), reverse=True)
-            except:
-                pass
+        # Sort by publish_date (newest first) - mỗi tin chỉ parse ngày một lần
+        all_news.sort(key=lambda x: parse_publish_date(x['publish_date']) or 0, reverse=True)
         
         # Return only the top 'limit' news items
         return all_news[:limit]
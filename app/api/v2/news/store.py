@@ -0,0 +1,281 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import bisect
+import time
+import os
+
+from app.database.mongodb import MongoDB
+
+# Các định dạng ngày đăng mà TCBS trả về
+_DATE_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d')
+
+NEWS_COLLECTION = "news"
+
+# Giờ đăng tin của TCBS là giờ Việt Nam (không kèm timezone, Việt Nam không đổi giờ theo mùa)
+VN_TIMEZONE = timezone(timedelta(hours=7))
+
+# Số mã được poll định kỳ, mã không ai hỏi quá NEWS_TRACK_TTL giây thì thôi theo dõi
+NEWS_MAX_TRACKED = int(os.getenv("NEWS_MAX_TRACKED", 200))
+NEWS_TRACK_TTL = float(os.getenv("NEWS_TRACK_TTL", 86400))
+# Mã lỗi liên tiếp: chờ tăng dần (tối đa NEWS_MAX_BACKOFF giây), lỗi quá NEWS_MAX_FAILURES lần thì bỏ theo dõi
+NEWS_MAX_BACKOFF = float(os.getenv("NEWS_MAX_BACKOFF", 3600))
+NEWS_MAX_FAILURES = int(os.getenv("NEWS_MAX_FAILURES", 5))
+
+def to_epoch(value: datetime) -> float:
+    """Epoch seconds của một thời điểm, thời điểm không kèm timezone được hiểu là giờ Việt Nam"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=VN_TIMEZONE)
+    return value.timestamp()
+
+def parse_publish_date(value) -> Optional[float]:
+    """Chuyển publish_date sang epoch seconds (chỉ parse một lần khi ingest)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return to_epoch(value)
+    text = str(value).strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return to_epoch(datetime.strptime(text, fmt))
+        except ValueError:
+            continue
+    return None
+
+def make_news_doc(item: Dict) -> Optional[Dict]:
+    """Chuẩn hóa một tin tức thành document lưu trữ, bỏ qua tin không parse được ngày"""
+    published_at = parse_publish_date(item.get('publish_date'))
+    if published_at is None:
+        return None
+    return {
+        'symbol': str(item.get('symbol', '')).upper(),
+        'title': str(item.get('title', '')),
+        'publish_date': str(item.get('publish_date', '')),
+        'published_at': published_at,
+        'ingested_at': time.time(),
+    }
+
+def _dedup_key(doc: Dict) -> Tuple[str, str, str]:
+    return doc['symbol'], doc['title'], doc['publish_date']
+
+class MemoryNewsStore:
+    """Kho tin tức trong bộ nhớ, dùng khi chưa có MongoDB (dev/test)"""
+
+    def __init__(self):
+        self._docs: Dict[Tuple[str, str, str], Dict] = {}
+        # Chỉ mục thời gian theo từng mã: list (published_at, key) đã sắp xếp
+        self._index: Dict[str, List[Tuple[float, Tuple[str, str, str]]]] = {}
+        self._lock = asyncio.Lock()
+
+    async def upsert_many(self, docs: List[Dict]) -> int:
+        inserted = 0
+        async with self._lock:
+            for doc in docs:
+                key = _dedup_key(doc)
+                if key in self._docs:
+                    continue
+                self._docs[key] = doc
+                bisect.insort(self._index.setdefault(doc['symbol'], []), (doc['published_at'], key))
+                inserted += 1
+        return inserted
+
+    def _entries(self, symbols: Optional[List[str]]):
+        if symbols is None:
+            symbols = list(self._index.keys())
+        for symbol in symbols:
+            yield from self._index.get(symbol.upper(), [])
+
+    async def query(self, symbols: Optional[List[str]] = None, start: Optional[float] = None,
+                    end: Optional[float] = None, skip: int = 0, limit: int = 20) -> Tuple[List[Dict], int]:
+        entries = [
+            (ts, key) for ts, key in self._entries(symbols)
+            if (start is None or ts >= start) and (end is None or ts <= end)
+        ]
+        entries.sort(key=lambda e: e[0], reverse=True)
+        page = [self._docs[key] for _, key in entries[skip:skip + limit]]
+        return page, len(entries)
+
+class MongoNewsStore:
+    """Kho tin tức trên MongoDB, dedup bằng unique index (symbol, title, publish_date)"""
+
+    def __init__(self, db):
+        self.collection = db[NEWS_COLLECTION]
+        self._indexes_ready = False
+
+    async def _ensure_indexes(self):
+        if self._indexes_ready:
+            return
+        await self.collection.create_index(
+            [('symbol', 1), ('title', 1), ('publish_date', 1)], unique=True, name='news_dedup')
+        await self.collection.create_index([('symbol', 1), ('published_at', -1)], name='news_symbol_time')
+        await self.collection.create_index([('published_at', -1)], name='news_time')
+        self._indexes_ready = True
+
+    async def upsert_many(self, docs: List[Dict]) -> int:
+        if not docs:
+            return 0
+        from pymongo import UpdateOne
+        await self._ensure_indexes()
+        operations = [
+            UpdateOne(
+                {'symbol': doc['symbol'], 'title': doc['title'], 'publish_date': doc['publish_date']},
+                {'$setOnInsert': doc},
+                upsert=True,
+            ) for doc in docs
+        ]
+        result = await self.collection.bulk_write(operations, ordered=False)
+        return result.upserted_count
+
+    async def query(self, symbols: Optional[List[str]] = None, start: Optional[float] = None,
+                    end: Optional[float] = None, skip: int = 0, limit: int = 20) -> Tuple[List[Dict], int]:
+        await self._ensure_indexes()
+        condition: Dict = {}
+        if symbols is not None:
+            condition['symbol'] = {'$in': [s.upper() for s in symbols]}
+        if start is not None or end is not None:
+            condition['published_at'] = {}
+            if start is not None:
+                condition['published_at']['$gte'] = start
+            if end is not None:
+                condition['published_at']['$lte'] = end
+        cursor = self.collection.find(condition, {'_id': 0}).sort('published_at', -1).skip(skip).limit(limit)
+        docs = await cursor.to_list(length=limit)
+        total = await self.collection.count_documents(condition)
+        return docs, total
+
+_memory_store = None
+_mongo_store = None
+
+def get_news_store():
+    """Trả về MongoNewsStore nếu đã kết nối MongoDB, ngược lại dùng kho trong bộ nhớ"""
+    global _memory_store, _mongo_store
+    db = MongoDB.get_db()
+    if db is not None:
+        if _mongo_store is None:
+            _mongo_store = MongoNewsStore(db)
+        return _mongo_store
+    if _memory_store is None:
+        _memory_store = MemoryNewsStore()
+    return _memory_store
+
+class NewsIngestor:
+    """
+    Định kỳ lấy tin tức của các mã được theo dõi và lưu vào kho (chỉ thêm tin mới):
+    - chỉ theo dõi mã đã được kiểm tra là đang niêm yết (nơi gọi track() kiểm tra)
+    - tối đa max_tracked mã (LRU theo lần được hỏi gần nhất), mã không ai hỏi quá track_ttl giây bị bỏ
+    - mã lỗi được thử lại sau thời gian chờ tăng dần, lỗi liên tiếp max_failures lần thì bỏ theo dõi
+    """
+
+    def __init__(self, news_service, interval: int = 300, concurrency: int = 4,
+                 max_tracked: int = NEWS_MAX_TRACKED, track_ttl: float = NEWS_TRACK_TTL,
+                 max_backoff: float = NEWS_MAX_BACKOFF, max_failures: int = NEWS_MAX_FAILURES):
+        self.news_service = news_service
+        self.interval = interval
+        self.concurrency = concurrency
+        self.max_tracked = max_tracked
+        self.track_ttl = track_ttl
+        self.max_backoff = max_backoff
+        self.max_failures = max_failures
+        # symbol -> thời điểm được hỏi gần nhất
+        self.tracked_symbols: "OrderedDict[str, float]" = OrderedDict()
+        self.last_poll: Dict[str, float] = {}
+        # symbol -> (số lần lỗi liên tiếp, thời điểm được thử lại)
+        self.failures: Dict[str, Tuple[int, float]] = {}
+        self._task = None
+
+    def track(self, *symbols: str):
+        now = time.time()
+        for symbol in symbols:
+            if not symbol:
+                continue
+            symbol = symbol.upper()
+            self.tracked_symbols[symbol] = now
+            self.tracked_symbols.move_to_end(symbol)
+        while len(self.tracked_symbols) > self.max_tracked:
+            self.untrack(next(iter(self.tracked_symbols)))
+
+    def untrack(self, symbol: str):
+        symbol = symbol.upper()
+        self.tracked_symbols.pop(symbol, None)
+        self.last_poll.pop(symbol, None)
+        self.failures.pop(symbol, None)
+
+    def _evict_idle(self, now: float):
+        idle = [symbol for symbol, requested_at in self.tracked_symbols.items()
+                if now - requested_at > self.track_ttl]
+        for symbol in idle:
+            self.untrack(symbol)
+
+    def _record_failure(self, symbol: str, error: Exception):
+        count = self.failures.get(symbol, (0, 0))[0] + 1
+        if count >= self.max_failures:
+            print(f"Stop tracking news for {symbol} after {count} failures: {str(error)}")
+            self.untrack(symbol)
+            backoff = self.max_backoff
+        else:
+            backoff = min(self.max_backoff, self.interval * 2 ** (count - 1))
+        self.failures[symbol] = (count, time.time() + backoff)
+
+    async def ingest_symbol(self, symbol: str, limit: int = 50) -> int:
+        """Lấy tin của một mã và ghi vào kho, trả về số tin mới"""
+        symbol = symbol.upper()
+        try:
+            items = await asyncio.to_thread(self.news_service.fetch_news, symbol, limit)
+            docs = [doc for doc in (make_news_doc(item) for item in items) if doc is not None]
+            inserted = await get_news_store().upsert_many(docs)
+        except Exception as e:
+            self._record_failure(symbol, e)
+            raise
+        self.failures.pop(symbol, None)
+        self.last_poll[symbol] = time.time()
+        return inserted
+
+    async def poll_once(self) -> Dict[str, int]:
+        # Luôn theo dõi các mã vốn hóa lớn cho /top/latest
+        # news_service có thể được tạo (và gọi vnstock) ở lần poll đầu tiên nên chạy ngoài event loop
+        self.track(*await asyncio.to_thread(self.news_service.get_top_symbols_from_cache, 5))
+        self._evict_idle(time.time())
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _run(symbol):
+            async with semaphore:
+                try:
+                    return symbol, await self.ingest_symbol(symbol)
+                except Exception as e:
+                    print(f"Error ingesting news for {symbol}: {str(e)}")
+                    return symbol, 0
+
+        due = [symbol for symbol in sorted(self.tracked_symbols) if not self.is_fresh(symbol)]
+        results = await asyncio.gather(*(_run(s) for s in due))
+        return dict(results)
+
+    def is_fresh(self, symbol: str) -> bool:
+        """Chưa cần gọi TCBS: vừa ingest trong chu kỳ hiện tại, hoặc đang chờ thử lại sau lỗi"""
+        symbol = symbol.upper()
+        now = time.time()
+        if symbol in self.failures:
+            return now < self.failures[symbol][1]
+        return now - self.last_poll.get(symbol, 0) < self.interval
+
+    async def _loop(self):
+        while True:
+            try:
+                results = await self.poll_once()
+                print(f"News ingestion: {sum(results.values())} new items for {len(results)} symbols")
+            except Exception as e:
+                print(f"Error in news ingestion loop: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,72 @@
+from pathlib import Path
+import time
+import os
+
+from app.core.job_queue import FileJobQueue, DONE, FAILED
+from app.core.metrics import request_trace, summarize_trace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
+# Bật khi chạy role report-worker riêng: API chỉ đưa job vào hàng đợi, không tự tạo PDF
+USE_REPORT_WORKER = os.getenv("USE_REPORT_WORKER", "False").lower() == "true"
+# Thư mục job phải nằm trên volume chung giữa API và report worker (cùng với thư mục reports/)
+# Mặc định tính từ thư mục gốc của project để API, bot và worker chạy từ thư mục nào cũng dùng chung một hàng đợi
+REPORT_JOBS_DIR = os.getenv("REPORT_JOBS_DIR", str(PROJECT_ROOT / "reports" / "jobs"))
+# Thời gian API chờ worker tạo xong PDF trước khi trả về 202 kèm job_id
+REPORT_WAIT_TIMEOUT = float(os.getenv("REPORT_WAIT_TIMEOUT", 120))
+REPORT_POLL_INTERVAL = 1.0
+
+PDF_REPORT = "pdf_report"
+
+# Dùng chung cho toàn bộ ứng dụng
+_report_jobs = None
+
+def get_report_jobs() -> FileJobQueue:
+    """Hàng đợi báo cáo dùng chung, thư mục chỉ được tạo ở lần dùng đầu tiên (không phải lúc import)"""
+    global _report_jobs
+    if _report_jobs is None:
+        _report_jobs = FileJobQueue(REPORT_JOBS_DIR)
+    return _report_jobs
+
+def submit_pdf_report(symbol: str) -> str:
+    """Đưa yêu cầu tạo báo cáo vào hàng đợi; cùng một mã đang chờ/đang chạy thì dùng lại job cũ"""
+    symbol = symbol.upper()
+    return get_report_jobs().submit(PDF_REPORT, {"symbol": symbol}, job_id=f"{PDF_REPORT}_{symbol}")
+
+def run_report_worker(poll_interval: float = REPORT_POLL_INTERVAL):
+    """Vòng lặp của role report-worker: nhận job từ hàng đợi và tạo PDF (reportlab/vnstock/Gemini chỉ nạp ở đây)"""
+    from . import services
+
+    report_jobs = get_report_jobs()
+    print(f"🚀 Report worker started, watching {os.path.abspath(REPORT_JOBS_DIR)}")
+    while True:
+        job = report_jobs.claim()
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+
+        symbol = job["payload"]["symbol"]
+        started = time.time()
+        try:
+            # Thời gian từng bước được lưu cùng kết quả để API trả về trong header Server-Timing
+            with report_jobs.keep_alive(job["id"]), request_trace() as trace:
+                file_path = services.generate_pdf_report(symbol)
+            report_jobs.complete(job["id"], {"file_path": os.path.abspath(file_path),
+                                             "timings": summarize_trace(trace)})
+            print(f"✅ Report {symbol} done in {time.time() - started:.2f}s: {file_path}")
+        except Exception as e:
+            report_jobs.fail(job["id"], str(e))
+            print(f"❌ Report {symbol} failed: {str(e)}")
+
+def job_status(job_id: str):
+    """Trạng thái job dạng dict cho API (không trả payload nội bộ)"""
+    job = get_report_jobs().get(job_id)
+    if job is None:
+        return None
+    status = {"job_id": job_id, "state": job["state"]}
+    if job["state"] == DONE:
+        status["file_path"] = job["result"]["file_path"]
+        status["timings"] = job["result"].get("timings", [])
+    elif job["state"] == FAILED:
+        status["error"] = job.get("error")
+    return status
@@ -3,6 +3,7 @@ import google.generativeai as genai
 from dotenv import load_dotenv
 from .finance_calc import current_price
 import json
+from app.core.metrics import timed
 
 def configure_api():
     """Configure and authenticate the API"""
@@ -393,6 +394,7 @@ Yêu cầu:
 - Không dùng từ "theo dữ liệu" hoặc "dựa trên thông tin được cung cấp"
 """
 
+@timed("gemini.financial_commentary")
 def generate_financial_commentary(company_code, page2_data):
     """
     Tạo chú thích tài chính cho 4 mục chính:
@@ -560,6 +562,7 @@ def generate_financial_commentary(company_code, page2_data):
             'Lợi nhuận từ HĐKD': ''
         }
 
+@timed("gemini.financial_analysis")
 def generate_financial_analysis(balance_sheet=None, income_statement=None, profitability_analysis=None, custom_prompt=None, symbol=None):
     """Generate financial analysis from the API"""
     # Configure API if not already done
@@ -630,6 +633,7 @@ def generate_financial_analysis(balance_sheet=None, income_statement=None, profi
         return f"Error generating analysis: {str(e)}"
 
 
+@timed("gemini.revenue_commentary")
 def generate_revenue_commentary(revenue_data):
     """Generate commentary for revenue section based on provided data"""
     try:
@@ -669,6 +673,7 @@ def generate_revenue_commentary(revenue_data):
         print(f"Error generating revenue commentary: {str(e)}")
         return "Doanh thu dự kiến tăng trưởng ổn định nhờ mở rộng thị trường và cải thiện sản phẩm."
 
+@timed("gemini.gross_profit_commentary")
 def generate_gross_profit_commentary(gross_profit_data):
     """Generate commentary for gross profit and expenses section based on provided data"""
     try:
@@ -708,6 +713,7 @@ def generate_gross_profit_commentary(gross_profit_data):
         print(f"Error generating gross profit commentary: {str(e)}")
         return ""
 
+@timed("gemini.operating_profit_commentary")
 def generate_operating_profit_commentary(operating_profit_data):
     """Generate commentary for operating profit and net profit section based on provided data"""
     try:
@@ -747,6 +753,7 @@ def generate_operating_profit_commentary(operating_profit_data):
         print(f"Error generating operating profit commentary: {str(e)}")
         return " "
 
+@timed("gemini.valuation_commentary")
 def generate_valuation_commentary(company_code, valuation_data, peer_data=None):
     """Generate commentary for valuation section based on provided data"""
     try:
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
+from app.core.metrics import timed
 
+@timed("report.excel_read")
 def read_data(file_paths):
     """Read data from Excel files"""
     return [pd.read_excel(path, engine="openpyxl") for path in file_paths]
@@ -1,7 +1,10 @@
 import pandas as pd
 import numpy as np
 import datetime
-from vnstock import Vnstock
+from app.core.vnstock_pool import vnstock_pool, BULK
+from app.core.trading_calendar import trading_calendar
+from app.core.metrics import timed
+from app.core.log import get_logger
 import datetime
 import pandas as pd
 from concurrent.futures import ThreadPoolExecutor
@@ -10,6 +13,7 @@ import logging
 import time
 
 logging.getLogger('vnstock.common.data.data_explorer').setLevel(logging.ERROR)
+log = get_logger(__name__)
 
 # Cache dictionary to store predict_price results with timestamps
 _price_prediction_cache = {}
@@ -77,11 +81,10 @@ def calculate_financial_ratios(net_income, total_equity, total_assets, revenue,
     }
 
 def get_52_week_high_low(symbol):
-    stock = Vnstock().stock(symbol=symbol, source='VCI')
     end_date = datetime.datetime.now().strftime('%Y-%m-%d')
     start_date = (datetime.datetime.now() - datetime.timedelta(days=365)).strftime('%Y-%m-%d')
-    historic_data = stock.quote.history(
-        symbol=symbol, 
+    historic_data = vnstock_pool.history(
+        symbol, 'VCI',
         start=start_date, 
         end=end_date, 
         interval='1W'
@@ -91,9 +94,9 @@ def get_52_week_high_low(symbol):
     result = f"{max_price} / {min_price}"
     return result
 
+@timed("report.vnstock.current_price")
 def current_price(symbol):
-    stock = Vnstock().stock(symbol=symbol, source='VCI')
-    k = stock.quote.intraday(symbol=symbol)
+    k = vnstock_pool.call(symbol, 'VCI', lambda client: client.quote.intraday(symbol=symbol))
     return k['price'].values[-1]
 
 def get_index_data(symbol='VNINDEX'):
@@ -106,55 +109,47 @@ def get_index_data(symbol='VNINDEX'):
         dict: Dữ liệu chỉ số bao gồm giá trị mới nhất và lịch sử
     """
     try:
-        # Khởi tạo đối tượng Stock
-        vci_stock = Vnstock().stock(symbol="VCI",source='VCI')
-        
-        # Lấy ngày hiện tại và ngày 7 ngày trước đó để đảm bảo có dữ liệu
+        # Lấy ngày hiện tại và 5 phiên giao dịch trước đó để đảm bảo có dữ liệu
         current_date = datetime.datetime.now().strftime('%Y-%m-%d')
-        prev_date = (datetime.datetime.now() - datetime.timedelta(days=7)).strftime('%Y-%m-%d')
+        prev_date = trading_calendar.shift_sessions(datetime.datetime.now(), -5).strftime('%Y-%m-%d')
         
-        print(f"Lấy dữ liệu {symbol} từ {prev_date} đến {current_date}")
+        log.debug("report.index_data.fetch", symbol=symbol, start=prev_date, end=current_date)
         
         try:
             # Lấy dữ liệu chỉ số theo symbol được truyền vào
-            index_data = vci_stock.quote.history(
-                symbol=symbol, 
+            index_data = vnstock_pool.history(
+                symbol, 'VCI',
                 start=prev_date, 
                 end=current_date, 
                 interval='1m'  # Sử dụng 1d để lấy dữ liệu theo ngày
             )
             
-            # Debug
-            print(f"Kết quả {symbol} data: {type(index_data)}")
-            print(f"Số dòng: {len(index_data) if hasattr(index_data, '__len__') else 'Không xác định'}")
-            
             # Sắp xếp dữ liệu theo thời gian
             if hasattr(index_data, 'sort_values') and 'time' in index_data.columns:
                 index_data = index_data.sort_values(by='time', ascending=True)
-                print(f"Đã sắp xếp dữ liệu {symbol}")
                 
                 # Lấy giá đóng cửa mới nhất
                 last_value = index_data.iloc[-1]['close']
-                print(f"{symbol} mới nhất: {last_value}")
+                log.debug("report.index_data.latest", symbol=symbol, rows=len(index_data), value=last_value)
                 
                 return {
                     'value': last_value,
                     'data': index_data
                 }
             else:
-                print(f"Lỗi: không thể sắp xếp dữ liệu {symbol}")
+                log.warning("report.index_data.unsortable", symbol=symbol)
                 return {
                     'value': None,
                     'data': None
                 }
         except Exception as e:
-            print(f"Lỗi khi lấy dữ liệu {symbol}: {str(e)}")
+            log.exception("report.index_data.fetch_failed", symbol=symbol)
             return {
                 'value': None,
                 'data': None
             }
     except Exception as e:
-        print(f"Lỗi tổng thể khi lấy dữ liệu chỉ số {symbol}: {str(e)}")
+        log.exception("report.index_data.failed", symbol=symbol)
         return {
             'value': None,
             'data': None
@@ -174,15 +169,9 @@ def get_market_cap(symbol):
         return None
         
     try:
-        # Khởi tạo đối tượng Stock
-        vci_stock = Vnstock().stock(symbol="VCI",source='VCI')
-        
-        # Lấy dữ liệu cho symbol
-        stock_data = vci_stock.trading.price_board([symbol])
+        # Lấy dữ liệu cho symbol (bảng giá không phụ thuộc client của mã)
+        stock_data = vnstock_pool.call("VCI", 'VCI', lambda client: client.trading.price_board([symbol]))
         stock_data = stock_data['match']['total_accumulated_value']
-        # Debug
-        print(f"Dữ liệu cổ phiếu {symbol}: {stock_data}")
-        
         # Kiểm tra xem có dữ liệu không
         if stock_data is not None:
             # Xử lý trường hợp kết quả là Series của pandas
@@ -191,28 +180,28 @@ def get_market_cap(symbol):
                 market_cap_value = stock_data.iloc[0]
                 # Chuyển từ VND sang tỷ VND
                 market_cap_billion = market_cap_value / 1_000
-                print(f"Vốn hóa thị trường của {symbol}: {market_cap_billion} tỷ VND")
+                log.debug("report.market_cap", symbol=symbol, billion_vnd=market_cap_billion)
                 return market_cap_billion
             else:
                 # Nếu là giá trị đơn lẻ
                 market_cap_billion = stock_data / 1_000
-                print(f"Vốn hóa thị trường của {symbol}: {market_cap_billion} tỷ VND")
+                log.debug("report.market_cap", symbol=symbol, billion_vnd=market_cap_billion)
                 return market_cap_billion
         
         return None
         
     except Exception as e:
-        print(f"Lỗi khi lấy vốn hóa thị trường cho {symbol}: {str(e)}")
+        log.exception("report.market_cap_failed", symbol=symbol)
         return None
 
 def codonglon(symbol):
-    company = Vnstock().stock(symbol=symbol, source='TCBS').company
-    return company.shareholders().head(3)
+    shareholders = vnstock_pool.call(symbol, 'TCBS', lambda client: client.company.shareholders())
+    return shareholders.head(3)
 
 def cp_luuhanh(symbol):
     """Lấy số lượng cổ phiếu lưu hành của một mã cổ phiếu"""
-    company = Vnstock().stock(symbol=symbol, source='TCBS').company
-    overview_data = company.overview()
+    overview_data = vnstock_pool.call(symbol, 'TCBS', lambda client: client.company.overview(),
+                                      key=("overview", symbol.upper()))
     return overview_data['outstanding_share'].values[0]
     
 def get_vnindex_data():
@@ -228,11 +217,10 @@ def get_vnindex_data():
     }
 
 def KLGD_90_ngay(symbol):
-    stock = Vnstock().stock(symbol=symbol, source='VCI')
     end_date = datetime.datetime.now().strftime('%Y-%m-%d')
-    start_date = (datetime.datetime.now() - datetime.timedelta(days=140)).strftime('%Y-%m-%d')
-    daily_data = stock.quote.history(
-        symbol=symbol, 
+    start_date = trading_calendar.shift_sessions(datetime.datetime.now(), -90).strftime('%Y-%m-%d')
+    daily_data = vnstock_pool.history(
+        symbol, 'VCI',
         start=start_date, 
         end=end_date, 
         interval='1D'
@@ -247,10 +235,9 @@ def KLGD_90_ngay(symbol):
 
 def GTGD_90_ngay(symbol):
     end_date = datetime.datetime.now().strftime('%Y-%m-%d')
-    stock = Vnstock().stock(symbol=symbol, source='VCI')
-    start_date = (datetime.datetime.now() - datetime.timedelta(days=140)).strftime('%Y-%m-%d')
-    daily_data = stock.quote.history(
-        symbol=symbol, 
+    start_date = trading_calendar.shift_sessions(datetime.datetime.now(), -90).strftime('%Y-%m-%d')
+    daily_data = vnstock_pool.history(
+        symbol, 'VCI',
         start=start_date, 
         end=end_date, 
         interval='1D'
@@ -271,9 +258,8 @@ def GTGD_90_ngay(symbol):
 
 def industry_pe(industry_name): # chưa testing
     try:
-        stock = Vnstock().stock(symbol="VCI",source='TCBS')
         # Get companies in the specified industry
-        companies = stock.listing.symbols_by_industries()
+        companies = vnstock_pool.symbols_by_industries('TCBS', priority=BULK)
         filtered_companies = companies[companies['icb_name4'] == industry_name]
         filtered_companies = filtered_companies[filtered_companies['icb_name4'] == industry_name]
         symbols = filtered_companies['symbol'].tolist()
@@ -281,8 +267,7 @@ def industry_pe(industry_name): # chưa testing
             raise ValueError(f"No companies found for industry: {industry_name}")
         pe_data = []
         for symbol in symbols:
-            stock = Vnstock().stock(symbol=symbol, source='VCI')
-            data = stock.finance.ratio(period='year', lang='en', dropna=True).loc[:, [('Meta', 'yearReport'), ('Chỉ tiêu định giá', 'P/E'), ('Chỉ tiêu định giá', 'Market Capital (Bn. VND)')]].head(1)
+            data = vnstock_pool.ratio(symbol, 'VCI', priority=BULK, period='year', lang='en', dropna=True).loc[:, [('Meta', 'yearReport'), ('Chỉ tiêu định giá', 'P/E'), ('Chỉ tiêu định giá', 'Market Capital (Bn. VND)')]].head(1)
             pe_data.append(data)
         
         pe_df = pd.concat(pe_data, ignore_index=True)
@@ -304,8 +289,7 @@ def industry_pe(industry_name): # chưa testing
 
 def industry_name(symbol):
     try:
-        stock = Vnstock().stock(symbol=symbol, source='TCBS')
-        symbols_industries = stock.listing.symbols_by_industries()
+        symbols_industries = vnstock_pool.symbols_by_industries('TCBS')
         # Lọc dữ liệu theo symbol
         filtered_data = symbols_industries[symbols_industries['symbol'] == symbol]
         
@@ -325,6 +309,7 @@ def industry_name(symbol):
         print(f"Lỗi khi lấy thông tin ngành nghề của {symbol}: {str(e)}")
         return "Không xác định"
     
+@timed("report.vnstock.predict_price")
 def predict_price(symbol):
     # Check if prediction is in cache and not expired
     current_time = time.time()
@@ -335,8 +320,7 @@ def predict_price(symbol):
             return fair_value, profit_percent
     
     try:
-        stock = Vnstock().stock(symbol=symbol, source='VCI')
-        ratio_data = stock.finance.ratio(symbol=symbol)
+        ratio_data = vnstock_pool.ratio(symbol, 'VCI', symbol=symbol)
         ratio_data.columns.tolist()
         eps_data = ratio_data[[('Meta', 'yearReport'), ('Chỉ tiêu định giá', 'EPS (VND)')]].dropna().copy()
         eps_data.columns = ['yearReport', 'EPS']
@@ -362,6 +346,7 @@ def predict_price(symbol):
         print(f"Lỗi khi dự đoán giá mục tiêu cho {symbol}: {str(e)}")
         return 0, 0
 
+@timed("report.vnstock.market_data")
 def get_market_data(stock_info=None, symbol=None):
     """Lấy các dữ liệu thị trường bao gồm VNINDEX và thông tin cổ phiếu"""
     # Trả về tất cả giá trị là N/A
@@ -376,9 +361,6 @@ def get_market_data(stock_info=None, symbol=None):
         "co_dong_lon": None  # Thêm key để lưu danh sách cổ đông lớn
     }
 
-    # Debug: In ra các khóa trong market_data để kiểm tra
-    print(f"Initial market_data keys: {list(market_data.keys())}")
-    
     # Thử lấy dữ liệu các chỉ số từ API
     try:
         # Lấy dữ liệu VNINDEX
@@ -387,7 +369,7 @@ def get_market_data(stock_info=None, symbol=None):
             if isinstance(vnindex_result['value'], (int, float)):
                 # Format với 2 số thập phân thay vì làm tròn
                 market_data["VNINDEX"] = f"{vnindex_result['value']:,.2f}"
-                print(f"Đã lấy được VNINDEX: {market_data['VNINDEX']}")
+                log.debug("report.market_data.field", field="VNINDEX", value=market_data["VNINDEX"])
         
         # Lấy dữ liệu HNXINDEX
         hnxindex_result = get_index_data('HNXINDEX')
@@ -395,7 +377,7 @@ def get_market_data(stock_info=None, symbol=None):
             if isinstance(hnxindex_result['value'], (int, float)):
                 # Format với 2 số thập phân thay vì làm tròn
                 market_data["HNXINDEX"] = f"{hnxindex_result['value']:,.2f}"
-                print(f"Đã lấy được HNXINDEX: {market_data['HNXINDEX']}")
+                log.debug("report.market_data.field", field="HNXINDEX", value=market_data["HNXINDEX"])
         
         # Lấy vốn hóa thị trường của cổ phiếu
         if symbol:
@@ -403,53 +385,52 @@ def get_market_data(stock_info=None, symbol=None):
             try:
                 shareholders_df = codonglon(symbol)
                 if shareholders_df is not None and not shareholders_df.empty:
-                    print(f"Đã lấy được thông tin cổ đông lớn: {len(shareholders_df)} cổ đông")
+                    log.debug("report.market_data.field", symbol=symbol, field="co_dong_lon", rows=len(shareholders_df))
                     market_data["co_dong_lon"] = shareholders_df
                 else:
-                    print("Không lấy được thông tin cổ đông lớn")
+                    log.warning("report.market_data.missing", symbol=symbol, field="co_dong_lon")
             except Exception as e:
-                print(f"Lỗi khi lấy thông tin cổ đông lớn: {str(e)}")
+                log.exception("report.market_data.field_failed", symbol=symbol, field="co_dong_lon")
             
             kl_gd_90_ngay = KLGD_90_ngay(symbol)
             if kl_gd_90_ngay is not None:
                 market_data["KLGD bình quân 90 ngày"] = f"{kl_gd_90_ngay}"
-                print(f"Đã lấy được KLGD bình quân 90 ngày: {market_data['KLGD bình quân 90 ngày']}")
+                log.debug("report.market_data.field", symbol=symbol, field="KLGD bình quân 90 ngày", value=kl_gd_90_ngay)
             gtgd_90_ngay = GTGD_90_ngay(symbol)
             if gtgd_90_ngay is not None:
                 market_data["GTGD bình quân 90 ngày"] = f"{gtgd_90_ngay}"
-                print(f"Đã lấy được GTGD bình quân 90 ngày: {market_data['GTGD bình quân 90 ngày']}")
+                log.debug("report.market_data.field", symbol=symbol, field="GTGD bình quân 90 ngày", value=gtgd_90_ngay)
             five_two_week_high_low = get_52_week_high_low(symbol)
             if five_two_week_high_low is not None:
                 market_data["52-tuần cao/thấp"] = f"{five_two_week_high_low}"
-                print(f"Đã lấy được 52-tuần cao/thấp: {market_data['52-tuần cao/thấp']}")
+                log.debug("report.market_data.field", symbol=symbol, field="52-tuần cao/thấp", value=five_two_week_high_low)
             cp_luuhanh1 = cp_luuhanh(symbol)
             if cp_luuhanh1 is not None:
                 market_data["SL CP lưu hành (triệu CP)"] = f"{cp_luuhanh1:,.2f}"
-                print(f"Đã lấy được số lượng cổ phiếu lưu hành: {market_data['SL CP lưu hành (triệu CP)']}")
+                log.debug("report.market_data.field", symbol=symbol, field="SL CP lưu hành (triệu CP)", value=cp_luuhanh1)
             market_cap = get_market_cap(symbol)
             if market_cap is not None:
                 # Đảm bảo market_cap là giá trị số
                 if isinstance(market_cap, (int, float)):
                     market_data["Vốn hóa (tỷ VND)"] = f"{market_cap:,.2f}"
-                    print(f"Đã lấy được vốn hóa thị trường: {market_data['Vốn hóa (tỷ VND)']}")
+                    log.debug("report.market_data.field", symbol=symbol, field="Vốn hóa (tỷ VND)", value=market_cap)
                 else:
                     # Nếu là kiểu Series hoặc kiểu khác, cố gắng chuyển đổi
                     try:
                         market_cap_float = float(market_cap)
                         market_data["Vốn hóa (tỷ VND)"] = f"{market_cap_float:,.2f}"
-                        print(f"Đã chuyển đổi và lấy được vốn hóa thị trường: {market_data['Vốn hóa (tỷ VND)']}")
+                        log.debug("report.market_data.field", symbol=symbol, field="Vốn hóa (tỷ VND)", value=market_cap_float)
                     except:
-                        print(f"Không thể chuyển đổi vốn hóa thị trường sang số: {market_cap}")
+                        log.warning("report.market_data.invalid", symbol=symbol, field="Vốn hóa (tỷ VND)", value=market_cap)
     except Exception as e:
-        print(f"Lỗi khi lấy dữ liệu chỉ số thị trường: {str(e)}")
+        log.exception("report.market_data.failed", symbol=symbol)
     
     return market_data
 
 def analyze_stock_data_2025_2026_p1(symbol):
     # Fetch data
-    stock = Vnstock().stock(symbol=symbol, source='VCI')
-    data1 = stock.finance.ratio(symbol=symbol)
-    data2 = stock.finance.income_statement(symbol=symbol)
+    data1 = vnstock_pool.ratio(symbol, 'VCI', symbol=symbol)
+    data2 = vnstock_pool.call(symbol, 'VCI', lambda client: client.finance.income_statement(symbol=symbol))
 
     # Process data1
     table_data1 = data1[[
@@ -571,8 +552,9 @@ def analyze_stock_data_2025_2026_p1(symbol):
     # Format number display
     pd.options.display.float_format = '{:,.2f}'.format
     
-    print("Debug - Results DataFrame:")
-    print(results_df)
+    # In cả DataFrame chỉ khi bật DEBUG
+    if log.is_enabled():
+        log.debug("report.financials_p1", rows=len(results_df), table=results_df.to_string())
     
     return results_df
 
@@ -583,16 +565,13 @@ def analyze_stock_financials_p2(symbol):
     print(f"Bắt đầu phân tích tài chính cho {symbol}")
     try:
         # Get data
-        print(f"Tạo đối tượng Vnstock() cho {symbol}")
-        stock = Vnstock().stock(symbol=symbol, source='VCI')
-        
         print(f"Lấy dữ liệu báo cáo thu nhập cho {symbol}")
-        data2 = stock.finance.income_statement(period='year')
+        data2 = vnstock_pool.call(symbol, 'VCI', lambda client: client.finance.income_statement(period='year'))
         print(f"Dạng dữ liệu data2: {type(data2)}")
         print(f"Số dòng trong data2: {len(data2)}")
         
         print(f"Lấy dữ liệu tỷ lệ tài chính cho {symbol}")
-        data1 = stock.finance.ratio(period='year')
+        data1 = vnstock_pool.ratio(symbol, 'VCI', period='year')
         print(f"Dạng dữ liệu data1: {type(data1)}")
         print(f"Số dòng trong data1: {len(data1)}")
 
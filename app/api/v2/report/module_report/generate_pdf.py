@@ -8,7 +8,6 @@ from reportlab.platypus import BaseDocTemplate, Frame, NextPageTemplate, PageTem
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from .finance_calc import get_market_data, current_price
-from vnstock import Vnstock
 from ..page_report.page1 import Page1
 from ..page_report.page2 import Page2
 from ..page_report.page3 import Page3
@@ -16,6 +15,7 @@ from ..page_report.page4 import Page4
 from ..page_report.page5 import Page5
 from ..page_report.page6 import Page6
 import io
+from app.core.metrics import timed, span
 
 class PDFReport:
     def __init__(self):
@@ -66,6 +66,7 @@ class PDFReport:
             print(f"Lỗi khi đăng ký font: {str(e)}")
             return False
     
+    @timed("report.create_stock_report")
     def create_stock_report(self, output_path, company_data, recommendation_data, market_data=None, analysis_data=None, projection_data=None, page2_projection_data=None, peer_data=None, valuation_data=None):
         """Tạo báo cáo chứng khoán theo mẫu mới"""
         width, height = A4
@@ -186,8 +187,9 @@ class PDFReport:
         page6_content = self.page6.create_page6(company_data=company_data)
         story.extend(page6_content)
         
-        # Xuất PDF
-        doc.build(story)
+        # Xuất PDF (vẽ template, biểu đồ nhúng và ghi file)
+        with span("report.pdf_build"):
+            doc.build(story)
         return output_path
 
 def generate_page4_pdf(output_path="company_overview.pdf"):
@@ -10,7 +10,8 @@ from reportlab.pdfgen.canvas import Canvas
 import datetime
 import os
 import matplotlib.pyplot as plt
-from vnstock import Vnstock
+from app.core.vnstock_pool import vnstock_pool
+from app.core.metrics import timed
 
 class Page1:
     def __init__(self, font_added=False):
@@ -206,12 +207,12 @@ class Page1:
         # Nếu không phải tiêu đề, hoặc định dạng không đúng
         return ("normal", text)
 
+    @timed("report.chart.shareholders")
     def create_shareholders_chart(self, market_data):
         """Tạo biểu đồ tròn cổ đông lớn sử dụng vnstock"""
         try:
             # Lấy dữ liệu cổ đông từ vnstock
-            company = Vnstock().stock(symbol='NKG', source='TCBS').company
-            shareholders_df = company.shareholders()
+            shareholders_df = vnstock_pool.call('NKG', 'TCBS', lambda client: client.company.shareholders())
             
             # Tạo thư mục tạm thời nếu chưa tồn tại
             temp_dir = os.path.join("backend", "app", "api", "v2", "report", "temp")
@@ -477,6 +478,7 @@ class Page1:
         table.setStyle(style)
         return table
 
+    @timed("report.page1")
     def create_page1(self, doc, company_data, recommendation_data, market_data, analysis_data, projection_data=None):
         """Tạo nội dung cho trang 1"""
         width, height = A4
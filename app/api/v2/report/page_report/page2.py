@@ -10,6 +10,7 @@ from reportlab.pdfgen.canvas import Canvas
 import datetime
 import os
 import json
+from app.core.metrics import timed
 from ..module_report.api_gemini import generate_financial_commentary, generate_gross_profit_commentary
 
 class Page2:
@@ -522,6 +523,7 @@ class Page2:
         
         return elements
 
+    @timed("report.page2")
     def create_page2(self, doc, company_data, projection_data=None):
         """Create the complete second page"""
         elements = []
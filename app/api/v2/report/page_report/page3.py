@@ -9,6 +9,7 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 from reportlab.pdfgen.canvas import Canvas
 import datetime
 import os
+from app.core.metrics import timed
 
 class Page3:
     def __init__(self, font_added=False):
@@ -248,6 +249,7 @@ class Page3:
         table.setStyle(table_style)
         return table
 
+    @timed("report.page3")
     def create_page3(self, doc, company_data, peer_data, valuation_data, recommendation_data):
         """Tạo nội dung cho trang định giá và khuyến nghị"""
         story = []
@@ -12,6 +12,7 @@ import matplotlib.font_manager as fm
 from pathlib import Path
 import datetime as dt
 import matplotlib.dates as mdates
+from app.core.metrics import timed
 
 class Page4:
     def __init__(self, font_added=True):
@@ -58,6 +59,7 @@ class Page4:
         """
         return self.create_page4(pdf_buffer)
     
+    @timed("report.page4")
     def create_page4(self, pdf_buffer=None, company_data=None):
         """
         Create page 4 content
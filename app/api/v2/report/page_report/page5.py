@@ -13,6 +13,7 @@ import matplotlib.font_manager as fm
 from pathlib import Path
 import datetime as dt
 import matplotlib.dates as mdates
+from app.core.metrics import timed
 
 class Page5:
     def __init__(self, font_added=True):
@@ -59,6 +60,7 @@ class Page5:
         """
         return self.create_page5(pdf_buffer)
     
+    @timed("report.page5")
     def create_page5(self, pdf_buffer=None, company_data=None):
         """
         Create page 5 content with charts
@@ -89,6 +91,7 @@ class Page5:
         # Otherwise return elements for inclusion in a larger document
         return elements
     
+    @timed("report.chart.pe")
     def _create_pe_chart(self): 
         """
         Create P/E 2020 - 2024 chart
@@ -299,6 +302,7 @@ class Page5:
         
         return chart_table
     
+    @timed("report.chart.revenue_profit")
     def _create_revenue_profit_chart(self):
         """Create chart showing revenue, profit and growth rates"""
         # Create a single figure
@@ -14,6 +14,7 @@ import matplotlib.font_manager as fm
 from pathlib import Path
 import datetime as dt
 import pandas as pd
+from app.core.metrics import timed
 
 class Page6:
     def __init__(self, font_added=True):
@@ -60,6 +61,7 @@ class Page6:
         """
         return self.create_page6(pdf_buffer)
     
+    @timed("report.page6")
     def create_page6(self, pdf_buffer=None, company_data=None):
         """
         Create page 6 content with financial ratio charts
@@ -110,6 +112,7 @@ class Page6:
         
         return chart_table
     
+    @timed("report.chart.steel_price")
     def _create_steel_price_chart(self):
         """Create steel price chart with annotations"""
         # Dữ liệu giá thép
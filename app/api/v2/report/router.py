@@ -1,11 +1,59 @@
-from fastapi import APIRouter
-from fastapi.responses import FileResponse
-from . import services
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse
 from .schemas import AnalysisResponse
+from app.core.job_queue import DONE, FAILED
+from app.core.metrics import server_timing, server_timing_allowed
+from .jobs import USE_REPORT_WORKER, REPORT_WAIT_TIMEOUT, REPORT_POLL_INTERVAL, submit_pdf_report, job_status
+import asyncio
+import time
 
 router = APIRouter()
 
 @router.get("/pdf/{symbol}")
-def get_pdf(symbol: str):
-    file_path = services.generate_pdf_report(symbol)
-    return FileResponse(file_path, media_type="application/pdf", filename=f"Financial_Report_{symbol}.pdf")
+async def get_pdf(symbol: str, request: Request):
+    if not USE_REPORT_WORKER:
+        from . import services  # reportlab/pandas/vnstock chỉ được import khi có request
+        file_path = await asyncio.to_thread(services.generate_pdf_report, symbol)
+        return FileResponse(file_path, media_type="application/pdf", filename=f"Financial_Report_{symbol}.pdf")
+
+    # Report worker tạo PDF ở process riêng, API chỉ chờ kết quả trong hàng đợi
+    job_id = submit_pdf_report(symbol)
+    deadline = time.time() + REPORT_WAIT_TIMEOUT
+    while time.time() < deadline:
+        response = _job_response(job_id, symbol, request)
+        if response is not None:
+            return response
+        await asyncio.sleep(REPORT_POLL_INTERVAL)
+    return JSONResponse(status_code=202, content={"job_id": job_id, "state": "pending",
+                                                  "status_url": _status_url(request, job_id)})
+
+@router.get("/pdf/jobs/{job_id}")
+async def get_pdf_job(job_id: str, request: Request):
+    symbol = job_id.rsplit("_", 1)[-1]
+    response = _job_response(job_id, symbol, request)
+    if response is not None:
+        return response
+    return job_status(job_id)
+
+def _status_url(request: Request, job_id: str) -> str:
+    """Đường dẫn tuyệt đối (/api/v2/pdf/jobs/...) của route theo dõi job, cùng phiên bản API với request"""
+    # v1 dùng lại get_pdf với tên route có hậu tố _v1 (xem app/api/v1/report/router.py)
+    route_name = getattr(request.scope.get("route"), "name", "")
+    job_route = "get_pdf_job_v1" if route_name.endswith("_v1") else "get_pdf_job"
+    return request.url_for(job_route, job_id=job_id).path
+
+def _job_response(job_id: str, symbol: str, request: Request):
+    """FileResponse khi job xong, lỗi 500/404 khi job hỏng/không tồn tại, None khi còn đang chạy"""
+    status = job_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Report job {job_id} not found")
+    if status["state"] == DONE:
+        # Các bước chạy trong report worker, không nằm trong trace của request này
+        headers = None
+        if status["timings"] and server_timing_allowed(request.headers):
+            headers = {"X-Report-Timing": server_timing(status["timings"])}
+        return FileResponse(status["file_path"], media_type="application/pdf", filename=f"Financial_Report_{symbol}.pdf",
+                            headers=headers)
+    if status["state"] == FAILED:
+        raise HTTPException(status_code=500, detail=status["error"])
+    return None
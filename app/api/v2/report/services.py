@@ -10,13 +10,13 @@ from .module_report.finance_calc import (calculate_total_current_assets, calcula
                                         analyze_stock_financials_p2)
 from .module_report.generate_pdf import PDFReport, generate_page4_pdf, generate_page5_pdf, generate_page6_pdf
 from .module_report.api_gemini import generate_financial_analysis
-from vnstock import Vnstock
+from app.core.vnstock_pool import vnstock_pool
+from app.core.metrics import timed
 from .cache_manager import save_page1_data, save_page2_data, save_result_dataset, save_stock_data
 
 def get_company_industry(symbol):
     try:
-        stock = Vnstock().stock(symbol=symbol, source='VCI')
-        symbols_by_industry = stock.listing.symbols_by_industries()
+        symbols_by_industry = vnstock_pool.symbols_by_industries('VCI')
         company_info = symbols_by_industry[symbols_by_industry['symbol'].str.upper() == symbol.upper()]
         if not company_info.empty and 'icb_name4' in company_info.columns:
             icb_name4_value = company_info['icb_name4'].values[0]
@@ -26,11 +26,12 @@ def get_company_industry(symbol):
         print(f"Lỗi khi lấy thông tin ngành nghề: {str(e)}")
         return "Không xác định"
 
+@timed("report.vnstock.company_name")
 def get_company_name(symbol):
     """Get company name from symbol"""
     try:
-        stock = Vnstock().stock(symbol=symbol, source='TCBS')
-        company_info = stock.company.overview()
+        company_info = vnstock_pool.call(symbol, 'TCBS', lambda client: client.company.overview(),
+                                         key=("overview", symbol.upper()))
         return company_info['short_name'].values[0]
     except Exception as e:
         print(f"Error getting company name: {str(e)}")
@@ -221,6 +222,7 @@ def get_projection_data_from_analyze_function(symbol):
     
     return projection_data
 
+@timed("report.projection_page1")
 def get_projection_data_for_page1(symbol):
     """
     Generate projection data for page 1 of the report.
@@ -237,6 +239,7 @@ def get_projection_data_for_page1(symbol):
     # Return the complete projection data
     return projection_data
 
+@timed("report.generate_pdf_report")
 def generate_pdf_report(symbol: str):
     try:
         # Fix the file paths for financial data - ensure proper formatting with os.path.join
@@ -746,6 +749,7 @@ def generate_financial_charts_pdf(output_path=None):
     
     return result_path
 
+@timed("report.industry_peers")
 def get_page3_industry_peers_data(symbol=None):
     """
     Returns industry peer comparison data for page3.
@@ -826,6 +830,7 @@ def get_fallback_peer_data(symbol=None):
     
     return steel_industry_peers
 
+@timed("report.projection_page2")
 def create_projection_data(symbol):
     """Create projection data for page 2 using analyze_stock_financials_p2"""
     try:
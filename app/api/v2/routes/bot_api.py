@@ -1,17 +1,17 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
-import google.generativeai as genai
-from ..Chatbot.gemini_api import Gemini_api
-from ..Chatbot.generate_plot import GeneratePlot
-from ..Chatbot.latex_pdf.latex_generator import LatexGenerator
+from app.core.lazy import LazyService
+import json
 import os
 from typing import Dict, Any
 
 router = APIRouter()
-gemini_bot = Gemini_api()
-plot_generator = GeneratePlot(None, None, gemini_bot)
-latex_generator = LatexGenerator(gemini_bot)
+# Gemini, matplotlib và lịch sử hội thoại chỉ được nạp khi có request đầu tiên
+gemini_bot = LazyService("app.api.v2.Chatbot.gemini_api:Gemini_api")
+plot_generator = LazyService("app.api.v2.Chatbot.generate_plot:GeneratePlot", None, None, gemini_bot)
+latex_generator = LazyService("app.api.v2.Chatbot.latex_pdf.latex_generator:LatexGenerator", gemini_bot)
 
 # Request models
 class QuestionRequest(BaseModel):
@@ -33,13 +33,42 @@ class APIResponse(BaseModel):
     message: str
     data: Optional[Dict[str, Any]] = None
 
+def _build_prompt(request: QuestionRequest) -> str:
+    if request.context:
+        return f"Ngữ cảnh:\n{request.context}\n\nCâu hỏi: {request.question}"
+    return request.question
+
+def _sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    payload = json.dumps(data, ensure_ascii=False)
+    if event:
+        return f"event: {event}\ndata: {payload}\n\n"
+    return f"data: {payload}\n\n"
+
+async def _stream_answer(prompt: str):
+    # Mỗi đoạn text là một event `data`, kết thúc bằng event `done` (hoặc `error`)
+    from ..Chatbot.llm_client import LLMError
+    try:
+        async for chunk in gemini_bot.stream_ai_response(prompt):
+            yield _sse_event({"text": chunk})
+        yield _sse_event({}, event="done")
+    except LLMError as e:
+        yield _sse_event({"message": str(e)}, event="error")
+
 @router.post("/ask", response_model=APIResponse)
-async def ask_question(request: QuestionRequest):
+async def ask_question(request: QuestionRequest, stream: bool = Query(False, description="Trả về câu trả lời dạng Server-Sent Events")):
     """
     Ask a question to the AI bot
     """
+    prompt = _build_prompt(request)
+    if stream:
+        return StreamingResponse(
+            _stream_answer(prompt),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     try:
-        response = await gemini_bot.generate_ai_response(request.question, request.context)
+        response = await gemini_bot.generate_ai_response(prompt)
         return {
             "success": True,
             "message": "Question answered successfully",
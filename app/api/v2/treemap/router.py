@@ -1,58 +1,67 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import Dict, List, Any
+import asyncio
 import time
 
-from .services import Treemap
-from .schemas import TreemapResponse, StockData
+from app.core.services import treemap_service
+from app.core.log import get_logger
+from .schemas import TreemapResponse
 
 router = APIRouter(tags=["Treemap"])
+log = get_logger(__name__)
 
-# Sử dụng một instance duy nhất cho toàn bộ ứng dụng
-treemap_instance = Treemap()
+# Service dùng chung với API v1/v2 (tạo ở request đầu tiên, cache treemap chỉ có một bản)
+treemap_instance = treemap_service
 
 @router.get("/{index_name}", response_model=TreemapResponse)
-async def get_stocks_by_index(index_name: str):
+async def get_stocks_by_index(
+    index_name: str,
+    format: str = Query("records", pattern="^(records|columnar)$", description="records: [{symbol, market_cap}], columnar: {symbols[], market_cap[]}")
+):
     """
     Lấy danh sách cổ phiếu của một chỉ số cụ thể với thông tin vốn hóa và GTGD
     
     Args:
         index_name: Tên chỉ số (HOSE, HNX, UPCOM)
+        format: records hoặc columnar (mảng symbols và market_cap)
         
     Returns:
         TreemapResponse: Danh sách cổ phiếu với thông tin
     """
     try:
-        print(f"Starting to fetch stock data for {index_name}...")
         start_time = time.time()
         
         # Lấy dữ liệu cổ phiếu với vốn hóa và GTGD
-        result = treemap_instance.sort_cp(index_name)
+        # Service gọi vnstock đồng bộ (có thể chờ rate limit), chạy ngoài event loop
+        result = await asyncio.to_thread(treemap_instance.sort_cp, index_name)
         
         # Extract the DataFrame and convert to records
-        if isinstance(result, dict) and 'market_cap_data' in result:
-            # Convert DataFrame to list of dictionaries
+        if isinstance(result, dict) and 'market_cap_data' in result and not result['market_cap_data'].empty:
             market_cap_df = result['market_cap_data']
-            stocks_data = market_cap_df.to_dict('records')
-            
-            # Chuyển đổi dữ liệu sang định dạng phù hợp với schema
-            formatted_data = [
-                StockData(
-                    symbol=stock["symbol"],
-                    market_cap=float(stock["von_hoa"])  # Use 'von_hoa' instead of 'market_cap'
-                ) for stock in stocks_data
-            ]
+            if format == "columnar":
+                # Trả thẳng các cột numpy, orjson serialize không cần tạo dict từng dòng
+                formatted_data = {
+                    "symbols": market_cap_df['symbol'].astype(str).tolist(),
+                    "market_cap": market_cap_df['von_hoa'].to_numpy(dtype=float)  # Use 'von_hoa' instead of 'market_cap'
+                }
+            else:
+                formatted_data = [
+                    {"symbol": str(symbol), "market_cap": market_cap}
+                    for symbol, market_cap in zip(market_cap_df['symbol'], market_cap_df['von_hoa'].to_numpy(dtype=float).tolist())
+                ]
         else:
-            formatted_data = []
+            formatted_data = {"symbols": [], "market_cap": []} if format == "columnar" else []
         
+        count = len(formatted_data["symbols"]) if format == "columnar" else len(formatted_data)
         elapsed = time.time() - start_time
-        print(f"Fetched {len(formatted_data)} stocks from {index_name} in {elapsed:.2f} seconds")
+        log.debug("treemap.request", index=index_name, stocks=count, seconds=round(elapsed, 3))
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "success": True,
-                "message": f"Successfully fetched {len(formatted_data)} stocks from {index_name}",
-                "data": [stock.dict() for stock in formatted_data]
+                "message": f"Successfully fetched {count} stocks from {index_name}",
+                "data": formatted_data
             },
             headers={
                 "Access-Control-Allow-Origin": "*",
@@ -61,8 +70,8 @@ async def get_stocks_by_index(index_name: str):
             }
         )
     except Exception as e:
-        print(f"Error in get_stocks_by_index: {str(e)}")
-        return JSONResponse(
+        log.exception("treemap.request_failed", index=index_name)
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
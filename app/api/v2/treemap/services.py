@@ -4,7 +4,8 @@
 # LẤY VỐN HÓA TỪ: ratios = stock.finance.ratio(period='year', lang='vi', dropna=True).head(1)
 # vh = ratios.loc[:, ('Chỉ tiêu định giá', 'Vốn hóa (Tỷ đồng)')].values[0]
 # Lấy tất cả mã chứng khoán từ một chỉ số: k = stock.listing.symbols_by_group('HOSE')
-from vnstock import Vnstock
+from app.core.vnstock_pool import vnstock_pool, INTERACTIVE, BULK
+from app.core.log import get_logger
 from typing import List, Dict, Any
 import asyncio
 import time
@@ -16,10 +17,11 @@ import json
 from datetime import datetime, timedelta
 import random
 
+log = get_logger(__name__)
+
 class Treemap:
     def __init__(self):
         print("Initializing Treemap instance...")
-        self.stock = Vnstock().stock(symbol="VCI",source='VCI')
         self.cache_dir = os.path.join(os.path.dirname(__file__), 'cache')
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
@@ -78,30 +80,28 @@ class Treemap:
             print(f"Error loading cache: {str(e)}")
         return None
 
-    def get_all_CP(self, symbol: str):
+    def get_all_CP(self, symbol: str, priority: str = INTERACTIVE):
         try:
-            all_cp = self.stock.listing.symbols_by_group(symbol)
+            all_cp = vnstock_pool.symbols_by_group(symbol, priority=priority)
             return all_cp
         except Exception as e:
             return []
     
     def get_vh(self, symbol: str):
         try:
-            stock_company = Vnstock().stock(symbol=symbol, source='VCI')
-            vh_data = stock_company.finance.ratio(lang='vi', dropna=True).head(1)
+            vh_data = vnstock_pool.ratio(symbol, 'VCI', priority=BULK, lang='vi', dropna=True).head(1)
             vh = vh_data.loc[:, ('Chỉ tiêu định giá', 'Vốn hóa (Tỷ đồng)')].values[0]
             return {'symbol': symbol, 'von_hoa': vh}
         except Exception as e:
             return {'symbol': symbol, 'von_hoa': None}
 
-    def sort_cp(self, symbol: str):
+    def sort_cp(self, symbol: str, priority: str = INTERACTIVE):
+        """priority=BULK cho job nền (làm nóng cache), để không tranh lượt gọi vnstock với người dùng"""
         try:
-            print(f"Starting sort_cp for {symbol}...")
-            
             # Check if we have valid cached data
             cached_data = self._load_from_cache(symbol)
             if cached_data:
-                print(f"Using cached data for {symbol}")
+                log.debug("treemap.cache_hit", index=symbol)
                 # Convert cache data to DataFrame
                 market_cap_data = pd.DataFrame([
                     {'symbol': item['symbol'], 'von_hoa': item['market_cap']} 
@@ -114,9 +114,9 @@ class Treemap:
                 }
             
             # If no valid cache, fetch fresh data
-            all_symbols = self.get_all_CP(symbol)
+            all_symbols = self.get_all_CP(symbol, priority)
             if len(all_symbols) == 0:
-                print(f"No symbols found for {symbol}")
+                log.warning("treemap.no_symbols", index=symbol)
                 return {'market_cap_data': pd.DataFrame(), 'symbols': []}
             
             with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
@@ -144,6 +144,6 @@ class Treemap:
                 'symbols': symbols_list
             }
         except Exception as e:
-            print(f"Error in sort_cp: {str(e)}")
+            log.exception("treemap.sort_failed", index=symbol)
             return {'market_cap_data': pd.DataFrame(), 'symbols': []}
 
@@ -1,15 +1,24 @@
-from vnstock import Vnstock
+from app.core.vnstock_pool import vnstock_pool, INTERACTIVE
+from app.core.shared_cache import get_shared_cache
+from app.core.cache_policy import cache_policy
 from datetime import datetime, timedelta
 
 class TreemapColorService:
     def __init__(self):
-        self.vnstock = Vnstock
-    def get_data_cp(self,symbol):
-        stock = self.vnstock().stock(symbol=symbol, source='VCI')
+        # Thay đổi giá theo phiên, TTL theo cache_policy (ngắn trong giờ giao dịch)
+        self.cache = get_shared_cache("treemap_color")
+
+    def get_data_cp(self,symbol, refresh=False, priority=INTERACTIVE):
+        """refresh=True bỏ qua cache; job nền truyền priority=BULK để nhường lượt gọi vnstock cho người dùng"""
+        symbol = symbol.upper()
+        cached = None if refresh else self.cache.get(symbol)
+        if cached is not None:
+            return cached
         end_date = datetime.now().strftime('%Y-%m-%d')
         start_date = (datetime.now() - timedelta(days=10)).strftime('%Y-%m-%d')  # Fix parentheses placement
-        df = stock.quote.history(start=start_date, end=end_date, interval='1D')
+        df = vnstock_pool.history(symbol, 'VCI', priority=priority, start=start_date, end=end_date, interval='1D')
         difference = df['open'].iloc[-1] - df['open'].iloc[-2]
         percentage_change = ((df['open'].iloc[-1] - df['open'].iloc[-2]) / df['open'].iloc[-2]) * 100
+        self.cache.set(symbol, (difference, percentage_change), cache_policy.ttl())
         return difference, percentage_change
 
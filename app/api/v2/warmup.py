@@ -0,0 +1,72 @@
+"""
+Các job làm nóng cache cho dashboard lúc mở cửa: chỉ số thị trường, treemap, màu treemap, tin tức top.
+Lịch chạy theo lịch giao dịch, xem app/core/warmup.py.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import asyncio
+import os
+
+from app.core.services import market_indices_service, treemap_service, treemap_color_service, news_service
+from app.core.warmup import CacheWarmer
+from app.core.vnstock_pool import BULK
+from app.core.log import get_logger
+from app.api.v2.news.router import news_ingestor
+
+WARMUP_INDICES = os.getenv("WARMUP_INDICES", "VNINDEX,VN30,HNXINDEX")
+WARMUP_TREEMAP = os.getenv("WARMUP_TREEMAP", "VN30,HOSE,HNX30,UPCOM")
+WARMUP_TOP_NEWS = 5
+COLOR_CONCURRENCY = 4
+
+log = get_logger(__name__)
+
+def _split(value: str) -> List[str]:
+    return [item.strip().upper() for item in value.split(",") if item.strip()]
+
+def _treemap_symbols() -> List[str]:
+    symbols = []
+    for index_name in _split(WARMUP_TREEMAP):
+        for symbol in treemap_service.sort_cp(index_name, priority=BULK)['symbols']:
+            if symbol not in symbols:
+                symbols.append(symbol)
+    return symbols
+
+def _warm_index(index_code: str):
+    def _run():
+        if not market_indices_service.refresh_market_indices(index_code):
+            raise RuntimeError(f"no data for {index_code}")
+    return _run
+
+def _warm_treemap(index_name: str):
+    return lambda: treemap_service.sort_cp(index_name, priority=BULK)
+
+def _warm_treemap_colors():
+    """Thay đổi giá của các mã đang hiển thị trên treemap (sort_cp đọc từ cache file của treemap)"""
+    def _refresh(symbol):
+        try:
+            treemap_color_service.get_data_cp(symbol, refresh=True, priority=BULK)
+        except Exception as e:
+            log.warning("warmup.treemap_color_failed", symbol=symbol, error=str(e))
+
+    with ThreadPoolExecutor(max_workers=COLOR_CONCURRENCY) as executor:
+        list(executor.map(_refresh, _treemap_symbols()))
+
+async def _warm_top_news():
+    top_symbols = await asyncio.to_thread(news_service.get_top_symbols_from_cache, WARMUP_TOP_NEWS)
+    news_ingestor.track(*top_symbols)
+    for symbol in top_symbols:
+        await news_ingestor.ingest_symbol(symbol)
+
+def build_cache_warmer() -> CacheWarmer:
+    warmer = CacheWarmer()
+    for index_code in _split(WARMUP_INDICES):
+        warmer.add_job(f"market_indices:{index_code}", _warm_index(index_code), live=True)
+    # Treemap trước, màu treemap và tin top đọc danh sách mã từ cache treemap
+    for index_name in _split(WARMUP_TREEMAP):
+        warmer.add_job(f"treemap:{index_name}", _warm_treemap(index_name))
+    warmer.add_job("treemap_color", _warm_treemap_colors, live=True)
+    warmer.add_job("news:top", _warm_top_news)
+    return warmer
+
+# Dùng chung cho toàn bộ ứng dụng
+cache_warmer = build_cache_warmer()
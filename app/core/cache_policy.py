@@ -0,0 +1,66 @@
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+import os
+
+from app.core.trading_calendar import TradingCalendar, trading_calendar, SESSION_CLOSE
+
+# TTL khi dữ liệu còn thay đổi (trong phiên, và vài phút sau đóng cửa khi nguồn còn chốt số liệu)
+CACHE_LIVE_TTL = float(os.getenv("CACHE_LIVE_TTL", 60))
+CACHE_SETTLE_MINUTES = int(os.getenv("CACHE_SETTLE_MINUTES", 15))
+# Mốc làm mới trước giờ mở cửa: dữ liệu phiên cũ hết hạn lúc này để phiên mới được nạp sẵn
+WARMUP_TIME = time(8, 59)
+
+LIVE = "live"
+SETTLING = "settling"
+FROZEN = "frozen"
+
+class MarketCachePolicy:
+    """
+    TTL cho cache dữ liệu giá (chuỗi thời gian) theo trạng thái phiên giao dịch:
+    - từ 8:59 đến 15:00 (+ CACHE_SETTLE_MINUTES) của ngày giao dịch: LIVE, TTL ngắn (CACHE_LIVE_TTL)
+    - phiên đã đóng, cuối tuần, ngày lễ: FROZEN, dữ liệu không đổi nên giữ tới 8:59 của phiên kế tiếp
+    - dữ liệu của một phiên cũ (session_day trước phiên hiện tại) luôn FROZEN
+    """
+
+    def __init__(self, calendar: TradingCalendar = trading_calendar,
+                 live_ttl: float = CACHE_LIVE_TTL, settle_minutes: int = CACHE_SETTLE_MINUTES):
+        self.calendar = calendar
+        self.live_ttl = live_ttl
+        self.settle = timedelta(minutes=settle_minutes)
+
+    def next_warmup(self, now: Optional[datetime] = None) -> datetime:
+        """Mốc 8:59 của phiên giao dịch kế tiếp sau `now`"""
+        now = now or datetime.now()
+        day = self.calendar.next_session(now, inclusive=True)
+        warmup = datetime.combine(day, WARMUP_TIME)
+        if warmup <= now:
+            warmup = datetime.combine(self.calendar.next_session(day), WARMUP_TIME)
+        return warmup
+
+    def state(self, now: Optional[datetime] = None, session_day: Optional[date] = None) -> str:
+        now = now or datetime.now()
+        if session_day is not None and session_day < now.date():
+            return FROZEN
+        if not self.calendar.is_trading_day(now):
+            return FROZEN
+        warmup = datetime.combine(now.date(), WARMUP_TIME)
+        close = datetime.combine(now.date(), SESSION_CLOSE)
+        if warmup <= now <= close:
+            return LIVE
+        if close < now <= close + self.settle:
+            return SETTLING
+        return FROZEN
+
+    def ttl(self, now: Optional[datetime] = None, session_day: Optional[date] = None) -> float:
+        """Số giây dữ liệu lấy lúc `now` còn dùng được; session_day là phiên của dữ liệu nếu biết"""
+        now = now or datetime.now()
+        if self.state(now, session_day) != FROZEN:
+            return self.live_ttl
+        return max(self.live_ttl, (self.next_warmup(now) - now).total_seconds())
+
+    def expires_at(self, now: Optional[datetime] = None, session_day: Optional[date] = None) -> datetime:
+        now = now or datetime.now()
+        return now + timedelta(seconds=self.ttl(now, session_day))
+
+# Dùng chung cho toàn bộ ứng dụng
+cache_policy = MarketCachePolicy()
@@ -0,0 +1,94 @@
+"""
+Đo thời gian import app.main (cold start của mỗi uvicorn worker) và báo lỗi khi startup chậm đi.
+
+    python -m app.core.import_benchmark [--budget 2.0] [--runs 3]
+
+Thoát với mã 1 nếu thời gian import vượt budget hoặc có module nặng bị import ngay lúc khởi động.
+"""
+from pathlib import Path
+from typing import Dict, List, Tuple
+import subprocess
+import argparse
+import json
+import sys
+import os
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+TARGET_MODULE = "app.main"
+
+# Các module này chỉ được import khi có request/khi bot chạy, không được nạp lúc import app.main
+DEFERRED_MODULES = [
+    "vnstock",
+    "pandas",
+    "matplotlib",
+    "reportlab",
+    "telegram",
+    "google.generativeai",
+    "flask",
+]
+
+IMPORT_TIME_BUDGET = float(os.getenv("IMPORT_TIME_BUDGET", 2.0))
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+def _run_probe(module: str) -> Tuple[Dict, str]:
+    """Import module trong một process Python mới (không dùng lại cache import), kèm -X importtime"""
+    code = _PROBE.format(module=module, deferred=DEFERRED_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import {module} thất bại:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+def _slowest_imports(importtime_log: str, top: int = 10) -> List[Tuple[float, str]]:
+    """Các package cấp cao nhất tốn nhiều thời gian nhất (cột cumulative của -X importtime, micro giây)"""
+    totals = {}
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, name = [part.strip() for part in line[len("import time:"):].split("|")]
+            cumulative = int(cumulative)
+        except ValueError:
+            continue
+        if not name.startswith(" ") and "." not in name:
+            totals[name] = max(totals.get(name, 0), cumulative)
+    return sorted(((us / 1e6, name) for name, us in totals.items()), reverse=True)[:top]
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark thời gian import lúc khởi động")
+    parser.add_argument("--module", default=TARGET_MODULE)
+    parser.add_argument("--budget", type=float, default=IMPORT_TIME_BUDGET, help="Số giây tối đa cho phép")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # Lấy lần nhanh nhất để giảm nhiễu từ disk cache/máy bận
+    runs = [_run_probe(args.module) for _ in range(max(1, args.runs))]
+    best, importtime_log = min(runs, key=lambda run: run[0]["elapsed"])
+    elapsed = best["elapsed"]
+
+    print(f"Import {args.module}: {elapsed:.3f}s (budget {args.budget:.3f}s, best of {len(runs)})")
+    for seconds, name in _slowest_imports(importtime_log):
+        print(f"  {seconds:8.3f}s  {name}")
+
+    failed = False
+    if elapsed > args.budget:
+        print(f"❌ Startup chậm hơn budget {elapsed - args.budget:.3f}s")
+        failed = True
+    if best["loaded"]:
+        print(f"❌ Các module lẽ ra phải import khi cần đã bị nạp lúc khởi động: {', '.join(best['loaded'])}")
+        failed = True
+    if not failed:
+        print("✅ Startup nằm trong budget")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
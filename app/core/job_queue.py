@@ -0,0 +1,152 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+import threading
+import uuid
+import json
+import time
+import os
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+STATES = (PENDING, RUNNING, DONE, FAILED)
+
+def _mtime(file_path: str) -> float:
+    try:
+        return os.path.getmtime(file_path)
+    except OSError:
+        return 0
+
+class FileJobQueue:
+    """
+    Hàng đợi job dùng chung giữa các process qua thư mục trên đĩa (volume chung giữa API và worker):
+    - mỗi job là một file JSON, trạng thái là thư mục chứa file (pending/running/done/failed)
+    - worker nhận job bằng os.rename pending -> running, rename là atomic nên mỗi job chỉ một worker nhận
+    - worker đang chạy job làm mới mtime của file định kỳ (keep_alive); job running không có heartbeat
+      quá stale_after giây (worker chết giữa chừng) được đưa lại về pending
+    - gửi lại một job đã xong không xoá kết quả cũ: kết quả cũ vẫn đọc được cho đến khi job mới
+      chạy xong và ghi đè (get() ưu tiên pending/running)
+    """
+
+    def __init__(self, base_dir: str, stale_after: float = 600):
+        self.base_dir = base_dir
+        self.stale_after = stale_after
+        for state in STATES:
+            os.makedirs(os.path.join(base_dir, state), exist_ok=True)
+
+    def _path(self, state: str, job_id: str) -> str:
+        return os.path.join(self.base_dir, state, f"{job_id}.json")
+
+    def _write(self, state: str, job: Dict):
+        file_path = self._path(state, job["id"])
+        tmp_file = file_path + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(job, f, ensure_ascii=False)
+        os.replace(tmp_file, file_path)
+
+    def _read(self, file_path: str) -> Optional[Dict]:
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def submit(self, kind: str, payload: Dict[str, Any], job_id: Optional[str] = None) -> str:
+        """Thêm job mới; job_id cố định (ví dụ theo mã CP) giúp không tạo trùng job đang chờ/đang chạy"""
+        job_id = job_id or uuid.uuid4().hex
+        current = self.get(job_id)
+        if current and current["state"] in (PENDING, RUNNING):
+            return job_id
+        self._write(PENDING, {"id": job_id, "kind": kind, "payload": payload, "state": PENDING,
+                              "submitted_at": time.time()})
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        for state in STATES:
+            job = self._read(self._path(state, job_id))
+            if job is not None:
+                job["state"] = state
+                return job
+        return None
+
+    def claim(self) -> Optional[Dict]:
+        """Nhận job pending cũ nhất, trả về None nếu hàng đợi rỗng"""
+        self._requeue_stale()
+        pending_dir = os.path.join(self.base_dir, PENDING)
+        names = sorted(
+            (name for name in os.listdir(pending_dir) if name.endswith(".json")),
+            key=lambda name: _mtime(os.path.join(pending_dir, name)),
+        )
+        for name in names:
+            job_id = name[:-len(".json")]
+            try:
+                # rename giữ nguyên mtime: làm mới trước để job chờ lâu trong pending
+                # không bị worker khác coi là job treo ngay sau khi được nhận
+                os.utime(self._path(PENDING, job_id))
+                os.rename(self._path(PENDING, job_id), self._path(RUNNING, job_id))
+            except OSError:
+                continue  # Worker khác đã nhận
+            job = self._read(self._path(RUNNING, job_id))
+            if job is None:
+                continue
+            job["state"] = RUNNING
+            job["started_at"] = time.time()
+            self._write(RUNNING, job)
+            return job
+        return None
+
+    def _finish(self, job_id: str, state: str, **fields):
+        job = self._read(self._path(RUNNING, job_id)) or {"id": job_id}
+        job.update(fields, state=state, finished_at=time.time())
+        self._write(state, job)
+        # Kết quả của lần chạy trước (trạng thái kết thúc còn lại) chỉ bị xoá sau khi kết quả mới đã được ghi
+        for old_state in (RUNNING, FAILED if state == DONE else DONE):
+            try:
+                os.remove(self._path(old_state, job_id))
+            except OSError:
+                pass
+
+    def complete(self, job_id: str, result: Any):
+        self._finish(job_id, DONE, result=result)
+
+    def fail(self, job_id: str, error: str):
+        self._finish(job_id, FAILED, error=error)
+
+    def heartbeat(self, job_id: str) -> bool:
+        """Làm mới mtime của job đang chạy để không bị coi là treo; False nếu job không còn ở running"""
+        try:
+            os.utime(self._path(RUNNING, job_id))
+            return True
+        except OSError:
+            return False
+
+    @contextmanager
+    def keep_alive(self, job_id: str, interval: Optional[float] = None):
+        """Gửi heartbeat định kỳ (mặc định mỗi stale_after / 4 giây) trong lúc worker xử lý job"""
+        interval = interval or self.stale_after / 4
+        stop = threading.Event()
+
+        def _beat():
+            while not stop.wait(interval):
+                self.heartbeat(job_id)
+
+        thread = threading.Thread(target=_beat, daemon=True, name=f"heartbeat_{job_id}")
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def _requeue_stale(self):
+        running_dir = os.path.join(self.base_dir, RUNNING)
+        now = time.time()
+        for name in os.listdir(running_dir):
+            file_path = os.path.join(running_dir, name)
+            try:
+                if name.endswith(".json") and now - os.path.getmtime(file_path) > self.stale_after:
+                    os.rename(file_path, os.path.join(self.base_dir, PENDING, name))
+                    print(f"⚠️ Requeued stale job {name[:-len('.json')]}")
+            except OSError:
+                continue
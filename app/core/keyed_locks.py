@@ -0,0 +1,39 @@
+from typing import Dict, Hashable, Optional
+import threading
+import time
+
+class KeyedLocks:
+    """
+    Mỗi khoá (mã CP, (loại, mã, kỳ)...) một threading.Lock, tạo khi cần:
+    các luồng cùng tải một khoá thì chờ nhau, khoá khác nhau chạy song song.
+    """
+
+    def __init__(self):
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key: Hashable) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    def __len__(self):
+        return len(self._locks)
+
+class IdleSweeper:
+    """Giới hạn tần suất quét dọn dữ liệu không hoạt động: due() chỉ trả True tối đa mỗi interval giây"""
+
+    def __init__(self, interval: float = 60):
+        self.interval = interval
+        self._last_sweep = time.time()
+        self._guard = threading.Lock()
+
+    def due(self, now: Optional[float] = None) -> bool:
+        now = now or time.time()
+        with self._guard:
+            if now - self._last_sweep < self.interval:
+                return False
+            self._last_sweep = now
+            return True
@@ -0,0 +1,45 @@
+from importlib import import_module
+from typing import Any, Callable, Union
+import threading
+
+def import_string(path: str) -> Any:
+    """Import theo chuỗi 'package.module:attr' (hoặc chỉ 'package.module') tại thời điểm gọi"""
+    module_name, _, attr = path.partition(":")
+    module = import_module(module_name)
+    return getattr(module, attr) if attr else module
+
+class LazyService:
+    """
+    Service chỉ được tạo ở lần dùng đầu tiên thay vì lúc import router:
+    - factory là callable hoặc chuỗi 'module:Class', khi dùng chuỗi thì module nặng
+      (vnstock, pandas, reportlab...) cũng chỉ được import khi có request đầu tiên
+    - truy cập thuộc tính được chuyển thẳng tới instance, nên code cũ giữ nguyên cách gọi
+    - get() dùng được làm dependency của FastAPI: Depends(treemap_instance.get)
+    """
+
+    def __init__(self, factory: Union[str, Callable[..., Any]], *args, **kwargs):
+        self._lazy_factory = factory
+        self._lazy_args = args
+        self._lazy_kwargs = kwargs
+        self._lazy_instance = None
+        self._lazy_lock = threading.Lock()
+
+    def get(self) -> Any:
+        if self._lazy_instance is None:
+            with self._lazy_lock:
+                if self._lazy_instance is None:
+                    factory = self._lazy_factory
+                    if isinstance(factory, str):
+                        factory = import_string(factory)
+                    self._lazy_instance = factory(*self._lazy_args, **self._lazy_kwargs)
+        return self._lazy_instance
+
+    @property
+    def is_ready(self) -> bool:
+        return self._lazy_instance is not None
+
+    def __getattr__(self, name):
+        # Chỉ được gọi với thuộc tính không có trên LazyService
+        if name.startswith("_lazy_"):
+            raise AttributeError(name)
+        return getattr(self.get(), name)
@@ -0,0 +1,159 @@
+"""
+Logging có cấu trúc cho các đường xử lý nóng (thay cho print):
+
+    from app.core.log import get_logger
+    log = get_logger(__name__)
+    log.debug("market_indices.cache_hit", index=index_code, key=cache_key)
+    log.info("market_indices.fetched", sample=0.1, index=index_code, seconds=round(fetch_time, 3))
+
+- bị chặn theo level trước khi tạo record: log.debug khi LOG_LEVEL=INFO gần như không tốn gì
+  (chỉ nên truyền giá trị sẵn có, không format chuỗi/DataFrame ở chỗ gọi)
+- record được đưa vào hàng đợi, một thread riêng ghi ra stdout; hàng đợi đầy thì bỏ record thay vì chặn request
+- sample=0.1: chỉ ghi 1/10 số lần cho sự kiện tần suất cao
+- LOG_FORMAT=json (mặc định) mỗi dòng một JSON, LOG_FORMAT=text cho lúc phát triển
+"""
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict
+import itertools
+import datetime
+import copy
+import logging
+import atexit
+import queue
+import json
+import sys
+import os
+
+from app.core.metrics import metrics
+
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10000))
+
+_RESERVED = {"ts", "level", "logger", "event"}
+_listener = None
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": datetime.datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        for key, value in getattr(record, "fields", {}).items():
+            payload[key if key not in _RESERVED else f"field_{key}"] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+class DroppingQueueHandler(QueueHandler):
+    """Không bao giờ chặn luồng gọi: hàng đợi đầy thì bỏ record và đếm lại"""
+
+    dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            DroppingQueueHandler.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Giữ nguyên record (fields, exc_info) để formatter ở thread ghi log xử lý; chỉ gộp args vào msg
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def setup_logging(level: str = None, fmt: str = None):
+    """
+    Cấu hình root logger một lần cho mỗi process (API worker, bot, report worker).
+    LOG_LEVEL/LOG_FORMAT được đọc lúc gọi, sau load_dotenv().
+    """
+    global _listener
+    if _listener is not None:
+        return
+    level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    fmt = (fmt or os.getenv("LOG_FORMAT", "json")).lower()
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    _listener = QueueListener(log_queue, output, respect_handler_level=False)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger()
+    root.handlers = [DroppingQueueHandler(log_queue)]
+    root.setLevel(level)
+
+class _Sampler:
+    def __init__(self):
+        self._counters: Dict[str, "itertools.count"] = {}
+
+    def allow(self, key: str, rate: float) -> bool:
+        if rate >= 1:
+            return True
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters.setdefault(key, itertools.count())
+        # next() trên itertools.count là atomic trong CPython, không cần lock
+        return next(counter) % max(1, round(1 / rate)) == 0
+
+_sampler = _Sampler()
+
+class StructLogger:
+    """Logger theo sự kiện: log.info("event.name", key=value, ...)"""
+
+    def __init__(self, name: str):
+        self._logger = logging.getLogger(name)
+
+    def _log(self, level: int, event: str, fields: Dict[str, Any], sample: float = None, exc_info: bool = False):
+        if not self._logger.isEnabledFor(level):
+            return
+        if sample is not None:
+            if not _sampler.allow(f"{self._logger.name}:{event}", sample):
+                return
+            fields["sample_rate"] = sample
+        self._logger.log(level, event, exc_info=exc_info, extra={"fields": fields}, stacklevel=3)
+
+    def is_enabled(self, level: int = logging.DEBUG) -> bool:
+        """Dùng trước khi phải tính toán tốn kém chỉ để log"""
+        return self._logger.isEnabledFor(level)
+
+    def debug(self, event: str, sample: float = None, **fields):
+        self._log(logging.DEBUG, event, fields, sample)
+
+    def info(self, event: str, sample: float = None, **fields):
+        self._log(logging.INFO, event, fields, sample)
+
+    def warning(self, event: str, sample: float = None, **fields):
+        self._log(logging.WARNING, event, fields, sample)
+
+    def error(self, event: str, sample: float = None, **fields):
+        self._log(logging.ERROR, event, fields, sample)
+
+    def exception(self, event: str, **fields):
+        """Ghi lỗi kèm traceback, gọi trong khối except"""
+        self._log(logging.ERROR, event, fields, exc_info=True)
+
+def get_logger(name: str) -> StructLogger:
+    return StructLogger(name)
+
+def _collect_log_metrics():
+    yield "log_records_dropped_total", "counter", {}, DroppingQueueHandler.dropped
+
+metrics.add_collector(_collect_log_metrics)
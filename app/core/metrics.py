@@ -0,0 +1,186 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import functools
+import inspect
+import threading
+import hmac
+import time
+import os
+
+# Bucket (giây) cho thời gian các bước: từ vài ms (đọc cache) tới vài phút (tạo báo cáo PDF)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+# Số bước tối đa đưa vào header Server-Timing của một request
+SERVER_TIMING_MAX_ENTRIES = 30
+# Header Server-Timing lộ thời gian từng bước nội bộ: mặc định tắt, chỉ bật cho mọi client khi
+# SERVER_TIMING_ENABLED=true, hoặc cho client gửi header X-Server-Timing-Token khớp SERVER_TIMING_TOKEN
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "false").lower() == "true"
+SERVER_TIMING_TOKEN = os.getenv("SERVER_TIMING_TOKEN", "")
+
+LabelSet = Tuple[Tuple[str, str], ...]
+# Mẫu do collector trả về: (tên metric, loại counter/gauge, labels, giá trị)
+Sample = Tuple[str, str, Dict[str, Any], float]
+
+def _labels(labels: Dict[str, Any]) -> LabelSet:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+def _format_labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in labels)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + "}"
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+class MetricsRegistry:
+    """
+    Bộ đếm/histogram trong process, xuất theo định dạng text của Prometheus (GET /metrics).
+    Các module khác (upstream, warmup) đăng ký collector để xuất số liệu sẵn có của chúng.
+    Mỗi process (API worker, report worker) có registry riêng.
+    """
+
+    def __init__(self):
+        self._histograms: Dict[str, Dict[LabelSet, _Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelSet, float]] = {}
+        self._help: Dict[str, str] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, help_text: str):
+        self._help[name] = help_text
+
+    def observe(self, name: str, value: float, buckets: Tuple[float, ...] = DURATION_BUCKETS, **labels):
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = _Histogram(buckets)
+            series[key].observe(value)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def add_collector(self, collector: Callable[[], Iterable[Sample]]):
+        self._collectors.append(collector)
+
+    def _header(self, lines: List[str], name: str, kind: str):
+        if name in self._help:
+            lines.append(f"# HELP {name} {self._help[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                self._header(lines, name, "histogram")
+                for key, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_format_labels(key + (('le', f'{bound:g}'),))} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(key + (('le', '+Inf'),))} {histogram.count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {histogram.sum:.6f}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+            for name, series in sorted(self._counters.items()):
+                self._header(lines, name, "counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_format_labels(key)} {value:g}")
+
+        declared = set()
+        for collector in self._collectors:
+            try:
+                samples = list(collector())
+            except Exception as e:
+                print(f"Error collecting metrics: {str(e)}")
+                continue
+            for name, kind, labels, value in samples:
+                if name not in declared:
+                    self._header(lines, name, kind)
+                    declared.add(name)
+                lines.append(f"{name}{_format_labels(_labels(labels))} {float(value):g}")
+        return "\n".join(lines) + "\n"
+
+# Dùng chung cho toàn bộ ứng dụng
+metrics = MetricsRegistry()
+metrics.describe("stage_duration_seconds", "Duration of instrumented stages (report pages, Gemini, vnstock, ...)")
+metrics.describe("http_request_duration_seconds", "HTTP request duration by route")
+
+# Các bước đã chạy trong request hiện tại: [(stage, seconds), ...]; asyncio.to_thread mang theo context
+_current_trace: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("current_trace", default=None)
+
+@contextmanager
+def span(stage: str):
+    """Đo thời gian một bước: ghi vào histogram stage_duration_seconds và vào trace của request (nếu có)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - started
+        metrics.observe("stage_duration_seconds", duration, stage=stage)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.append((stage, duration))
+
+def timed(stage: str):
+    """Decorator đo thời gian cả hàm (hàm thường hoặc async) bằng span(stage)"""
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(stage):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+@contextmanager
+def request_trace():
+    """Bắt đầu trace cho một request/job; trả về list các bước được ghi trong khối"""
+    trace: List[Tuple[str, float]] = []
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+def summarize_trace(trace: Iterable[Tuple[str, float]]) -> List[Tuple[str, float]]:
+    """Gộp các bước trùng tên (cộng thời gian), giữ thứ tự xuất hiện đầu tiên"""
+    totals: Dict[str, float] = {}
+    for stage, duration in trace:
+        totals[stage] = totals.get(stage, 0.0) + duration
+    return list(totals.items())
+
+def server_timing_allowed(headers) -> bool:
+    """Client được nhận header Server-Timing (headers: header của request)"""
+    if SERVER_TIMING_ENABLED:
+        return True
+    token = headers.get("x-server-timing-token")
+    return bool(SERVER_TIMING_TOKEN and token) and hmac.compare_digest(token, SERVER_TIMING_TOKEN)
+
+def server_timing(trace: Iterable[Tuple[str, float]], total: Optional[float] = None) -> str:
+    """Giá trị header Server-Timing: `total;dur=812.4, report.gemini;dur=640.2, ...` (ms)"""
+    entries = summarize_trace(trace)[:SERVER_TIMING_MAX_ENTRIES]
+    if total is not None:
+        entries.insert(0, ("total", total))
+    return ", ".join(f"{stage};dur={duration * 1000:.1f}" for stage, duration in entries)
@@ -0,0 +1,97 @@
+import tempfile
+import uuid
+import os
+
+from app.core.shared_cache import REDIS_URL
+
+# Thư mục chứa file khoá (các process trên cùng một máy)
+LOCK_DIR = os.getenv("LOCK_DIR", tempfile.gettempdir())
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Kiểm tra token và gia hạn/xoá trong một lệnh Redis (atomic): không đụng tới khoá mà process khác
+# vừa chiếm được sau khi khoá của mình hết hạn
+RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+class ProcessLock:
+    """
+    Khoá không chặn để chỉ một process (trong N API worker) làm một việc: làm nóng cache, đăng ký webhook...
+    - có REDIS_URL: khoá trên Redis (SET NX, hết hạn sau ttl giây nếu process giữ khoá chết) - dùng được giữa nhiều máy
+    - không có: khoá file trong LOCK_DIR, hệ điều hành tự nhả khi process kết thúc
+    acquire() gọi lại được nhiều lần: process đang giữ khoá thì gia hạn, process khác thì thử chiếm khoá.
+    """
+
+    def __init__(self, name: str, ttl: float = 600):
+        self.name = name
+        self.ttl = ttl
+        self.held = False
+        self._token = uuid.uuid4().hex
+        self._file = None
+        self._redis = None
+        if REDIS_URL:
+            try:
+                import redis  # Chỉ cần khi cấu hình REDIS_URL
+
+                self._redis = redis.Redis.from_url(REDIS_URL)
+                self._renew = self._redis.register_script(RENEW_SCRIPT)
+                self._release = self._redis.register_script(RELEASE_SCRIPT)
+            except ImportError:
+                pass
+
+    def acquire(self) -> bool:
+        try:
+            self.held = self._acquire_redis() if self._redis is not None else self._acquire_file()
+        except Exception as e:
+            print(f"Error acquiring lock {self.name}: {str(e)}")
+            self.held = False
+        return self.held
+
+    def _acquire_redis(self) -> bool:
+        key = f"lock:{self.name}"
+        ttl_ms = max(1, int(self.ttl * 1000))
+        if self._renew(keys=[key], args=[self._token, ttl_ms]):
+            return True
+        return bool(self._redis.set(key, self._token, nx=True, px=ttl_ms))
+
+    def _acquire_file(self) -> bool:
+        if self._file is not None:
+            return True
+        handle = open(os.path.join(LOCK_DIR, f"{self.name}.lock"), "a+")
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            handle.close()
+            return False
+        self._file = handle
+        return True
+
+    def release(self):
+        if self._redis is not None and self.held:
+            key = f"lock:{self.name}"
+            try:
+                self._release(keys=[key], args=[self._token])
+            except Exception as e:
+                print(f"Error releasing lock {self.name}: {str(e)}")
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.held = False
@@ -0,0 +1,15 @@
+import numpy as np
+import pandas as pd
+
+# Dữ liệu giá từ VCI/TCBS là giờ Việt Nam (không kèm timezone)
+MARKET_TIMEZONE = 'Asia/Ho_Chi_Minh'
+
+_EPOCH = pd.Timestamp(0)
+
+def to_epoch_seconds(times) -> np.ndarray:
+    """Chuyển cột thời gian sang epoch seconds (int64) để trả về dạng cột, không cần strftime từng dòng"""
+    index = pd.DatetimeIndex(pd.to_datetime(times))
+    if index.tz is None:
+        index = index.tz_localize(MARKET_TIMEZONE)
+    index = index.tz_convert('UTC').tz_localize(None)
+    return np.asarray((index - _EPOCH) // pd.Timedelta(seconds=1), dtype=np.int64)
@@ -0,0 +1,12 @@
+"""
+Service dùng chung cho API v1 và v2: mỗi process chỉ có một instance của mỗi service,
+nên cache (chỉ số, treemap, tin tức) và client vnstock chỉ được tạo và làm nóng một lần.
+Router của từng phiên bản chỉ chuyển đổi dữ liệu sang định dạng response của phiên bản đó.
+"""
+from app.core.lazy import LazyService
+
+market_indices_service = LazyService("app.api.v2.MarketIndices.services:Market_indices")
+treemap_service = LazyService("app.api.v2.treemap.services:Treemap")
+treemap_color_service = LazyService("app.api.v2.treemap_color.services:TreemapColorService")
+adjust_day_service = LazyService("app.api.v2.marketindices_adjustday.services:MarketIndicesAdjustDayService")
+news_service = LazyService("app.api.v2.news.services:news")
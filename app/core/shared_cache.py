@@ -0,0 +1,114 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+import threading
+import pickle
+import time
+import os
+
+from app.core.keyed_locks import IdleSweeper
+
+# Có REDIS_URL thì cache được dùng chung giữa các process (N API worker, bot, report worker)
+REDIS_URL = os.getenv("REDIS_URL")
+# Giới hạn số key của MemoryCache và chu kỳ dọn các key đã hết hạn mà không ai đọc lại
+MEMORY_CACHE_MAX_ENTRIES = int(os.getenv("MEMORY_CACHE_MAX_ENTRIES", 1024))
+MEMORY_CACHE_SWEEP_INTERVAL = float(os.getenv("MEMORY_CACHE_SWEEP_INTERVAL", 60))
+
+class SharedCache(ABC):
+    """Cache key -> value có thời hạn; các role khác nhau dùng chung qua cùng một interface"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Giá trị còn hạn, None nếu không có hoặc đã hết hạn"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float):
+        """Ghi giá trị, hết hạn sau ttl giây"""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Xoá key (không lỗi nếu không tồn tại)"""
+
+class MemoryCache(SharedCache):
+    """
+    Cache trong bộ nhớ của process hiện tại (mặc định khi chạy một process).
+    Key hết hạn được dọn định kỳ khi ghi; vượt max_entries thì bỏ key ít được dùng nhất.
+    """
+
+    def __init__(self, max_entries: int = MEMORY_CACHE_MAX_ENTRIES,
+                 sweep_interval: float = MEMORY_CACHE_SWEEP_INTERVAL):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._sweeper = IdleSweeper(sweep_interval)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def _sweep(self, now: float):
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+
+    def set(self, key: str, value: Any, ttl: float):
+        now = time.time()
+        with self._lock:
+            self._entries[key] = (now + ttl, value)
+            self._entries.move_to_end(key)
+            if self._sweeper.due(now):
+                self._sweep(now)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+class RedisCache(SharedCache):
+    """Cache trên Redis (giá trị được pickle), chỉ đọc dữ liệu do chính ứng dụng ghi vào namespace"""
+
+    def __init__(self, url: str, namespace: str):
+        import redis  # Chỉ cần khi cấu hình REDIS_URL
+
+        self._client = redis.Redis.from_url(url)
+        self.namespace = namespace
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            payload = self._client.get(self._key(key))
+        except Exception as e:
+            print(f"Error reading Redis cache {key}: {str(e)}")
+            return None
+        return pickle.loads(payload) if payload is not None else None
+
+    def set(self, key: str, value: Any, ttl: float):
+        try:
+            self._client.set(self._key(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                             px=max(1, int(ttl * 1000)))
+        except Exception as e:
+            print(f"Error writing Redis cache {key}: {str(e)}")
+
+    def delete(self, key: str):
+        try:
+            self._client.delete(self._key(key))
+        except Exception as e:
+            print(f"Error deleting Redis cache {key}: {str(e)}")
+
+def get_shared_cache(namespace: str) -> SharedCache:
+    """Redis nếu có REDIS_URL, ngược lại cache trong process"""
+    if REDIS_URL:
+        try:
+            return RedisCache(REDIS_URL, namespace)
+        except ImportError:
+            print("⚠️ REDIS_URL được cấu hình nhưng chưa cài redis, dùng cache trong bộ nhớ")
+    return MemoryCache()
@@ -0,0 +1,155 @@
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, Optional, Tuple, Union
+from bisect import bisect_left, bisect_right
+import json
+import os
+
+from app.core.lazy import LazyService
+from app.core.log import get_logger
+
+# Ngày nghỉ lễ của sàn theo từng năm: {"2025": ["2025-01-01", ...], ...}
+HOLIDAY_FILE = os.getenv("HOLIDAY_FILE", os.path.join(os.path.dirname(__file__), "holiday.json"))
+
+# Phiên giao dịch HOSE/HNX (giờ Việt Nam); dữ liệu trong ngày lấy từ 8:59 để có giá mở cửa
+SESSION_OPEN = time(9, 0)
+SESSION_CLOSE = time(15, 0)
+SESSION_DATA_START = time(8, 59)
+
+# Trạng thái phiên tại một thời điểm
+PRE_OPEN = "pre_open"
+OPEN = "open"
+CLOSED = "closed"          # ngày giao dịch, sau giờ đóng cửa
+NON_TRADING = "non_trading"  # cuối tuần hoặc ngày lễ
+
+DateLike = Union[date, datetime]
+
+log = get_logger(__name__)
+
+def _as_date(value: DateLike) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+class TradingCalendar:
+    """
+    Lịch giao dịch dùng chung: ngày lễ tra bằng set, các phiên của những năm có trong holiday.json
+    được tính sẵn thành mảng ordinal đã sắp xếp, nên phiên trước/sau, dịch n phiên, đếm số phiên
+    đều là bisect O(log n). Ngày ngoài các năm đã nạp thì tính theo thứ trong tuần (không có ngày lễ).
+    """
+
+    def __init__(self, holidays: Iterable[date] = (), years: Iterable[int] = ()):
+        self.holidays = frozenset(holidays)
+        self.years = sorted(set(years))
+        self._sessions: List[int] = []
+        if self.years:
+            first = date(self.years[0], 1, 1).toordinal()
+            last = date(self.years[-1], 12, 31).toordinal()
+            self._sessions = [
+                ordinal for ordinal in range(first, last + 1)
+                if self._is_session(date.fromordinal(ordinal))
+            ]
+
+    @classmethod
+    def from_file(cls, holiday_file: str = HOLIDAY_FILE) -> "TradingCalendar":
+        try:
+            with open(holiday_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            log.error("trading_calendar.load_failed", file=holiday_file, error=str(e))
+            return cls()
+        holidays = [date.fromisoformat(day) for days in data.values() for day in days]
+        log.info("trading_calendar.loaded", years=", ".join(data.keys()))
+        return cls(holidays, (int(year) for year in data))
+
+    def _is_session(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in self.holidays
+
+    def _in_range(self, ordinal: int) -> bool:
+        return bool(self._sessions) and self._sessions[0] <= ordinal <= self._sessions[-1]
+
+    def is_holiday(self, day: DateLike) -> bool:
+        return _as_date(day) in self.holidays
+
+    def is_trading_day(self, day: DateLike) -> bool:
+        return self._is_session(_as_date(day))
+
+    def previous_session(self, day: DateLike, inclusive: bool = False) -> date:
+        """Phiên gần nhất trước `day` (inclusive: tính cả chính `day` nếu là ngày giao dịch)"""
+        ordinal = _as_date(day).toordinal()
+        if self._in_range(ordinal):
+            idx = (bisect_right if inclusive else bisect_left)(self._sessions, ordinal) - 1
+            if idx >= 0:
+                return date.fromordinal(self._sessions[idx])
+        current = date.fromordinal(ordinal if inclusive else ordinal - 1)
+        while not self._is_session(current):
+            current -= timedelta(days=1)
+        return current
+
+    def next_session(self, day: DateLike, inclusive: bool = False) -> date:
+        """Phiên gần nhất sau `day` (inclusive: tính cả chính `day` nếu là ngày giao dịch)"""
+        ordinal = _as_date(day).toordinal()
+        if self._in_range(ordinal):
+            idx = (bisect_left if inclusive else bisect_right)(self._sessions, ordinal)
+            if idx < len(self._sessions):
+                return date.fromordinal(self._sessions[idx])
+        current = date.fromordinal(ordinal if inclusive else ordinal + 1)
+        while not self._is_session(current):
+            current += timedelta(days=1)
+        return current
+
+    def shift_sessions(self, day: DateLike, sessions: int) -> date:
+        """Phiên cách phiên gần nhất (tính cả `day`) `sessions` phiên; số âm là lùi về trước"""
+        anchor = self.previous_session(day, inclusive=True)
+        ordinal = anchor.toordinal()
+        if self._in_range(ordinal):
+            idx = bisect_left(self._sessions, ordinal) + sessions
+            if 0 <= idx < len(self._sessions):
+                return date.fromordinal(self._sessions[idx])
+        step = self.next_session if sessions > 0 else self.previous_session
+        for _ in range(abs(sessions)):
+            anchor = step(anchor)
+        return anchor
+
+    def count_sessions(self, start: DateLike, end: DateLike) -> int:
+        """Số phiên trong khoảng [start, end]"""
+        start_ordinal, end_ordinal = _as_date(start).toordinal(), _as_date(end).toordinal()
+        if start_ordinal > end_ordinal:
+            return 0
+        if self._in_range(start_ordinal) and self._in_range(end_ordinal):
+            return bisect_right(self._sessions, end_ordinal) - bisect_left(self._sessions, start_ordinal)
+        return sum(
+            1 for ordinal in range(start_ordinal, end_ordinal + 1)
+            if self._is_session(date.fromordinal(ordinal))
+        )
+
+    def session_window(self, day: DateLike) -> Tuple[datetime, datetime]:
+        """Giờ mở cửa và đóng cửa của phiên ngày `day`"""
+        day = _as_date(day)
+        return datetime.combine(day, SESSION_OPEN), datetime.combine(day, SESSION_CLOSE)
+
+    def session_state(self, now: Optional[datetime] = None) -> str:
+        now = now or datetime.now()
+        if not self.is_trading_day(now):
+            return NON_TRADING
+        market_open, market_close = self.session_window(now)
+        if now < market_open:
+            return PRE_OPEN
+        if now <= market_close:
+            return OPEN
+        return CLOSED
+
+    def display_window(self, now: Optional[datetime] = None) -> Tuple[datetime, datetime, str]:
+        """
+        Khoảng dữ liệu trong ngày nên hiển thị tại thời điểm `now`:
+        - trong phiên: từ 8:59 đến hiện tại
+        - sau 15:00 của ngày giao dịch: cả phiên hôm nay
+        - trước giờ mở cửa, cuối tuần, ngày lễ: cả phiên giao dịch gần nhất trước đó
+        """
+        now = now or datetime.now()
+        state = self.session_state(now)
+        if state == OPEN:
+            return datetime.combine(now.date(), SESSION_DATA_START), now, state
+        session = now.date() if state == CLOSED else self.previous_session(now)
+        market_open, market_close = self.session_window(session)
+        return market_open, market_close, state
+
+# Dùng chung cho toàn bộ ứng dụng; holiday.json chỉ được đọc ở lần dùng đầu tiên, không phải lúc import
+trading_calendar = LazyService(TradingCalendar.from_file)
@@ -0,0 +1,336 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Optional
+import copy
+import threading
+import time
+import os
+
+from app.core.metrics import metrics
+from app.core.log import get_logger
+
+# Giới hạn mặc định cho mỗi nguồn dữ liệu (VCI, TCBS...)
+UPSTREAM_RATE = float(os.getenv("UPSTREAM_RATE", 10))             # request/giây trung bình
+UPSTREAM_BURST = int(os.getenv("UPSTREAM_BURST", 20))             # số request được phép dồn một lúc
+UPSTREAM_MAX_CONCURRENCY = int(os.getenv("UPSTREAM_MAX_CONCURRENCY", 8))
+# Số lượt luôn để dành cho request tương tác (API, bot) khi job hàng loạt chạy
+UPSTREAM_INTERACTIVE_RESERVE = int(os.getenv("UPSTREAM_INTERACTIVE_RESERVE", 2))
+UPSTREAM_WAIT_TIMEOUT = float(os.getenv("UPSTREAM_WAIT_TIMEOUT", 30))
+# Circuit breaker: lỗi liên tiếp để mở mạch, và thời gian mở trước khi thử lại
+UPSTREAM_FAILURE_THRESHOLD = int(os.getenv("UPSTREAM_FAILURE_THRESHOLD", 5))
+UPSTREAM_RESET_TIMEOUT = float(os.getenv("UPSTREAM_RESET_TIMEOUT", 30))
+# Số kết quả gần nhất được giữ lại để trả về khi mạch đang mở
+UPSTREAM_LAST_GOOD_SIZE = int(os.getenv("UPSTREAM_LAST_GOOD_SIZE", 512))
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+THROTTLE_STATUS = 429
+# Lỗi mạng/timeout của requests và urllib3 (không kế thừa ConnectionError/TimeoutError của Python),
+# so theo tên lớp để không phải import các thư viện này
+NETWORK_ERROR_TYPES = frozenset({
+    "requests.exceptions.ConnectionError", "requests.exceptions.Timeout",
+    "requests.exceptions.ChunkedEncodingError",
+    "urllib3.exceptions.ProtocolError", "urllib3.exceptions.TimeoutError",
+    "urllib3.exceptions.NewConnectionError", "urllib3.exceptions.MaxRetryError",
+})
+
+log = get_logger(__name__)
+
+class UpstreamUnavailable(Exception):
+    """Nguồn dữ liệu đang bị ngắt (circuit open) hoặc quá tải, và không có dữ liệu cũ để trả về"""
+
+def _status_code(error: Exception) -> Optional[int]:
+    """Mã HTTP của lỗi: requests.HTTPError mang theo response, urllib.error.HTTPError có code"""
+    for status in (getattr(getattr(error, "response", None), "status_code", None),
+                   getattr(error, "status_code", None), getattr(error, "code", None)):
+        if isinstance(status, int):
+            return status
+    return None
+
+def _is_throttle_error(error: Exception) -> bool:
+    return _status_code(error) == THROTTLE_STATUS
+
+def _is_network_error(error: Exception) -> bool:
+    return any(f"{cls.__module__}.{cls.__name__}" in NETWORK_ERROR_TYPES for cls in type(error).__mro__)
+
+def is_upstream_error(error: Exception) -> bool:
+    """
+    Lỗi do nguồn dữ liệu (mạng, timeout, 5xx, throttle) - được tính cho circuit breaker.
+    Lỗi dữ liệu (mã không tồn tại, thiếu cột, ValueError/KeyError...) là lỗi của request đó, không phải của nguồn.
+    Phân loại theo kiểu exception và mã HTTP, không theo nội dung message (message có thể chứa "500" là giá).
+    """
+    status = _status_code(error)
+    if status is not None:
+        return status == THROTTLE_STATUS or status >= 500
+    return isinstance(error, (ConnectionError, TimeoutError)) or _is_network_error(error)
+
+class TokenBucket:
+    """Token bucket: trung bình rate request/giây, cho phép dồn tối đa burst request"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, timeout: float) -> float:
+        """Lấy một token, chờ nếu cần; trả về số giây đã chờ hoặc raise UpstreamUnavailable khi quá timeout"""
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return now - started
+                wait = (1 - self._tokens) / self.rate
+            if now + wait - started > timeout:
+                raise UpstreamUnavailable("rate limit wait exceeded")
+            time.sleep(wait)
+
+class AdaptiveLimiter:
+    """
+    Giới hạn số request đồng thời theo kiểu AIMD:
+    - thành công: tăng dần giới hạn (cộng 1 sau mỗi `limit` request thành công) tới max_limit
+    - bị upstream throttle: giảm một nửa
+    Request BULK không được dùng UPSTREAM_INTERACTIVE_RESERVE lượt cuối, để API/bot không phải xếp hàng sau job hàng loạt.
+    """
+
+    def __init__(self, max_limit: int, reserve: int):
+        self.max_limit = max_limit
+        self.reserve = min(reserve, max_limit - 1)
+        self.limit = max_limit
+        self.in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def _capacity(self, priority: str) -> int:
+        if priority == BULK:
+            return max(1, self.limit - self.reserve)
+        return self.limit
+
+    def acquire(self, priority: str, timeout: float) -> float:
+        started = time.monotonic()
+        with self._cond:
+            while self.in_flight >= self._capacity(priority):
+                remaining = timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    raise UpstreamUnavailable("concurrency wait exceeded")
+                self._cond.wait(remaining)
+            self.in_flight += 1
+        return time.monotonic() - started
+
+    def release(self, throttled: bool = False, succeeded: bool = False):
+        with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+            elif succeeded and self.limit < self.max_limit:
+                self._successes += 1
+                if self._successes >= self.limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+class CircuitBreaker:
+    """Mở mạch sau failure_threshold lỗi liên tiếp; sau reset_timeout cho một request thử (half-open)"""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def release_probe(self):
+        """Lượt thử half-open không được dùng (hết thời gian chờ), cho request sau thử lại"""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """Ghi nhận lỗi, trả về True nếu mạch vừa chuyển sang mở"""
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                opened = self.state != OPEN
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+                return opened
+            return False
+
+class UpstreamSource:
+    """Rate limit + giới hạn đồng thời + circuit breaker + dữ liệu tốt gần nhất cho một nguồn"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.bucket = TokenBucket(UPSTREAM_RATE, UPSTREAM_BURST)
+        self.limiter = AdaptiveLimiter(UPSTREAM_MAX_CONCURRENCY, UPSTREAM_INTERACTIVE_RESERVE)
+        self.breaker = CircuitBreaker(UPSTREAM_FAILURE_THRESHOLD, UPSTREAM_RESET_TIMEOUT)
+        self.last_good: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.metrics = {
+            "requests": 0, "success": 0, "failures": 0, "client_errors": 0, "throttled": 0,
+            "rate_limited_waits": 0, "wait_seconds": 0.0,
+            "short_circuited": 0, "stale_served": 0, "rejected": 0,
+        }
+        self._lock = threading.Lock()
+
+    def _count(self, name: str, value: float = 1):
+        with self._lock:
+            self.metrics[name] += value
+
+    def _remember(self, key: Hashable, value: Any):
+        # Lưu bản sao: caller thường sửa DataFrame trả về, không được làm hỏng dữ liệu dự phòng
+        value = copy.copy(value)
+        with self._lock:
+            self.last_good[key] = value
+            self.last_good.move_to_end(key)
+            while len(self.last_good) > UPSTREAM_LAST_GOOD_SIZE:
+                self.last_good.popitem(last=False)
+
+    def _fallback(self, key: Optional[Hashable], error: Exception):
+        with self._lock:
+            has_stale = key is not None and key in self.last_good
+            stale = self.last_good.get(key) if has_stale else None
+        if has_stale:
+            self._count("stale_served")
+            # Mỗi lần trả về một bản sao để các caller không dùng chung một object
+            return copy.copy(stale)
+        raise error
+
+    @contextmanager
+    def slot(self, priority: str = INTERACTIVE, timeout: float = UPSTREAM_WAIT_TIMEOUT):
+        """
+        Giữ một lượt gọi tới nguồn (token + concurrency).
+        Chỉ lỗi của nguồn (is_upstream_error) được tính cho circuit breaker; lỗi dữ liệu được raise lại nguyên vẹn.
+        Các lệnh chờ ở đây là chờ đồng bộ: gọi từ thread (asyncio.to_thread), không gọi thẳng trên event loop.
+        """
+        if not self.breaker.allow():
+            self._count("short_circuited")
+            raise UpstreamUnavailable(f"{self.name} circuit open")
+        self._count("requests")
+        try:
+            waited = self.bucket.acquire(timeout)
+            waited += self.limiter.acquire(priority, timeout)
+        except UpstreamUnavailable:
+            self._count("rejected")
+            self.breaker.release_probe()
+            raise
+        if waited > 0.001:
+            self._count("rate_limited_waits")
+            self._count("wait_seconds", waited)
+
+        throttled = succeeded = False
+        try:
+            yield
+            succeeded = True
+        except Exception as e:
+            if not is_upstream_error(e):
+                # Nguồn vẫn trả lời được: không tính lỗi, trả lượt thử half-open cho request sau
+                self._count("client_errors")
+                self.breaker.release_probe()
+                raise
+            throttled = _is_throttle_error(e)
+            self._count("failures")
+            if throttled:
+                self._count("throttled")
+            if self.breaker.record_failure():
+                log.warning("upstream.circuit_opened", source=self.name, failures=self.breaker.failures, error=str(e))
+            raise
+        finally:
+            self.limiter.release(throttled=throttled, succeeded=succeeded)
+        self._count("success")
+        self.breaker.record_success()
+
+    def call(self, fn: Callable[[], Any], key: Optional[Hashable] = None, priority: str = INTERACTIVE) -> Any:
+        """
+        Gọi fn() qua governor. Với key, kết quả thành công được nhớ lại và trả về thay cho lỗi
+        khi nguồn bị ngắt/quá tải/lỗi, thay vì để caller rơi về [] hoặc "N/A".
+        """
+        try:
+            with self.slot(priority):
+                value = fn()
+        except Exception as e:
+            if not isinstance(e, UpstreamUnavailable) and not is_upstream_error(e):
+                raise
+            return self._fallback(key, e)
+        if key is not None:
+            self._remember(key, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = dict(self.metrics)
+            metrics["cached_results"] = len(self.last_good)
+        metrics["wait_seconds"] = round(metrics["wait_seconds"], 3)
+        metrics.update(
+            circuit=self.breaker.state,
+            concurrency_limit=self.limiter.limit,
+            in_flight=self.limiter.in_flight,
+        )
+        return metrics
+
+class UpstreamGovernor:
+    """Danh sách UpstreamSource theo tên nguồn, tạo khi dùng lần đầu"""
+
+    def __init__(self):
+        self._sources: Dict[str, UpstreamSource] = {}
+        self._lock = threading.Lock()
+
+    def source(self, name: str) -> UpstreamSource:
+        name = name.upper()
+        with self._lock:
+            if name not in self._sources:
+                self._sources[name] = UpstreamSource(name)
+            return self._sources[name]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            sources = list(self._sources.values())
+        return {source.name: source.stats() for source in sources}
+
+# Dùng chung cho toàn bộ ứng dụng
+upstream_governor = UpstreamGovernor()
+
+def _collect_upstream_metrics():
+    for source, stats in upstream_governor.stats().items():
+        for name in ("requests", "success", "failures", "client_errors", "throttled", "rate_limited_waits",
+                     "short_circuited", "stale_served", "rejected"):
+            yield f"upstream_{name}_total", "counter", {"source": source}, stats[name]
+        yield "upstream_wait_seconds_total", "counter", {"source": source}, stats["wait_seconds"]
+        yield "upstream_concurrency_limit", "gauge", {"source": source}, stats["concurrency_limit"]
+        yield "upstream_in_flight", "gauge", {"source": source}, stats["in_flight"]
+        yield "upstream_circuit_open", "gauge", {"source": source}, stats["circuit"] != CLOSED
+
+metrics.add_collector(_collect_upstream_metrics)
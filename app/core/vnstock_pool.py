@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+import threading
+import os
+
+from app.core.upstream import upstream_governor, INTERACTIVE, BULK
+from app.core.metrics import span
+
+# Số client (theo nguồn + mã) được giữ lại để dùng lại
+VNSTOCK_POOL_SIZE = int(os.getenv("VNSTOCK_POOL_SIZE", 512))
+
+# Mã dùng cho các lệnh không phụ thuộc mã cổ phiếu (danh sách mã theo nhóm, bảng giá...)
+DEFAULT_SYMBOL = "VCI"
+
+class VnstockClientPool:
+    """
+    Pool client vnstock dùng chung cho toàn bộ ứng dụng:
+    - client theo (nguồn, mã) được tạo một lần rồi dùng lại (LRU), không tạo Vnstock().stock() mỗi lần gọi
+    - mọi request đi qua upstream_governor của nguồn: rate limit, giới hạn đồng thời, circuit breaker
+    - các hàm gọi nhận mã cổ phiếu làm tham số: history(symbol), company(symbol), ratio(symbol)...
+    Job hàng loạt (dựng lại treemap, P/E ngành) truyền priority=BULK để không chiếm hết lượt của API/bot.
+    """
+
+    def __init__(self, max_clients: int = VNSTOCK_POOL_SIZE):
+        self.max_clients = max_clients
+        self._clients: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._vnstock = None
+
+    def _new_client(self, symbol: str, source: str):
+        if self._vnstock is None:
+            from vnstock import Vnstock  # Import khi cần (vnstock import chậm)
+            self._vnstock = Vnstock()
+        return self._vnstock.stock(symbol=symbol, source=source)
+
+    def stock(self, symbol: str = DEFAULT_SYMBOL, source: str = "VCI"):
+        """
+        Client (quote, company, finance, listing, trading) của một mã, dùng lại nếu đã có.
+        Lệnh gọi trên client không tự đi qua governor: dùng call()/history()/ratio()... thay vì gọi trực tiếp.
+        """
+        key = (source.upper(), symbol.upper())
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+        # Tạo client ngoài lock để các mã khác không phải chờ
+        client = self._new_client(key[1], key[0])
+        with self._lock:
+            client = self._clients.setdefault(key, client)
+            self._clients.move_to_end(key)
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        return client
+
+    def limit(self, source: str, priority: str = INTERACTIVE):
+        """Giữ một lượt request tới nguồn source (không gọi lồng nhau trong cùng một lượt)"""
+        return upstream_governor.source(source).slot(priority)
+
+    def call(self, symbol: str, source: str, fn: Callable[[Any], Any],
+             key: Optional[Hashable] = None, priority: str = INTERACTIVE) -> Any:
+        """Chạy fn(client) qua governor của nguồn; có key thì lỗi/ngắt mạch trả về kết quả tốt gần nhất"""
+        client = self.stock(symbol, source)
+        with span(f"vnstock.{source.upper()}"):
+            return upstream_governor.source(source).call(lambda: fn(client), key=key, priority=priority)
+
+    @staticmethod
+    def _key(method: str, symbol: str, kwargs: dict) -> Hashable:
+        return (method, symbol.upper(), tuple(sorted(kwargs.items())))
+
+    def history(self, symbol: str, source: str = "VCI", priority: str = INTERACTIVE, **kwargs):
+        """Giá lịch sử (quote.history) của một mã hoặc chỉ số"""
+        return self.call(symbol, source, lambda client: client.quote.history(**kwargs),
+                         key=self._key("history", symbol, kwargs), priority=priority)
+
+    def ratio(self, symbol: str, source: str = "VCI", priority: str = INTERACTIVE, **kwargs):
+        """Bảng chỉ số tài chính (finance.ratio)"""
+        return self.call(symbol, source, lambda client: client.finance.ratio(**kwargs),
+                         key=self._key("ratio", symbol, kwargs), priority=priority)
+
+    def company(self, symbol: str, source: str = "TCBS"):
+        """Đối tượng company của một mã (overview, shareholders, news...); bọc lệnh gọi trong limit(source)"""
+        return self.stock(symbol, source).company
+
+    def symbols_by_industries(self, source: str = "TCBS", priority: str = INTERACTIVE):
+        """Bảng mã - ngành ICB của toàn thị trường"""
+        return self.call(DEFAULT_SYMBOL, source, lambda client: client.listing.symbols_by_industries(),
+                         key=("symbols_by_industries", source.upper()), priority=priority)
+
+    def all_symbols(self, source: str = "VCI", priority: str = INTERACTIVE):
+        """Danh sách toàn bộ mã đang niêm yết"""
+        return self.call(DEFAULT_SYMBOL, source, lambda client: client.listing.all_symbols(),
+                         key=("all_symbols", source.upper()), priority=priority)
+
+    def symbols_by_group(self, group: str, source: str = "VCI", priority: str = INTERACTIVE):
+        """Danh sách mã của một nhóm/chỉ số (HOSE, VN30...)"""
+        return self.call(DEFAULT_SYMBOL, source, lambda client: client.listing.symbols_by_group(group),
+                         key=("symbols_by_group", group.upper()), priority=priority)
+
+# Dùng chung cho toàn bộ ứng dụng
+vnstock_pool = VnstockClientPool()
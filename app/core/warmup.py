@@ -0,0 +1,184 @@
+from datetime import datetime, time, timedelta
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import inspect
+import time as timer
+import os
+
+from app.core.trading_calendar import TradingCalendar, trading_calendar
+from app.core.cache_policy import MarketCachePolicy, cache_policy, FROZEN
+from app.core.metrics import metrics
+from app.core.process_lock import ProcessLock
+from app.core.log import get_logger
+
+# Bật/tắt bộ làm nóng cache. Với nhiều API worker, chỉ process giữ khoá "cache_warmup" chạy lịch
+# (khoá file trên cùng máy, khoá Redis khi có REDIS_URL), các process còn lại chỉ chờ tiếp quản.
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "True").lower() == "true"
+# Các mốc làm nóng trong ngày giao dịch (HH:MM, cách nhau bởi dấu phẩy)
+WARMUP_TIMES = os.getenv("WARMUP_TIMES", "08:59,09:00,13:00")
+# Trong phiên, làm mới dữ liệu live trước khi hết TTL bấy nhiêu giây
+WARMUP_LEAD_SECONDS = float(os.getenv("WARMUP_LEAD_SECONDS", 10))
+WARMUP_ON_START = os.getenv("WARMUP_ON_START", "True").lower() == "true"
+# Khi không có lịch, vẫn thức dậy định kỳ để kiểm tra lại (đổi giờ hệ thống, ngày lễ...)
+MAX_SLEEP_SECONDS = 300
+
+log = get_logger(__name__)
+
+def parse_times(value: str) -> List[time]:
+    times = []
+    for item in value.split(","):
+        item = item.strip()
+        if item:
+            hour, minute = item.split(":")
+            times.append(time(int(hour), int(minute)))
+    return sorted(times)
+
+class WarmupJob:
+    def __init__(self, name: str, fn: Callable[[], Any], live: bool = False):
+        self.name = name
+        self.fn = fn
+        # live: dữ liệu thay đổi trong phiên, được làm mới trước khi hết TTL
+        self.live = live
+        self.runs = 0
+        self.failures = 0
+        self.last_run: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    async def run(self):
+        started = timer.time()
+        try:
+            if inspect.iscoroutinefunction(self.fn):
+                await self.fn()
+            else:
+                # Service gọi vnstock đồng bộ, chạy ngoài event loop
+                await asyncio.to_thread(self.fn)
+            self.last_error = None
+        except Exception as e:
+            self.failures += 1
+            self.last_error = str(e)
+            log.warning("warmup.job_failed", job=self.name, error=str(e))
+        finally:
+            self.runs += 1
+            self.last_run = started
+            self.last_duration = timer.time() - started
+            metrics.observe("warmup_job_duration_seconds", self.last_duration, job=self.name)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "live": self.live,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_run": datetime.fromtimestamp(self.last_run).isoformat() if self.last_run else None,
+            "last_duration": round(self.last_duration, 3) if self.last_duration is not None else None,
+            "last_error": self.last_error,
+        }
+
+class CacheWarmer:
+    """
+    Làm nóng cache theo lịch giao dịch:
+    - tại các mốc WARMUP_TIMES của ngày giao dịch (mặc định 8:59, 9:00, 13:00): chạy mọi job
+    - trong phiên (cache_policy LIVE/SETTLING): chạy lại các job live mỗi (TTL - WARMUP_LEAD_SECONDS) giây,
+      để request của người dùng luôn gặp cache còn hạn
+    Thời gian chạy từng job được ghi lại, xem stats().
+    """
+
+    def __init__(self, times: str = WARMUP_TIMES, lead_seconds: float = WARMUP_LEAD_SECONDS,
+                 calendar: TradingCalendar = trading_calendar, policy: MarketCachePolicy = cache_policy):
+        self.times = parse_times(times)
+        self.calendar = calendar
+        self.policy = policy
+        self.refresh_interval = max(5.0, policy.live_ttl - lead_seconds)
+        self.jobs: List[WarmupJob] = []
+        self.last_cycle: Optional[Dict[str, Any]] = None
+        self._task = None
+        # Vòng lặp thức dậy ít nhất mỗi MAX_SLEEP_SECONDS và gia hạn khoá, khoá hết hạn sau 2 chu kỳ
+        self.lock = ProcessLock("cache_warmup", ttl=2 * MAX_SLEEP_SECONDS)
+
+    def add_job(self, name: str, fn: Callable[[], Any], live: bool = False):
+        self.jobs.append(WarmupJob(name, fn, live))
+
+    def _next_slot(self, now: datetime) -> Optional[datetime]:
+        if not self.times:
+            return None
+        day = self.calendar.next_session(now, inclusive=True)
+        for _ in range(2):
+            for slot in self.times:
+                run_at = datetime.combine(day, slot)
+                if run_at > now:
+                    return run_at
+            day = self.calendar.next_session(day)
+        return None
+
+    def next_run(self, now: Optional[datetime] = None) -> datetime:
+        """Thời điểm chạy kế tiếp: mốc lịch gần nhất, hoặc sớm hơn nếu đang trong phiên"""
+        now = now or datetime.now()
+        candidates = [now + timedelta(seconds=MAX_SLEEP_SECONDS)]
+        slot = self._next_slot(now)
+        if slot is not None:
+            candidates.append(slot)
+        if self.policy.state(now) != FROZEN:
+            candidates.append(now + timedelta(seconds=self.refresh_interval))
+        return min(candidates)
+
+    async def run_jobs(self, live_only: bool = False, reason: str = "schedule"):
+        jobs = [job for job in self.jobs if job.live or not live_only]
+        started = timer.time()
+        for job in jobs:
+            await job.run()
+        duration = timer.time() - started
+        self.last_cycle = {"reason": reason, "jobs": len(jobs),
+                           "started": datetime.fromtimestamp(started).isoformat(),
+                           "duration": round(duration, 3)}
+        if live_only:
+            # Làm mới live chạy mỗi phút trong phiên, chỉ ghi mẫu
+            log.info("warmup.cycle", sample=0.1, reason=reason, jobs=len(jobs), seconds=round(duration, 3))
+        else:
+            log.info("warmup.cycle", reason=reason, jobs=len(jobs), seconds=round(duration, 3))
+
+    async def _loop(self):
+        if WARMUP_ON_START and self.lock.acquire():
+            await self.run_jobs(reason="startup")
+        while True:
+            now = datetime.now()
+            run_at = self.next_run(now)
+            await asyncio.sleep(max(0.0, (run_at - now).total_seconds()))
+            if not self.lock.acquire():
+                # Process khác đang làm nóng cache
+                continue
+            try:
+                slot = self._next_slot(now)
+                if slot is not None and slot <= datetime.now():
+                    await self.run_jobs(reason=f"slot {slot:%H:%M}")
+                elif self.policy.state() != FROZEN:
+                    await self.run_jobs(live_only=True, reason="live refresh")
+            except Exception:
+                log.exception("warmup.loop_failed")
+
+    def start(self):
+        if not WARMUP_ENABLED:
+            print("Cache warm-up disabled (WARMUP_ENABLED=false)")
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.lock.release()
+
+    def stats(self) -> Dict[str, Any]:
+        now = datetime.now()
+        return {
+            "enabled": WARMUP_ENABLED,
+            "running": self._task is not None and not self._task.done(),
+            "leader": self.lock.held,
+            "next_run": self.next_run(now).isoformat(),
+            "last_cycle": self.last_cycle,
+            "jobs": {job.name: job.stats() for job in self.jobs},
+        }
@@ -6,12 +6,14 @@ from pathlib import Path
 root_dir = str(Path(__file__).parent)
 sys.path.insert(0, root_dir)
 
-from fastapi import FastAPI
+import time
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware  # Import CORS middleware
-from app.api.v1.Chatbot.main import initialize_bot, flask_app, run_flask
-import threading
-import uvicorn
 from dotenv import load_dotenv
+from app.roles import use_webhook, webhook_in_api
+from app.core.metrics import metrics, request_trace, server_timing, server_timing_allowed
+from app.core.log import setup_logging
 
 # Import MongoDB class for database connection
 from app.database.mongodb import MongoDB
@@ -29,11 +31,13 @@ from app.api.v2.MarketIndices.router import router as market_router_v2
 from app.api.v2.treemap.router import router as treemap_router_v2
 from app.api.v2.treemap_color.router import router as treemap_color_router_v2
 from app.api.v2.marketindices_adjustday.router import router as marketindices_adjustday_router_v2
-from app.api.v2.news.router import router as news_router_v2
+from app.api.v2.news.router import router as news_router_v2, news_ingestor as news_ingestor_v2
 from app.api.v2.report.router import router as report_router_v2
+from app.api.v2.warmup import cache_warmer
 
 # Load environment variables
 load_dotenv()
+setup_logging()
 
 # Create FastAPI app
 app = FastAPI(title="ChatBot Finance Backend")
@@ -53,8 +57,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize telegram bot and get app instances
-telegram_app, flask_app = initialize_bot()
+@app.middleware("http")
+async def timing_middleware(request: Request, call_next):
+    # Các bước được đo bằng app.core.metrics trong request được trả về qua header Server-Timing
+    # (chỉ cho client được phép, xem server_timing_allowed)
+    with request_trace() as trace:
+        started = time.perf_counter()
+        response = await call_next(request)
+        duration = time.perf_counter() - started
+    if server_timing_allowed(request.headers):
+        # Header gửi trước body: với response stream, "total" là thời gian tới lúc gửi header
+        response.headers["Server-Timing"] = server_timing(trace, total=duration)
+
+    body_iterator = response.body_iterator
+
+    async def observed_body():
+        # Thời gian request được ghi khi đã gửi xong body (kể cả response stream như file PDF)
+        try:
+            async for chunk in body_iterator:
+                yield chunk
+        finally:
+            route = request.scope.get("route")
+            metrics.observe("http_request_duration_seconds", time.perf_counter() - started,
+                            method=request.method, route=getattr(route, "path", "unmatched"),
+                            status=response.status_code)
+
+    response.body_iterator = observed_body()
+    return response
 
 # Include routers
 app.include_router(market_router, prefix="/api/v1/market", tags=["Market Indices"])
@@ -76,9 +105,26 @@ app.include_router(report_router_v2, prefix="/api/v2", tags=["Financial Reports"
 async def startup_db_client():
     await MongoDB.connect()
     print("✅ Connected to MongoDB database")
+    news_ingestor_v2.start()
+    cache_warmer.start()
+    if webhook_in_api():
+        # Bot (telegram, Gemini, matplotlib) chỉ được nạp khi chạy ở chế độ webhook
+        from app.api.v2.Chatbot import main as chatbot
+        chatbot.initialize_bot()
+        # Telegram gửi update tới /webhook
+        app.include_router(chatbot.webhook_router, tags=["Telegram"])
+        await chatbot.start_webhook()
+    elif use_webhook():
+        # Nhiều worker: bot chạy ở role bot (một process), xem app/roles.py
+        print("ℹ️ USE_WEBHOOK=true with WEB_CONCURRENCY>1: Telegram webhook is served by the bot role")
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    if webhook_in_api():
+        from app.api.v2.Chatbot.main import stop_webhook
+        await stop_webhook()
+    await cache_warmer.stop()
+    await news_ingestor_v2.stop()
     await MongoDB.close()
     print("✅ Closed MongoDB database connection")
 
@@ -86,29 +132,27 @@ async def shutdown_db_client():
 def read_root():
     return {"status": "ok", "message": "ChatBot Finance Backend is running"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    # Định dạng text của Prometheus; mỗi API worker có số liệu riêng
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/upstream")
+def upstream_status():
+    # Rate limit, circuit breaker và số lần bị throttle của từng nguồn dữ liệu (VCI, TCBS...)
+    from app.core.upstream import upstream_governor
+    return upstream_governor.stats()
+
+@app.get("/warmup")
+def warmup_status():
+    # Lịch làm nóng cache và thời gian chạy của từng job
+    return cache_warmer.stats()
+
 @app.get("/chatbot")
 def chatbot_status():
     return {"status": "ok", "message": "Telegram Bot is running"}
 
-def start_telegram_bot():
-    """Start the Telegram bot in a separate thread"""
-    print("🚀 Khởi động Telegram Bot...")
-    telegram_app.run_polling()
-
 if __name__ == "__main__":
-    # Check if webhook mode is enabled
-    use_webhook = os.getenv("USE_WEBHOOK", "False").lower() == "true"
-    
-    # Start Telegram bot in a separate thread
-    bot_thread = threading.Thread(target=start_telegram_bot, daemon=True)
-    bot_thread.start()
-    
-    # Start webhook server if needed
-    if use_webhook:
-        webhook_thread = threading.Thread(target=run_flask, daemon=True)
-        webhook_thread.start()
-    
-    # Start the FastAPI application
-    port = int(os.getenv("PORT", 8000))
-    print(f"✅ Starting FastAPI server on port {port}...")
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    # Chạy theo APP_ROLE (mặc định: API + bot trong cùng process), xem app/roles.py
+    from app.roles import main
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Điểm khởi động theo role, mỗi role chỉ import phần nó cần:
+
+    python -m app.roles api             # FastAPI (WEB_CONCURRENCY worker), nhận cả webhook Telegram khi USE_WEBHOOK=true và chỉ có 1 worker
+    python -m app.roles bot             # Telegram bot (chỉ một process): polling, hoặc server webhook riêng trên BOT_PORT khi USE_WEBHOOK=true
+    python -m app.roles report-worker   # Tạo báo cáo PDF từ hàng đợi (API cần USE_REPORT_WORKER=true)
+    python -m app.roles all             # Cách chạy cũ: API + bot polling trong cùng một process
+
+Không truyền role thì dùng biến môi trường APP_ROLE (mặc định: all).
+Bot luôn chạy trong đúng một process: trạng thái hội thoại (phiên tra cứu, context.user_data, lịch sử đồ thị,
+cache ảnh đồ thị) nằm trong bộ nhớ, update của một chat rơi vào worker khác sẽ làm hỏng các bước nhiều lượt.
+Vì vậy với USE_WEBHOOK=true và WEB_CONCURRENCY>1, API không nhận webhook; chạy role bot và trỏ WEBHOOK_URL tới nó.
+Dữ liệu dùng chung giữa các role: cache giá (REDIS_URL), báo cáo và hàng đợi job (thư mục reports/),
+lịch sử hội thoại (app/api/v2/Chatbot/conversation_history/).
+"""
+import threading
+import asyncio
+import sys
+import os
+
+ROLES = ("api", "bot", "report-worker", "all")
+
+def use_webhook():
+    return os.getenv("USE_WEBHOOK", "False").lower() == "true"
+
+def api_workers():
+    return int(os.getenv("WEB_CONCURRENCY", 1))
+
+def webhook_in_api():
+    """Webhook chỉ được phục vụ trong API khi API chạy một worker (trạng thái bot nằm trong bộ nhớ process)"""
+    return use_webhook() and api_workers() == 1
+
+def run_api():
+    import uvicorn
+
+    port = int(os.getenv("PORT", 8000))
+    workers = api_workers()
+    print(f"✅ Starting FastAPI server on port {port} ({workers} workers)...")
+    uvicorn.run("app.main:app", host="0.0.0.0", port=port, workers=workers)
+
+def start_telegram_bot():
+    """Chạy bot polling trong thread hiện tại (thread phụ cần event loop riêng, không đăng ký signal)"""
+    from app.api.v2.Chatbot.main import initialize_bot
+
+    print("🚀 Khởi động Telegram Bot...")
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    telegram_app = initialize_bot()
+    in_main_thread = threading.current_thread() is threading.main_thread()
+    telegram_app.run_polling(**({} if in_main_thread else {"stop_signals": None}))
+
+def run_webhook_server():
+    """Server webhook một process cho bot, tách khỏi API nhiều worker"""
+    import uvicorn
+    from app.api.v2.Chatbot.main import create_webhook_app
+
+    port = int(os.getenv("BOT_PORT", 8001))
+    print(f"✅ Starting Telegram webhook server on port {port} (1 process)...")
+    uvicorn.run(create_webhook_app(), host="0.0.0.0", port=port, workers=1)
+
+def run_bot():
+    if webhook_in_api():
+        # Polling sẽ xoá webhook đã đăng ký; với một API worker, webhook chạy trong API
+        print("❌ USE_WEBHOOK=true and WEB_CONCURRENCY=1: Telegram updates are handled by the api role")
+        return 1
+    if use_webhook():
+        run_webhook_server()
+        return 0
+    start_telegram_bot()
+    return 0
+
+def run_report_worker():
+    from app.api.v2.report.jobs import run_report_worker as start_worker
+
+    start_worker()
+    return 0
+
+def run_all():
+    if use_webhook() and not webhook_in_api():
+        print("❌ USE_WEBHOOK=true with WEB_CONCURRENCY>1: run the api and bot roles separately")
+        return 1
+    if not use_webhook():
+        threading.Thread(target=start_telegram_bot, daemon=True).start()
+    run_api()
+    return 0
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    role = (argv[0] if argv else os.getenv("APP_ROLE", "all")).lower()
+    if role not in ROLES:
+        print(f"Unknown role {role!r}, expected one of: {', '.join(ROLES)}")
+        return 2
+
+    from app.core.log import setup_logging
+
+    setup_logging()
+    print(f"🚀 Starting role: {role}")
+    if role == "api":
+        run_api()
+        return 0
+    if role == "bot":
+        return run_bot()
+    if role == "report-worker":
+        return run_report_worker()
+    return run_all()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+from datetime import date, datetime
+
+import pytest
+
+from app.core.cache_policy import MarketCachePolicy, LIVE, SETTLING, FROZEN
+from app.core.trading_calendar import TradingCalendar
+
+HOLIDAYS = [date(2025, 1, 27), date(2025, 1, 28), date(2025, 1, 29), date(2025, 1, 30), date(2025, 1, 31)]
+
+@pytest.fixture
+def policy():
+    calendar = TradingCalendar(HOLIDAYS, years=[2025])
+    return MarketCachePolicy(calendar, live_ttl=60, settle_minutes=15)
+
+def test_before_warmup_expires_at_0859(policy):
+    now = datetime(2025, 3, 4, 8, 50)
+    assert policy.state(now) == FROZEN
+    assert policy.ttl(now) == 9 * 60
+    assert policy.expires_at(now) == datetime(2025, 3, 4, 8, 59)
+    # Sát 8:59 thì vẫn giữ tối thiểu live_ttl
+    assert policy.ttl(datetime(2025, 3, 4, 8, 58, 30)) == 60
+
+def test_live_from_0859_to_close(policy):
+    assert policy.state(datetime(2025, 3, 4, 8, 59)) == LIVE
+    assert policy.ttl(datetime(2025, 3, 4, 8, 59)) == 60
+    assert policy.state(datetime(2025, 3, 4, 11, 45)) == LIVE
+    assert policy.state(datetime(2025, 3, 4, 15, 0)) == LIVE
+
+def test_settling_until_1515(policy):
+    assert policy.state(datetime(2025, 3, 4, 15, 0, 1)) == SETTLING
+    assert policy.ttl(datetime(2025, 3, 4, 15, 0, 1)) == 60
+    assert policy.state(datetime(2025, 3, 4, 15, 15)) == SETTLING
+
+def test_frozen_after_settle_until_next_session(policy):
+    now = datetime(2025, 3, 4, 15, 15, 1)
+    assert policy.state(now) == FROZEN
+    assert policy.expires_at(now) == datetime(2025, 3, 5, 8, 59)
+    # Thứ sáu -> 8:59 thứ hai
+    assert policy.expires_at(datetime(2025, 3, 7, 15, 16)) == datetime(2025, 3, 10, 8, 59)
+    # Phiên cuối trước Tết -> phiên đầu sau Tết
+    assert policy.expires_at(datetime(2025, 1, 24, 16, 0)) == datetime(2025, 2, 3, 8, 59)
+
+def test_holiday_and_past_sessions_are_frozen(policy):
+    assert policy.state(datetime(2025, 1, 29, 10, 0)) == FROZEN
+    assert policy.expires_at(datetime(2025, 1, 29, 10, 0)) == datetime(2025, 2, 3, 8, 59)
+    now = datetime(2025, 3, 4, 10, 0)
+    assert policy.state(now, session_day=date(2025, 3, 3)) == FROZEN
+    assert policy.expires_at(now, session_day=date(2025, 3, 3)) == datetime(2025, 3, 5, 8, 59)
+    assert policy.state(now, session_day=date(2025, 3, 4)) == LIVE
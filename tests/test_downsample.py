@@ -0,0 +1,42 @@
+import numpy as np
+
+from app.api.v2.marketindices_adjustday.downsample import downsample, lttb_indices, minmax_indices
+
+def _series(n=1000, seed=7):
+    rng = np.random.default_rng(seed)
+    x = np.arange(n, dtype=np.float64)
+    y = 1000 + np.cumsum(rng.normal(0, 5, n))
+    return x, y
+
+def test_lttb_keeps_endpoints():
+    x, y = _series()
+    for n_out in (3, 50, 300, 999):
+        idx = lttb_indices(x, y, n_out)
+        assert len(idx) == n_out
+        assert idx[0] == 0
+        assert idx[-1] == len(x) - 1
+        assert np.all(np.diff(idx) > 0)
+
+def test_lttb_keeps_spike():
+    x, y = _series()
+    y[537] += 500
+    idx = lttb_indices(x, y, 100)
+    assert 537 in idx
+
+def test_lttb_returns_all_points_when_nothing_to_drop():
+    x, y = _series(n=40)
+    assert np.array_equal(lttb_indices(x, y, 40), np.arange(40))
+    assert np.array_equal(lttb_indices(x, y, 100), np.arange(40))
+    assert np.array_equal(lttb_indices(x, y, 2), np.arange(40))
+
+def test_minmax_keeps_extremes():
+    x, y = _series()
+    idx = minmax_indices(y, 100)
+    assert len(idx) <= 100
+    assert int(np.argmin(y)) in idx
+    assert int(np.argmax(y)) in idx
+
+def test_downsample_dispatches_by_method():
+    x, y = _series()
+    assert np.array_equal(downsample(x, y, 100), lttb_indices(x, y, 100))
+    assert np.array_equal(downsample(x, y, 100, method="minmax"), minmax_indices(y, 100))
@@ -0,0 +1,24 @@
+import pytest
+
+from app.core import import_benchmark
+
+def test_app_main_imports_within_budget(capsys):
+    """Import app.main (process mới) phải nằm trong IMPORT_TIME_BUDGET và không nạp module nặng"""
+    try:
+        exit_code = import_benchmark.main([])
+    except RuntimeError as e:
+        # Thiếu thư viện của ứng dụng (môi trường chưa cài requirements.txt) thì không đo được
+        if "ModuleNotFoundError" not in str(e):
+            raise
+        pytest.skip(str(e).strip().splitlines()[-1])
+    assert exit_code == 0, capsys.readouterr().out
+
+def test_slowest_imports_reads_top_level_packages():
+    log = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   pandas._libs",
+        "import time:       300 |     450000 | pandas",
+        "import time:        50 |      20000 | fastapi",
+        "import time:        10 |         10 | app.core.log",
+    ])
+    assert import_benchmark._slowest_imports(log) == [(0.45, "pandas"), (0.02, "fastapi")]
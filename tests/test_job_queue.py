@@ -0,0 +1,122 @@
+from concurrent.futures import ThreadPoolExecutor
+import time
+import os
+
+from app.core.job_queue import FileJobQueue, PENDING, RUNNING, DONE, FAILED
+
+def _age(queue, state, job_id, seconds):
+    """Lùi mtime của file job để giả lập job đã nằm lâu ở trạng thái đó"""
+    old = time.time() - seconds
+    os.utime(queue._path(state, job_id), (old, old))
+
+def test_submit_claim_complete(tmp_path):
+    queue = FileJobQueue(str(tmp_path))
+    job_id = queue.submit("pdf", {"symbol": "FPT"})
+    assert queue.get(job_id)["state"] == PENDING
+
+    job = queue.claim()
+    assert job["id"] == job_id and job["payload"] == {"symbol": "FPT"}
+    assert queue.get(job_id)["state"] == RUNNING
+    assert queue.claim() is None
+
+    queue.complete(job_id, {"path": "FPT.pdf"})
+    done = queue.get(job_id)
+    assert done["state"] == DONE and done["result"] == {"path": "FPT.pdf"}
+
+def test_submit_does_not_duplicate_active_job(tmp_path):
+    queue = FileJobQueue(str(tmp_path))
+    assert queue.submit("pdf", {}, job_id="FPT") == "FPT"
+    queue.submit("pdf", {}, job_id="FPT")
+    assert len(os.listdir(tmp_path / PENDING)) == 1
+
+    queue.claim()
+    queue.fail("FPT", "boom")
+    assert queue.get("FPT")["state"] == FAILED
+    queue.submit("pdf", {}, job_id="FPT")
+    assert queue.get("FPT")["state"] == PENDING
+
+def test_concurrent_claims_hand_out_each_job_once(tmp_path):
+    queue = FileJobQueue(str(tmp_path))
+    job_ids = {queue.submit("pdf", {"n": n}) for n in range(20)}
+    workers = [FileJobQueue(str(tmp_path)) for _ in range(8)]
+
+    def drain(worker):
+        claimed = []
+        while True:
+            job = worker.claim()
+            if job is None:
+                return claimed
+            claimed.append(job["id"])
+
+    with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+        results = list(executor.map(drain, workers))
+    claimed = [job_id for result in results for job_id in result]
+    assert sorted(claimed) == sorted(job_ids)
+
+def test_stale_running_job_is_requeued(tmp_path):
+    queue = FileJobQueue(str(tmp_path), stale_after=60)
+    job_id = queue.submit("pdf", {})
+    queue.claim()
+    _age(queue, RUNNING, job_id, 120)  # Worker chết giữa chừng
+
+    job = FileJobQueue(str(tmp_path), stale_after=60).claim()
+    assert job["id"] == job_id
+    assert queue.get(job_id)["state"] == RUNNING
+
+def test_claim_of_long_pending_job_is_not_requeued(tmp_path):
+    """
+    Job chờ lâu hơn stale_after trong pending: ngay sau khi worker A rename sang running,
+    worker B quét job treo không được coi job này là treo và nhận lại lần nữa.
+    """
+    stale_after = 60
+    queue = FileJobQueue(str(tmp_path), stale_after=stale_after)
+    job_id = queue.submit("pdf", {})
+    _age(queue, PENDING, job_id, stale_after * 2)
+    other_worker = FileJobQueue(str(tmp_path), stale_after=stale_after)
+
+    class RacingQueue(FileJobQueue):
+        def _read(self, file_path):
+            # Worker B chạy chen vào giữa rename và lần ghi started_at của worker A
+            if os.path.dirname(file_path).endswith(RUNNING):
+                assert other_worker.claim() is None
+            return super()._read(file_path)
+
+    job = RacingQueue(str(tmp_path), stale_after=stale_after).claim()
+    assert job["id"] == job_id
+    assert queue.get(job_id)["state"] == RUNNING
+    assert os.listdir(tmp_path / PENDING) == []
+
+def test_resubmit_keeps_previous_result_until_replaced(tmp_path):
+    queue = FileJobQueue(str(tmp_path))
+    queue.submit("pdf", {}, job_id="FPT")
+    queue.claim()
+    queue.complete("FPT", {"path": "old.pdf"})
+
+    queue.submit("pdf", {}, job_id="FPT")
+    assert queue.get("FPT")["state"] == PENDING
+    # Kết quả cũ vẫn còn cho client đang đọc
+    assert os.path.exists(queue._path(DONE, "FPT"))
+
+    queue.claim()
+    queue.fail("FPT", "boom")
+    assert queue.get("FPT")["state"] == FAILED
+    assert not os.path.exists(queue._path(DONE, "FPT"))
+
+    queue.submit("pdf", {}, job_id="FPT")
+    queue.claim()
+    queue.complete("FPT", {"path": "new.pdf"})
+    assert queue.get("FPT")["result"] == {"path": "new.pdf"}
+    assert not os.path.exists(queue._path(FAILED, "FPT"))
+
+def test_heartbeat_keeps_long_job_from_being_requeued(tmp_path):
+    queue = FileJobQueue(str(tmp_path), stale_after=0.4)
+    job_id = queue.submit("pdf", {})
+    queue.claim()
+    other_worker = FileJobQueue(str(tmp_path), stale_after=0.4)
+    with queue.keep_alive(job_id, interval=0.05):
+        for _ in range(8):
+            time.sleep(0.1)
+            assert other_worker.claim() is None
+    assert queue.get(job_id)["state"] == RUNNING
+    time.sleep(0.5)
+    assert other_worker.claim()["id"] == job_id
@@ -0,0 +1,78 @@
+from datetime import datetime, timezone
+import asyncio
+
+import pytest
+
+from app.api.v2.news import store
+from app.api.v2.news.store import NewsIngestor, parse_publish_date
+
+class FakeNewsService:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    def fetch_news(self, symbol, limit):
+        self.calls.append(symbol)
+        if symbol in self.failing:
+            raise ConnectionError("TCBS unavailable")
+        return [{"symbol": symbol, "title": f"{symbol} news", "publish_date": "2025-03-04 09:15:00"}]
+
+    def get_top_symbols_from_cache(self, limit):
+        return []
+
+@pytest.fixture(autouse=True)
+def memory_store(monkeypatch):
+    memory = store.MemoryNewsStore()
+    monkeypatch.setattr(store, "get_news_store", lambda: memory)
+    return memory
+
+def test_publish_date_is_vietnam_time():
+    expected = datetime(2025, 3, 4, 2, 15, tzinfo=timezone.utc).timestamp()
+    assert parse_publish_date("2025-03-04 09:15:00") == expected
+    assert parse_publish_date(datetime(2025, 3, 4, 9, 15)) == expected
+    assert parse_publish_date("2025-03-04") == datetime(2025, 3, 3, 17, 0, tzinfo=timezone.utc).timestamp()
+    assert parse_publish_date("not a date") is None
+
+def test_tracked_symbols_are_bounded_lru():
+    ingestor = NewsIngestor(FakeNewsService(), max_tracked=3)
+    ingestor.track("AAA", "BBB", "CCC")
+    ingestor.track("AAA")
+    ingestor.track("DDD")
+    assert list(ingestor.tracked_symbols) == ["CCC", "AAA", "DDD"]
+
+def test_idle_symbols_are_not_polled(monkeypatch):
+    service = FakeNewsService()
+    ingestor = NewsIngestor(service, track_ttl=60)
+    ingestor.track("FPT", "VNM")
+    ingestor.tracked_symbols["VNM"] -= 120
+    asyncio.run(ingestor.poll_once())
+    assert service.calls == ["FPT"]
+    assert list(ingestor.tracked_symbols) == ["FPT"]
+
+def test_failures_back_off_and_are_dropped():
+    service = FakeNewsService(failing={"XYZ"})
+    ingestor = NewsIngestor(service, interval=300, max_failures=3)
+    ingestor.track("XYZ")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(ingestor.ingest_symbol("XYZ"))
+    # Đang chờ thử lại: request tiếp theo không gọi TCBS nữa
+    assert ingestor.is_fresh("XYZ")
+    asyncio.run(ingestor.poll_once())
+    assert service.calls == ["XYZ"]
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            asyncio.run(ingestor.ingest_symbol("XYZ"))
+    assert "XYZ" not in ingestor.tracked_symbols
+    assert ingestor.is_fresh("XYZ")
+
+def test_success_clears_failures():
+    service = FakeNewsService(failing={"FPT"})
+    ingestor = NewsIngestor(service)
+    with pytest.raises(ConnectionError):
+        asyncio.run(ingestor.ingest_symbol("FPT"))
+    service.failing.clear()
+    assert asyncio.run(ingestor.ingest_symbol("FPT")) == 1
+    assert "FPT" not in ingestor.failures
+    assert ingestor.is_fresh("FPT")
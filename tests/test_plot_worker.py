@@ -0,0 +1,37 @@
+import pytest
+
+from app.api.v2.Chatbot.plot_worker import PlotCodeError, check_plot_code, _worker_env
+
+def test_plot_code_allows_matplotlib_numpy_math():
+    check_plot_code(
+        "import matplotlib.pyplot as plt\n"
+        "import numpy as np\n"
+        "from math import pi\n"
+        "x = np.arange(5) * pi\n"
+        "plt.plot(x, [1, 2, 3, 4, 5])\n"
+        "plt.title('VNINDEX')\n"
+    )
+
+@pytest.mark.parametrize("code", [
+    "import os",
+    "import subprocess",
+    "import socket",
+    "import importlib",
+    "from os import path",
+    "from . import gemini_api",
+    "import matplotlib.pyplot as plt\nplt.sys.modules",
+    "x = ().__class__.__mro__",
+    "__import__('os')",
+    "np.load('data.npy')",
+    "plt.savefig('/tmp/x.png')",
+])
+def test_plot_code_rejects_escapes(code):
+    with pytest.raises(PlotCodeError):
+        check_plot_code(code)
+
+def test_worker_env_drops_secrets(monkeypatch):
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "secret")
+    monkeypatch.setenv("GEMINI_API_KEY", "secret")
+    env = _worker_env()
+    assert "TELEGRAM_BOT_TOKEN" not in env and "GEMINI_API_KEY" not in env
+    assert env["MPLBACKEND"] == "Agg"
@@ -0,0 +1,19 @@
+import time
+
+from app.core.shared_cache import MemoryCache
+
+def test_memory_cache_is_bounded_lru():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+def test_memory_cache_sweeps_expired_keys_without_reads():
+    cache = MemoryCache(sweep_interval=0.05)
+    cache.set("old", 1, ttl=0.01)
+    time.sleep(0.1)
+    cache.set("new", 2, ttl=60)
+    assert list(cache._entries) == ["new"]
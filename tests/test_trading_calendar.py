@@ -0,0 +1,105 @@
+from datetime import date, datetime, timedelta
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+from app.core.trading_calendar import (
+    TradingCalendar, trading_calendar, OPEN, PRE_OPEN, CLOSED, NON_TRADING,
+)
+
+# Tết 2025 (27-31/01), Giỗ Tổ, 30/4-1/5, Quốc khánh và Tết dương lịch 2026
+HOLIDAYS = [
+    date(2025, 1, 1), date(2025, 1, 27), date(2025, 1, 28), date(2025, 1, 29), date(2025, 1, 30),
+    date(2025, 1, 31), date(2025, 4, 7), date(2025, 4, 30), date(2025, 5, 1), date(2025, 9, 1),
+    date(2025, 9, 2), date(2026, 1, 1),
+]
+
+@pytest.fixture
+def calendar():
+    return TradingCalendar(HOLIDAYS, years=[2025, 2026])
+
+def _naive_sessions(start, end):
+    """Các phiên trong [start, end] tính từng ngày, dùng để đối chiếu với bản bisect"""
+    days = []
+    current = start
+    while current <= end:
+        if current.weekday() < 5 and current not in HOLIDAYS:
+            days.append(current)
+        current += timedelta(days=1)
+    return days
+
+def test_holidays_and_weekends_are_not_sessions(calendar):
+    assert calendar.is_holiday(date(2025, 1, 29))
+    assert not calendar.is_trading_day(date(2025, 1, 29))
+    assert not calendar.is_trading_day(date(2025, 2, 1))  # Thứ bảy
+    assert calendar.is_trading_day(datetime(2025, 2, 3, 10, 30))
+
+def test_previous_and_next_session_around_tet(calendar):
+    assert calendar.previous_session(date(2025, 2, 3)) == date(2025, 1, 24)
+    assert calendar.next_session(date(2025, 1, 24)) == date(2025, 2, 3)
+    assert calendar.previous_session(date(2025, 1, 29), inclusive=True) == date(2025, 1, 24)
+    assert calendar.next_session(date(2025, 1, 29), inclusive=True) == date(2025, 2, 3)
+    assert calendar.previous_session(date(2025, 1, 24), inclusive=True) == date(2025, 1, 24)
+    assert calendar.next_session(date(2025, 2, 3), inclusive=True) == date(2025, 2, 3)
+
+def test_sessions_across_year_boundaries(calendar):
+    # 01/01/2025 nghỉ lễ, phiên trước đó thuộc năm chưa nạp (tính theo thứ trong tuần)
+    assert calendar.previous_session(date(2025, 1, 2)) == date(2024, 12, 31)
+    assert calendar.next_session(date(2024, 12, 31)) == date(2025, 1, 2)
+    assert calendar.next_session(date(2025, 12, 31)) == date(2026, 1, 2)
+    assert calendar.previous_session(date(2026, 1, 2)) == date(2025, 12, 31)
+    # Sau năm cuối cùng đã nạp
+    assert calendar.next_session(date(2026, 12, 31)) == date(2027, 1, 1)
+
+def test_shift_sessions(calendar):
+    assert calendar.shift_sessions(date(2025, 1, 24), 1) == date(2025, 2, 3)
+    assert calendar.shift_sessions(date(2025, 2, 3), -1) == date(2025, 1, 24)
+    # Ngày nghỉ được neo về phiên gần nhất trước đó
+    assert calendar.shift_sessions(date(2025, 1, 29), 0) == date(2025, 1, 24)
+    assert calendar.shift_sessions(date(2025, 12, 31), 1) == date(2026, 1, 2)
+    assert calendar.shift_sessions(date(2026, 1, 2), -1) == date(2025, 12, 31)
+    # Vượt ra ngoài các năm đã nạp
+    assert calendar.shift_sessions(date(2025, 1, 2), -1) == date(2024, 12, 31)
+    assert calendar.shift_sessions(date(2026, 12, 30), 2) == date(2027, 1, 1)
+
+def test_count_sessions(calendar):
+    assert calendar.count_sessions(date(2025, 1, 24), date(2025, 2, 3)) == 2
+    assert calendar.count_sessions(date(2025, 12, 31), date(2026, 1, 2)) == 2
+    assert calendar.count_sessions(date(2024, 12, 30), date(2025, 1, 3)) == 4
+    assert calendar.count_sessions(date(2025, 2, 3), date(2025, 1, 24)) == 0
+
+def test_bisect_matches_day_by_day_walk(calendar):
+    start, end = date(2024, 12, 20), date(2027, 1, 10)
+    sessions = _naive_sessions(start, end)
+    assert calendar.count_sessions(start, end) == len(sessions)
+    for previous, current in zip(sessions, sessions[1:]):
+        assert calendar.next_session(previous) == current
+        assert calendar.previous_session(current) == previous
+        assert calendar.shift_sessions(previous, 1) == current
+        assert calendar.shift_sessions(current, -1) == previous
+
+def test_session_state_and_display_window(calendar):
+    assert calendar.session_state(datetime(2025, 2, 3, 8, 30)) == PRE_OPEN
+    assert calendar.session_state(datetime(2025, 2, 3, 10, 0)) == OPEN
+    assert calendar.session_state(datetime(2025, 2, 3, 15, 30)) == CLOSED
+    assert calendar.session_state(datetime(2025, 1, 29, 10, 0)) == NON_TRADING
+
+    start, end, state = calendar.display_window(datetime(2025, 1, 29, 10, 0))
+    assert state == NON_TRADING
+    assert (start, end) == (datetime(2025, 1, 24, 9, 0), datetime(2025, 1, 24, 15, 0))
+
+    start, end, state = calendar.display_window(datetime(2025, 2, 3, 10, 0))
+    assert state == OPEN
+    assert (start, end) == (datetime(2025, 2, 3, 8, 59), datetime(2025, 2, 3, 10, 0))
+
+def test_shared_calendar_is_loaded_on_first_use():
+    # Process mới: import cache_policy (tham số mặc định là lịch dùng chung) chưa được đọc holiday.json
+    code = ("from app.core import cache_policy, trading_calendar as module; "
+            "assert not module.trading_calendar.is_ready")
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1])
+
+def test_shared_calendar_loads_holiday_file():
+    assert trading_calendar.is_holiday(date(2025, 1, 1))
+    assert trading_calendar.next_session(date(2025, 1, 24)) == date(2025, 2, 3)
@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from app.core.upstream import UpstreamSource, is_upstream_error
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+class FakeHTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.response = FakeResponse(status_code)
+
+@pytest.mark.parametrize("error, expected", [
+    (ConnectionError("reset"), True),
+    (TimeoutError(), True),
+    (FakeHTTPError(503), True),
+    (FakeHTTPError(429), True),
+    (FakeHTTPError(404), False),
+    # Message chứa "500"/"connection" nhưng là lỗi dữ liệu
+    (ValueError("Giá đóng cửa 500 không hợp lệ"), False),
+    (KeyError("connection"), False),
+    (Exception("Read timed out"), False),
+])
+def test_upstream_error_is_classified_by_type_and_status(error, expected):
+    assert is_upstream_error(error) is expected
+
+def test_last_good_is_copied():
+    source = UpstreamSource("TEST")
+    df = source.call(lambda: pd.DataFrame({"close": [1.0, 2.0]}), key="FPT")
+    df["close"] *= 100  # Caller sửa kết quả trả về
+
+    def down():
+        raise ConnectionError("down")
+
+    stale = source.call(down, key="FPT")
+    assert stale["close"].tolist() == [1.0, 2.0]
+    stale.drop(columns="close", inplace=True)
+    assert source.call(down, key="FPT")["close"].tolist() == [1.0, 2.0]